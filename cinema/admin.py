@@ -8,6 +8,8 @@ from .models import (
     MovieSession,
     Order,
     Ticket,
+    SeatHold,
+    OccupancySummary,
 )
 
 admin.site.register(CinemaHall)
@@ -17,3 +19,5 @@ admin.site.register(Movie)
 admin.site.register(MovieSession)
 admin.site.register(Order)
 admin.site.register(Ticket)
+admin.site.register(SeatHold)
+admin.site.register(OccupancySummary)
@@ -0,0 +1,193 @@
+from abc import ABC, abstractmethod
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+from cinema.fast_lists import (
+    movie_list_items,
+    movie_list_values,
+    movie_names_querysets,
+    movie_session_list_item,
+    movie_session_list_values,
+    movies_without_document,
+    names_by_movie,
+)
+from cinema.fieldsets import EXPAND_PARAM, FIELDS_PARAM
+from cinema.models import Actor, Genre
+from cinema.renderers import ORJSONRenderer
+from cinema.serializers import (
+    ActorSerializer,
+    GenreSerializer,
+    MovieDetailSerializer,
+    MovieListSerializer,
+    MovieSessionDetailSerializer,
+    MovieSessionListSerializer,
+)
+from cinema.views import (
+    movie_detail_queryset,
+    movie_list_queryset,
+    movie_session_detail_queryset,
+    movie_session_list_queryset,
+    seat_format_param,
+)
+
+
+class AsyncReadView(View, ABC):
+    """Read-only list and retrieve handlers on Django's async ORM.
+
+    Lists are streamed with ``aiterator`` and detail rows fetched with
+    ``aget``, so under ASGI a slow read does not hold a worker thread.
+    Querysets, serializers and the ``values()`` list builders are shared
+    with the synchronous viewsets, which keeps both paths returning the
+    same JSON.
+
+    This is a JSON-only read path beside DRF, not a copy of it: there is
+    no content negotiation, authentication or permission check, and no
+    ``?fields=``/``?expand=``. It only serves catalogue data the
+    viewsets also show to anonymous users. Requests that need anything
+    else are refused rather than answered with a different payload.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    list_serializer_class = None
+    detail_serializer_class = None
+    renderer = ORJSONRenderer()
+
+    @abstractmethod
+    async def get_list_queryset(self, query_params):
+        """Queryset of the list, filtered by ``query_params``."""
+
+    @abstractmethod
+    def get_detail_queryset(self):
+        """Queryset the detail row is fetched from."""
+
+    def get_detail_context(self, query_params) -> dict:
+        return {}
+
+    async def list_data(self, queryset) -> list:
+        instances = [instance async for instance in queryset.aiterator()]
+        return self.list_serializer_class(instances, many=True).data
+
+    def render(self, data, status_code: int = status.HTTP_200_OK):
+        return HttpResponse(
+            self.renderer.render(data),
+            content_type="application/json",
+            status=status_code,
+        )
+
+    async def get(self, request, pk=None):
+        if not request.accepts(self.renderer.media_type):
+            return self.render(
+                {"detail": "This endpoint only renders JSON."},
+                status.HTTP_406_NOT_ACCEPTABLE,
+            )
+        unsupported = {FIELDS_PARAM, EXPAND_PARAM} & set(request.GET)
+        if unsupported:
+            return self.render(
+                {
+                    name: ["Not supported here, use the DRF endpoint."]
+                    for name in sorted(unsupported)
+                },
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        if pk is None:
+            try:
+                queryset = await self.get_list_queryset(request.GET)
+            except ValidationError as error:
+                return self.render(error.detail, status.HTTP_400_BAD_REQUEST)
+            return self.render(await self.list_data(queryset))
+
+        try:
+            context = self.get_detail_context(request.GET)
+        except ValidationError as error:
+            return self.render(error.detail, status.HTTP_400_BAD_REQUEST)
+        queryset = self.get_detail_queryset()
+        try:
+            instance = await queryset.aget(pk=pk)
+        except queryset.model.DoesNotExist:
+            return self.render(
+                {"detail": "Not found."}, status.HTTP_404_NOT_FOUND
+            )
+        return self.render(
+            self.detail_serializer_class(instance, context=context).data
+        )
+
+
+class GenreAsyncView(AsyncReadView):
+    list_serializer_class = GenreSerializer
+    detail_serializer_class = GenreSerializer
+
+    async def get_list_queryset(self, query_params):
+        return Genre.objects.all()
+
+    def get_detail_queryset(self):
+        return Genre.objects.all()
+
+
+class ActorAsyncView(AsyncReadView):
+    list_serializer_class = ActorSerializer
+    detail_serializer_class = ActorSerializer
+
+    async def get_list_queryset(self, query_params):
+        return Actor.objects.all()
+
+    def get_detail_queryset(self):
+        return Actor.objects.all()
+
+
+class MovieAsyncView(AsyncReadView):
+    list_serializer_class = MovieListSerializer
+    detail_serializer_class = MovieDetailSerializer
+
+    async def get_list_queryset(self, query_params):
+        if query_params.get("title") or query_params.get("search"):
+            # Full-text filters query the index while building the queryset.
+            return await sync_to_async(movie_list_queryset)(query_params)
+        return movie_list_queryset(query_params)
+
+    def get_detail_queryset(self):
+        return movie_detail_queryset()
+
+    async def list_data(self, queryset) -> list:
+        rows = [row async for row in movie_list_values(queryset).aiterator()]
+        without_document = movies_without_document(rows)
+        genres, actors = {}, {}
+        if without_document:
+            # Movies without a document need follow-up queries for names.
+            # values_list().aiterator() runs its query synchronously in
+            # Django 4.1, so these are fetched with ``async for``.
+            genre_rows, actor_rows = movie_names_querysets(without_document)
+            genres, actors = names_by_movie(
+                [row async for row in genre_rows],
+                [row async for row in actor_rows],
+            )
+        return movie_list_items(rows, genres, actors)
+
+
+class MovieSessionAsyncView(AsyncReadView):
+    list_serializer_class = MovieSessionListSerializer
+    detail_serializer_class = MovieSessionDetailSerializer
+
+    async def get_list_queryset(self, query_params):
+        if {"now_showing", "from", "to"} & set(query_params):
+            # Time filters look up the longest movie to bound the scan.
+            return await sync_to_async(movie_session_list_queryset)(
+                query_params
+            )
+        return movie_session_list_queryset(query_params)
+
+    def get_detail_queryset(self):
+        return movie_session_detail_queryset()
+
+    def get_detail_context(self, query_params) -> dict:
+        return {"seat_format": seat_format_param(query_params)}
+
+    async def list_data(self, queryset) -> list:
+        return [
+            movie_session_list_item(row)
+            async for row in movie_session_list_values(queryset).aiterator()
+        ]
@@ -0,0 +1,106 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from cinema.replicas import reading_from_default
+
+VERSION_KEY_PREFIX = "cinema:version:"
+RESPONSE_KEY_PREFIX = "cinema:response:"
+
+
+def _version_key(model) -> str:
+    return VERSION_KEY_PREFIX + model._meta.label_lower
+
+
+def get_cache_versions(models) -> list:
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seeding from the clock keeps an evicted counter from ever
+            # coming back to a value that older responses were cached at.
+            cache.add(key, time.time_ns())
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _incr_version(model) -> None:
+    try:
+        cache.incr(_version_key(model))
+    except ValueError:
+        cache.set(_version_key(model), time.time_ns())
+
+
+def bump_cache_version(model) -> None:
+    """Invalidate cached responses built from ``model`` rows.
+
+    The version is bumped right away and again on commit, so responses
+    cached by other requests before the transaction finished are
+    dropped as well.
+    """
+    _incr_version(model)
+    transaction.on_commit(lambda: _incr_version(model))
+
+
+class CachedResponseMixin:
+    """Cache ``list`` and ``retrieve`` responses of a catalog viewset.
+
+    Responses are keyed by the versions of ``cache_models``, the full
+    path and the negotiated media type, which also form a strong ETag.
+    A matching ``If-None-Match`` is answered with 304 straight from the
+    version counters.
+    """
+
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_etag(self, request) -> str:
+        key_parts = [
+            *map(str, get_cache_versions(self.cache_models)),
+            request.get_full_path(),
+            request.accepted_media_type or "",
+        ]
+        digest = hashlib.sha256("\n".join(key_parts).encode()).hexdigest()
+        return f'"{digest[:40]}"'
+
+    @staticmethod
+    def _etag_matches(request, etag: str) -> bool:
+        if_none_match = request.headers.get("If-None-Match", "")
+        candidates = {
+            candidate.strip() for candidate in if_none_match.split(",")
+        }
+        return etag in candidates or "*" in candidates
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        etag = self.get_etag(request)
+        if self._etag_matches(request, etag):
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+        cache_key = RESPONSE_KEY_PREFIX + etag.strip('"')
+        data = cache.get(cache_key)
+        if data is None:
+            # The key carries the current versions, so it is filled from
+            # default; a lagging replica would pin stale rows under it.
+            with reading_from_default():
+                response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(cache_key, response.data)
+        else:
+            response = Response(data)
+
+        response["ETag"] = etag
+        return response
@@ -0,0 +1,61 @@
+from typing import Iterable
+
+from django.db import transaction
+
+
+def refresh_movie_documents(movie_ids: Iterable[int]) -> None:
+    """Rebuild the ``MovieDocument`` of every movie in ``movie_ids``."""
+    from cinema.models import Movie, MovieDocument
+
+    movie_ids = set(movie_ids)
+    if not movie_ids:
+        return
+
+    documents = {
+        movie_id: MovieDocument(movie_id=movie_id, genres=[], actors=[])
+        for movie_id in Movie.objects.filter(id__in=movie_ids).values_list(
+            "id", flat=True
+        )
+    }
+    genre_names = (
+        Movie.genres.through.objects.filter(movie_id__in=documents)
+        .order_by("id")
+        .values_list("movie_id", "genre__name")
+    )
+    for movie_id, name in genre_names:
+        documents[movie_id].genres.append(name)
+
+    actor_names = (
+        Movie.actors.through.objects.filter(movie_id__in=documents)
+        .order_by("id")
+        .values_list("movie_id", "actor__first_name", "actor__last_name")
+    )
+    for movie_id, first_name, last_name in actor_names:
+        documents[movie_id].actors.append(f"{first_name} {last_name}")
+
+    with transaction.atomic():
+        MovieDocument.objects.filter(movie_id__in=documents).delete()
+        MovieDocument.objects.bulk_create(documents.values())
+
+
+def refresh_movie_documents_on_commit(movie_ids: Iterable[int]) -> None:
+    """Rebuild the documents of ``movie_ids`` once the transaction commits.
+
+    Ids are collected on the connection until then, so a movie saved
+    and given genres and actors in one transaction is rebuilt once.
+    Outside a transaction the rebuild happens right away.
+    """
+    connection = transaction.get_connection()
+    if not hasattr(connection, "pending_movie_documents"):
+        connection.pending_movie_documents = set()
+    connection.pending_movie_documents.update(movie_ids)
+
+    def refresh():
+        # The first callback to run takes every id and the rest find
+        # nothing left. Ids kept from a rolled back transaction only
+        # rebuild documents from the current rows.
+        pending = connection.pending_movie_documents
+        connection.pending_movie_documents = set()
+        refresh_movie_documents(pending)
+
+    transaction.on_commit(refresh)
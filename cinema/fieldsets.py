@@ -0,0 +1,239 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+EXPAND_PARAM = "expand"
+FIELDSET_ACTIONS = ("list", "retrieve")
+
+
+def parse_fieldset(value):
+    """Turn ``"a,b.c,b.d"`` into ``{"a": {}, "b": {"c": {}, "d": {}}}``.
+
+    Returns ``None`` when nothing is requested.
+    """
+    tree = {}
+    for path in (value or "").split(","):
+        node = tree
+        for name in filter(None, path.strip().split(".")):
+            node = node.setdefault(name, {})
+    return tree or None
+
+
+def requested_fieldset(query_params) -> dict:
+    fieldset = {}
+    for param in (FIELDS_PARAM, EXPAND_PARAM):
+        tree = parse_fieldset(query_params.get(param))
+        if tree:
+            fieldset[param] = tree
+    return fieldset
+
+
+class SparseFieldsetMixin:
+    """Serializer whose fields follow ``context["fieldset"]``.
+
+    ``Meta.expandable_fields`` maps a field name to the ``(serializer
+    class, kwargs)`` rendered when the name is expanded, in place of a
+    default field of that name or in addition to the default fields.
+    ``Meta.fieldset_lookups`` lists the ORM lookups read by default
+    fields whose source is not a model field, such as properties.
+    """
+
+    def _fieldset_path(self) -> list:
+        path, node = [], self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        return path[::-1]
+
+    def _fieldset_node(self, param, path):
+        tree = self.context.get("fieldset", {}).get(param)
+        for name in path:
+            if not tree:
+                return None
+            tree = tree.get(name)
+        return tree or None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        path = self._fieldset_path()
+        requested = self._fieldset_node(FIELDS_PARAM, path) or {}
+        expand = self._fieldset_node(EXPAND_PARAM, path) or {}
+        expandable = getattr(
+            getattr(self, "Meta", None), "expandable_fields", {}
+        )
+
+        self._expanded_fields = set()
+        # Asking for an expand-only field in ``fields`` expands it too.
+        for name in {*expand, *(set(requested) - set(fields))}:
+            if name in expandable:
+                serializer_class, kwargs = expandable[name]
+                fields[name] = serializer_class(**kwargs)
+                self._expanded_fields.add(name)
+            elif name in expand and not isinstance(
+                fields.get(name), serializers.BaseSerializer
+            ):
+                raise ValidationError(
+                    {EXPAND_PARAM: [f"Cannot expand {_dotted(path, name)}."]}
+                )
+
+        if not requested:
+            return fields
+
+        unknown = [
+            _dotted(path, name) for name in requested if name not in fields
+        ]
+        if unknown:
+            raise ValidationError(
+                {FIELDS_PARAM: [f"Unknown field(s): {', '.join(unknown)}."]}
+            )
+        # Expanded names count as requested, so ``fields`` cannot drop
+        # them silently.
+        return {
+            name: field
+            for name, field in fields.items()
+            if name in requested or name in expand
+        }
+
+
+def _dotted(path, name) -> str:
+    return ".".join([*path, name])
+
+
+def serializer_lookups(serializer, annotations=()) -> set:
+    """ORM lookups read by the fields left in ``serializer``.
+
+    Fields whose source is one of the queryset's ``annotations`` need
+    nothing beyond the annotation itself.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    fields = serializer.fields
+    declared = getattr(
+        getattr(serializer, "Meta", None), "fieldset_lookups", {}
+    )
+    expanded = getattr(serializer, "_expanded_fields", ())
+
+    lookups = set()
+    for name, field in fields.items():
+        source = field.source_attrs
+        if source and source[0] in annotations:
+            continue
+        if name in declared and name not in expanded:
+            lookups.update(declared[name])
+            continue
+
+        prefix = LOOKUP_SEP.join(source)
+        if isinstance(field, serializers.BaseSerializer):
+            for lookup in serializer_lookups(field):
+                lookups.add(LOOKUP_SEP.join(filter(None, (prefix, lookup))))
+        if prefix:
+            lookups.add(prefix)
+    return lookups
+
+
+def _prefetch_through(lookup) -> str:
+    if isinstance(lookup, Prefetch):
+        return lookup.prefetch_through
+    return lookup
+
+
+def _prefixes(lookup: str) -> list:
+    parts = lookup.split(LOOKUP_SEP)
+    return [
+        LOOKUP_SEP.join(parts[:length]) for length in range(1, len(parts) + 1)
+    ]
+
+
+def apply_fieldset(queryset, lookups):
+    """Restrict ``queryset`` to what ``lookups`` read.
+
+    Columns go to ``only()``, to-one relations that are traversed to
+    ``select_related`` and to-many relations to ``prefetch_related``.
+    Prefetches of the queryset that are still needed are kept as they
+    are, so filtered ``Prefetch`` objects survive; the rest are dropped.
+    """
+    columns, joins, prefetches = {queryset.model._meta.pk.name}, set(), set()
+    for lookup in lookups:
+        model, path, many = queryset.model, [], False
+        parts = lookup.split(LOOKUP_SEP)
+        for position, part in enumerate(parts):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            path.append(part)
+            current = LOOKUP_SEP.join(path)
+            last = position == len(parts) - 1
+
+            if not field.is_relation:
+                if not many:
+                    columns.add(current)
+                break
+            if many or field.many_to_many or field.one_to_many:
+                many = True
+                prefetches.add(current)
+            elif field.concrete and last:
+                # A primary key value is read from the row itself.
+                columns.add(current)
+            else:
+                joins.add(current)
+                if field.concrete:
+                    columns.add(current)
+            model = field.related_model
+
+    kept, covered = [], set()
+    for lookup in queryset._prefetch_related_lookups:
+        if _prefetch_through(lookup) in prefetches:
+            kept.append(lookup)
+            covered.update(_prefixes(_prefetch_through(lookup)))
+    # Deepest lookups first, so their prefixes need no lookup of their own.
+    for lookup in sorted(prefetches, reverse=True):
+        if lookup not in covered:
+            kept.append(lookup)
+            covered.update(_prefixes(lookup))
+
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if joins:
+        queryset = queryset.select_related(*joins)
+    return queryset.prefetch_related(*kept).only(*columns)
+
+
+class SparseFieldsetViewMixin:
+    """``?fields=`` and ``?expand=`` for the read actions of a viewset.
+
+    The requested fieldset trims the serializer and, through
+    ``apply_fieldset``, the columns and relations the queryset loads.
+    ``fieldset_base_lookups`` names lookups the view itself reads.
+    """
+
+    fieldset_base_lookups = ()
+
+    def get_fieldset(self) -> dict:
+        if (
+            self.action not in FIELDSET_ACTIONS
+            or self.request.method not in SAFE_METHODS
+        ):
+            return {}
+        return requested_fieldset(self.request.query_params)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fieldset"] = self.get_fieldset()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.get_fieldset():
+            return queryset
+
+        lookups = serializer_lookups(
+            self.get_serializer(), queryset.query.annotations
+        )
+        return apply_fieldset(
+            queryset, {*lookups, *self.fieldset_base_lookups}
+        )
@@ -0,0 +1,250 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from itertools import islice
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.color import no_style
+from django.core.serializers.python import Deserializer
+from django.db import connection, models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from cinema.caching import bump_cache_version
+from cinema.documents import refresh_movie_documents
+from cinema.models import CinemaHall, Movie, MovieSession, Ticket
+from cinema.occupancy import rebuild_occupancy
+from cinema.seat_maps import rebuild_seat_maps
+
+READ_SIZE = 1 << 16
+
+
+class FixtureError(Exception):
+    pass
+
+
+def iter_json_array(stream, read_size: int = READ_SIZE):
+    """Yield the items of a top-level JSON array without loading it all."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != "[":
+                    raise FixtureError("Fixture must be a JSON array.")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                pass
+            else:
+                yield item
+                continue
+
+        chunk = stream.read(read_size)
+        if not chunk:
+            raise FixtureError("Unexpected end of fixture.")
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def _dependencies(model) -> set:
+    return {
+        field.related_model
+        for field in model._meta.get_fields()
+        if field.concrete
+        and field.is_relation
+        and field.related_model is not None
+        and field.related_model is not model
+    }
+
+
+def sort_models(model_list) -> list:
+    """Order ``model_list`` so related models are loaded first."""
+    pending = set(model_list)
+    ordered = []
+    while pending:
+        ready = sorted(
+            (
+                model
+                for model in pending
+                if not (_dependencies(model) & pending)
+            ),
+            key=lambda model: model._meta.label,
+        )
+        if not ready:
+            raise FixtureError(
+                "Circular dependencies between "
+                + ", ".join(sorted(model._meta.label for model in pending))
+            )
+        ordered += ready
+        pending -= set(ready)
+    return ordered
+
+
+def _make_naive(instance) -> None:
+    for field in instance._meta.concrete_fields:
+        value = getattr(instance, field.attname)
+        if isinstance(field, models.DateTimeField) and value is not None:
+            if not settings.USE_TZ and timezone.is_aware(value):
+                setattr(instance, field.attname, timezone.make_naive(value))
+
+
+def _set_end_times(movie_sessions) -> None:
+    durations = dict(
+        Movie.objects.filter(
+            id__in={movie_session.movie_id for movie_session in movie_sessions}
+        ).values_list("id", "duration")
+    )
+    for movie_session in movie_sessions:
+        movie_session.end_time = movie_session.show_time + timedelta(
+            minutes=durations[movie_session.movie_id]
+        )
+
+
+def _load_batch(model, records) -> list:
+    deserialized = list(Deserializer(records))
+    instances = [item.object for item in deserialized]
+    for instance in instances:
+        _make_naive(instance)
+    if model is MovieSession:
+        _set_end_times(instances)
+
+    # bulk_create lets auto_now/auto_now_add overwrite fixture values,
+    # so they are written back afterwards.
+    auto_fields = [
+        field.attname
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+        or getattr(field, "auto_now_add", False)
+    ]
+    fixture_values = [
+        [getattr(instance, attname) for attname in auto_fields]
+        for instance in instances
+    ]
+    model.objects.bulk_create(instances)
+    if auto_fields:
+        for instance, values in zip(instances, fixture_values):
+            for attname, value in zip(auto_fields, values):
+                setattr(instance, attname, value)
+        model.objects.bulk_update(instances, auto_fields)
+
+    m2m_fields = {field.name: field for field in model._meta.many_to_many}
+    for field_name, field in m2m_fields.items():
+        through = field.remote_field.through
+        source = field.m2m_field_name()
+        target = field.m2m_reverse_field_name()
+        through.objects.bulk_create(
+            through(
+                **{
+                    f"{source}_id": item.object.pk,
+                    f"{target}_id": related_pk,
+                }
+            )
+            for item in deserialized
+            for related_pk in item.m2m_data.get(field_name, ())
+        )
+
+    return [instance.pk for instance in instances]
+
+
+def validation_errors() -> list:
+    """Set-based checks of what ``Ticket.clean`` validates per row."""
+    errors = []
+    out_of_hall = Ticket.objects.filter(
+        Q(row__lt=1)
+        | Q(row__gt=F("movie_session__cinema_hall__rows"))
+        | Q(seat__lt=1)
+        | Q(seat__gt=F("movie_session__cinema_hall__seats_in_row"))
+    ).count()
+    if out_of_hall:
+        errors.append(f"{out_of_hall} ticket(s) outside of their hall.")
+    return errors
+
+
+def load_fixture(
+    stream,
+    batch_size: int = 1000,
+    validate: bool = False,
+    read_size: int = READ_SIZE,
+) -> dict:
+    """Bulk-load a ``dumpdata`` JSON fixture into an empty database.
+
+    Records are spooled per model to temporary files while the fixture
+    is parsed incrementally, then inserted model by model in dependency
+    order with ``bulk_create``, M2M through rows included.
+    """
+    counts = {}
+    with tempfile.TemporaryDirectory(prefix="fixture_") as spool_dir:
+        spools = {}
+        try:
+            for record in iter_json_array(stream, read_size):
+                label = record["model"]
+                if label not in spools:
+                    spools[label] = open(
+                        os.path.join(spool_dir, f"{label}.ndjson"), "w+"
+                    )
+                spools[label].write(json.dumps(record) + "\n")
+
+            loaded_models = {
+                apps.get_model(label): spool for label, spool in spools.items()
+            }
+            with transaction.atomic():
+                for model in sort_models(loaded_models):
+                    spool = loaded_models[model]
+                    spool.seek(0)
+                    counts[model._meta.label_lower] = 0
+                    while True:
+                        records = [
+                            json.loads(line)
+                            for line in islice(spool, batch_size)
+                        ]
+                        if not records:
+                            break
+                        pks = _load_batch(model, records)
+                        counts[model._meta.label_lower] += len(pks)
+                        if model is Movie:
+                            refresh_movie_documents(pks)
+
+                _after_load(loaded_models)
+
+                if validate:
+                    errors = validation_errors()
+                    if errors:
+                        raise FixtureError(" ".join(errors))
+        finally:
+            for spool in spools.values():
+                spool.close()
+
+    return counts
+
+
+def _after_load(loaded_models) -> None:
+    sequence_sql = connection.ops.sequence_reset_sql(
+        no_style(), list(loaded_models)
+    )
+    if sequence_sql:
+        with connection.cursor() as cursor:
+            for sql in sequence_sql:
+                cursor.execute(sql)
+
+    if {MovieSession, Ticket} & set(loaded_models):
+        rebuild_seat_maps(MovieSession.objects.all())
+
+    if {CinemaHall, MovieSession, Ticket} & set(loaded_models):
+        rebuild_occupancy()
+
+    for model in loaded_models:
+        bump_cache_version(model)
@@ -0,0 +1,257 @@
+import json
+import math
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.test import APIClient
+
+from cinema.models import CinemaHall, Genre, Actor, Movie, MovieSession
+from cinema.seeding import seed_dataset
+from cinema.urls import router
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def detail_target(model):
+    """The row at the middle primary key, the same on every seeded run."""
+    queryset = model.objects.order_by("pk")
+    return queryset[queryset.count() // 2]
+
+
+@contextmanager
+def scratch_database():
+    """Run the block against a throwaway SQLite file database."""
+    if connection.vendor != "sqlite":
+        raise CommandError("Benchmarks need a SQLite default database.")
+
+    scratch_dir = tempfile.mkdtemp(prefix="bench_api_")
+    connection.settings_dict["TEST"]["NAME"] = os.path.join(
+        scratch_dir, "bench.sqlite3"
+    )
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True
+    )
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+        os.rmdir(scratch_dir)
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Seed a scratch SQLite database and report latency and query "
+        "statistics for every list, detail and create endpoint as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--halls", type=int, default=10)
+        parser.add_argument("--movies", type=int, default=100)
+        parser.add_argument("--sessions", type=int, default=500)
+        parser.add_argument("--tickets", type=int, default=5000)
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=30,
+            help="Requests per endpoint.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            dataset = seed_dataset(
+                halls=options["halls"],
+                movies=options["movies"],
+                sessions=options["sessions"],
+                tickets=options["tickets"],
+                random_seed=options["seed"],
+            )
+            cache.clear()
+            endpoints = self.run_endpoints(options["iterations"])
+
+        report = json.dumps(
+            {
+                "meta": {
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                    "django": django.get_version(),
+                    "iterations": options["iterations"],
+                    "dataset": dataset,
+                },
+                "endpoints": endpoints,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write(report + "\n")
+        else:
+            self.stdout.write(report)
+
+    def run_endpoints(self, iterations: int) -> dict:
+        user_model = get_user_model()
+        customer_client = APIClient()
+        # The seeded customer with the most orders, so orders-list pages
+        # through real rows.
+        customer_client.force_authenticate(
+            user=user_model.objects.annotate(orders=Count("order"))
+            .order_by("-orders", "pk")
+            .first()
+        )
+        staff_client = APIClient()
+        staff_client.force_authenticate(
+            user=user_model.objects.create(
+                username="bench_staff", password="!", is_staff=True
+            )
+        )
+        payloads = self.payload_factories()
+
+        results = {}
+        for prefix, viewset, basename in router.registry:
+            if IsAdminUser in viewset.permission_classes:
+                client = staff_client
+            else:
+                client = customer_client
+            list_url = reverse(f"cinema:{basename}-list")
+            results[f"{prefix}-list"] = self.measure(
+                iterations, lambda: client.get(list_url)
+            )
+
+            if hasattr(viewset, "retrieve"):
+                instance = detail_target(viewset.queryset.model)
+                detail_url = reverse(
+                    f"cinema:{basename}-detail", args=[instance.pk]
+                )
+                results[f"{prefix}-detail"] = self.measure(
+                    iterations, lambda: client.get(detail_url)
+                )
+
+            if hasattr(viewset, "create") and prefix in payloads:
+                payload = payloads[prefix]
+                results[f"{prefix}-create"] = self.measure(
+                    iterations,
+                    lambda: client.post(list_url, payload(), format="json"),
+                )
+
+        return results
+
+    @staticmethod
+    def payload_factories() -> dict:
+        numbers = count()
+        genre = Genre.objects.first()
+        actor = Actor.objects.first()
+        movie = Movie.objects.first()
+        cinema_hall = CinemaHall.objects.first()
+        order_hall = CinemaHall.objects.create(
+            name="Bench orders", rows=100, seats_in_row=100
+        )
+        order_session = MovieSession.objects.create(
+            show_time=datetime(2022, 12, 31, 23),
+            movie=movie,
+            cinema_hall=order_hall,
+        )
+
+        def order_payload():
+            row, seat = divmod(next(numbers), order_hall.seats_in_row)
+            return {
+                "tickets": [
+                    {
+                        "row": row + 1,
+                        "seat": seat + 1,
+                        "movie_session": order_session.id,
+                    }
+                ]
+            }
+
+        return {
+            "genres": lambda: {"name": f"Bench genre {next(numbers)}"},
+            "actors": lambda: {
+                "first_name": "Bench",
+                "last_name": f"Actor {next(numbers)}",
+            },
+            "cinema_halls": lambda: {
+                "name": f"Bench hall {next(numbers)}",
+                "rows": 10,
+                "seats_in_row": 10,
+            },
+            "movies": lambda: {
+                "title": f"Bench movie {next(numbers)}",
+                "description": "Benchmark movie.",
+                "duration": 100,
+                "genres": [genre.id],
+                "actors": [actor.id],
+            },
+            "movie_sessions": lambda: {
+                "show_time": "2022-12-24T18:00:00",
+                "movie": movie.id,
+                "cinema_hall": cinema_hall.id,
+            },
+            "orders": order_payload,
+        }
+
+    @staticmethod
+    def measure(iterations: int, send_request) -> dict:
+        """Time ``send_request``, which has to answer with a 2xx status.
+
+        Timing an error page would report numbers for a request that
+        never reached the endpoint, so that fails the command instead.
+        """
+        latencies, query_counts, query_times, statuses = [], [], [], set()
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = send_request()
+                latencies.append((time.perf_counter() - started) * 1000)
+            if not 200 <= response.status_code < 300:
+                raise CommandError(
+                    f"{response.request['REQUEST_METHOD']} "
+                    f"{response.request['PATH_INFO']} answered "
+                    f"{response.status_code}: {response.content[:200]!r}"
+                )
+            statuses.add(response.status_code)
+            query_counts.append(len(queries))
+            query_times.append(
+                sum(float(query["time"]) for query in queries) * 1000
+            )
+
+        latencies.sort()
+        query_counts.sort()
+        query_times.sort()
+        return {
+            "statuses": sorted(statuses),
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3),
+            "queries_p50": percentile(query_counts, 0.50),
+            "queries_max": query_counts[-1],
+            "query_time_p50_ms": round(percentile(query_times, 0.50), 3),
+        }
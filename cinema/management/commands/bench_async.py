@@ -0,0 +1,186 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import django
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from cinema.management.commands.bench_api import percentile, scratch_database
+from cinema.models import Actor, Genre, Movie, MovieSession
+from cinema.seeding import seed_dataset
+
+RESOURCES = (
+    ("genres", "genre", Genre),
+    ("actors", "actor", Actor),
+    ("movies", "movie", Movie),
+    ("movie_sessions", "moviesession", MovieSession),
+)
+
+
+def _summary(latencies: list, elapsed: float, statuses: set) -> dict:
+    latencies.sort()
+    return {
+        "statuses": sorted(statuses),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+    }
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Compare concurrent throughput of the async read views under the "
+        "ASGI handler with the DRF viewsets under the WSGI handler."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--halls", type=int, default=10)
+        parser.add_argument("--movies", type=int, default=100)
+        parser.add_argument("--sessions", type=int, default=500)
+        parser.add_argument("--tickets", type=int, default=5000)
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="Requests per endpoint and handler.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="Requests in flight at once.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        # The debug toolbar middleware is sync-only and would push every
+        # async view back onto a thread; the response cache is disabled
+        # so both paths hit the database.
+        middleware = [
+            name for name in settings.MIDDLEWARE if "debug_toolbar" not in name
+        ]
+        with scratch_database(), override_settings(
+            MIDDLEWARE=middleware,
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+                }
+            },
+        ):
+            dataset = seed_dataset(
+                halls=options["halls"],
+                movies=options["movies"],
+                sessions=options["sessions"],
+                tickets=options["tickets"],
+                random_seed=options["seed"],
+            )
+            endpoints = self.run_endpoints(
+                options["requests"], options["concurrency"]
+            )
+
+        report = json.dumps(
+            {
+                "meta": {
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                    "django": django.get_version(),
+                    "requests": options["requests"],
+                    "concurrency": options["concurrency"],
+                    "dataset": dataset,
+                },
+                "endpoints": endpoints,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write(report + "\n")
+        else:
+            self.stdout.write(report)
+
+    def run_endpoints(self, requests: int, concurrency: int) -> dict:
+        results = {}
+        for prefix, basename, model in RESOURCES:
+            pk = model.objects.order_by("?").values_list("pk", flat=True)[0]
+            for action, args in (("list", []), ("detail", [pk])):
+                results[f"{prefix}-{action}"] = {
+                    "wsgi": self.measure_wsgi(
+                        reverse(f"cinema:{basename}-{action}", args=args),
+                        requests,
+                        concurrency,
+                    ),
+                    "asgi": self.measure_asgi(
+                        reverse(
+                            f"cinema:async-{basename}-{action}", args=args
+                        ),
+                        requests,
+                        concurrency,
+                    ),
+                }
+        return results
+
+    @staticmethod
+    def measure_wsgi(url: str, requests: int, concurrency: int) -> dict:
+        latencies, statuses = [], set()
+
+        def worker(count: int) -> None:
+            client = Client()
+            try:
+                for _ in range(count):
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    statuses.add(response.status_code)
+            finally:
+                connections.close_all()
+
+        shares = [
+            requests // concurrency + (number < requests % concurrency)
+            for number in range(concurrency)
+        ]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            list(executor.map(worker, shares))
+        return _summary(latencies, time.perf_counter() - started, statuses)
+
+    @staticmethod
+    def measure_asgi(url: str, requests: int, concurrency: int) -> dict:
+        latencies, statuses = [], set()
+
+        async def worker(count: int) -> None:
+            client = AsyncClient()
+            for _ in range(count):
+                started = time.perf_counter()
+                response = await client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses.add(response.status_code)
+
+        async def run() -> float:
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    worker(
+                        requests // concurrency
+                        + (number < requests % concurrency)
+                    )
+                    for number in range(concurrency)
+                )
+            )
+            elapsed = time.perf_counter() - started
+            await sync_to_async(connections.close_all)()
+            return elapsed
+
+        elapsed = asyncio.run(run())
+        return _summary(latencies, elapsed, statuses)
@@ -0,0 +1,107 @@
+import json
+import time
+from datetime import datetime
+
+import django
+from django.core.management.base import BaseCommand
+from django.http import QueryDict
+
+from cinema.fast_lists import movie_list_data, movie_session_list_data
+from cinema.management.commands.bench_api import percentile, scratch_database
+from cinema.seeding import seed_dataset
+from cinema.serializers import MovieListSerializer, MovieSessionListSerializer
+from cinema.views import movie_list_queryset, movie_session_list_queryset
+
+LISTS = (
+    ("movies", movie_list_queryset, MovieListSerializer, movie_list_data),
+    (
+        "movie_sessions",
+        movie_session_list_queryset,
+        MovieSessionListSerializer,
+        movie_session_list_data,
+    ),
+)
+
+
+def _timings(function, repeat: int) -> dict:
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+    }
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Compare the ModelSerializer and values() paths of the movie and "
+        "movie session list endpoints on a scratch database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--halls", type=int, default=10)
+        parser.add_argument("--movies", type=int, default=500)
+        parser.add_argument("--sessions", type=int, default=2000)
+        parser.add_argument("--tickets", type=int, default=20000)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=30,
+            help="Timed runs per list and path.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file instead of stdout.",
+        )
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            dataset = seed_dataset(
+                halls=options["halls"],
+                movies=options["movies"],
+                sessions=options["sessions"],
+                tickets=options["tickets"],
+                random_seed=options["seed"],
+            )
+            lists = {}
+            for name, build_queryset, serializer_class, fast_data in LISTS:
+                queryset = build_queryset(QueryDict())
+                serializer = _timings(
+                    lambda: serializer_class(queryset.all(), many=True).data,
+                    options["repeat"],
+                )
+                values = _timings(
+                    lambda: fast_data(queryset.all()), options["repeat"]
+                )
+                lists[name] = {
+                    "rows": queryset.count(),
+                    "serializer": serializer,
+                    "values": values,
+                    "speedup": round(
+                        serializer["p50_ms"] / values["p50_ms"], 2
+                    ),
+                }
+
+        report = json.dumps(
+            {
+                "meta": {
+                    "created_at": datetime.now().isoformat(timespec="seconds"),
+                    "django": django.get_version(),
+                    "repeat": options["repeat"],
+                    "dataset": dataset,
+                },
+                "lists": lists,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write(report + "\n")
+        else:
+            self.stdout.write(report)
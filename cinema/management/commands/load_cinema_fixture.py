@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from cinema.fixture_loader import FixtureError, load_fixture
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Stream a JSON fixture in the cinema_service_db_data.json format "
+        "into an empty database with bulk inserts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixture", help="Path to the JSON fixture.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Objects inserted per bulk_create batch.",
+        )
+        parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="Check tickets against hall dimensions after loading and "
+            "roll back on errors.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["fixture"]) as stream:
+                counts = load_fixture(
+                    stream,
+                    batch_size=options["batch_size"],
+                    validate=options["validate"],
+                )
+        except (OSError, FixtureError) as error:
+            raise CommandError(error)
+
+        for label, count in counts.items():
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Installed {sum(counts.values())} object(s) "
+                f"from {options['fixture']}."
+            )
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from cinema.occupancy import rebuild_occupancy
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Recompute the occupancy summary from movie sessions and tickets."
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_occupancy()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rows} occupancy summary row(s).")
+        )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from cinema.models import MovieSession
+from cinema.seat_maps import rebuild_seat_maps
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Rebuild movie session seat bitmaps that drifted from tickets."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "movie_session_ids",
+            nargs="*",
+            type=int,
+            help="Only reconcile these movie sessions.",
+        )
+
+    def handle(self, *args, **options):
+        movie_sessions = MovieSession.objects.all()
+        if options["movie_session_ids"]:
+            movie_sessions = movie_sessions.filter(
+                id__in=options["movie_session_ids"]
+            )
+
+        rebuilt = rebuild_seat_maps(movie_sessions)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rebuilt} drifted seat map(s).")
+        )
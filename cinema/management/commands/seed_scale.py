@@ -0,0 +1,101 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from cinema.models import Actor, CinemaHall, Genre, Movie, MovieSession
+from cinema.seeding import seed_scale
+
+# A scale seed expects an empty catalogue; genre names and seeded
+# usernames are unique, so a second run would fail halfway.
+SEEDED_MODELS = (Genre, Actor, CinemaHall, Movie, MovieSession)
+
+
+def _has_seeded_rows() -> bool:
+    users = get_user_model().objects.filter(username__startswith="seed")
+    return users.exists() or any(
+        model.objects.exists() for model in SEEDED_MODELS
+    )
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Generate a production-sized synthetic dataset: thousands of "
+        "movie sessions with realistic occupancy and millions of tickets."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--halls", type=int, default=20)
+        parser.add_argument("--movies", type=int, default=300)
+        parser.add_argument("--sessions", type=int, default=5000)
+        parser.add_argument("--users", type=int, default=10000)
+        parser.add_argument(
+            "--start",
+            type=date.fromisoformat,
+            default=date(2023, 1, 1),
+            help="First day of the schedule (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--mean-occupancy",
+            type=float,
+            default=0.45,
+            help="Mean share of sold seats before time and popularity "
+            "adjustments.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Movie sessions written per transaction.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Rows per bulk_create batch.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete all existing data, users included, before "
+            "seeding.",
+        )
+
+    def handle(self, *args, **options):
+        if options["flush"]:
+            call_command(
+                "flush", interactive=False, verbosity=options["verbosity"]
+            )
+        elif _has_seeded_rows():
+            raise CommandError(
+                "The database already holds cinema data or seeded users. "
+                "Run seed_scale with --flush to replace it."
+            )
+
+        def progress(totals):
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{totals['sessions']} sessions, "
+                    f"{totals['tickets']} tickets"
+                )
+
+        totals = seed_scale(
+            halls=options["halls"],
+            movies=options["movies"],
+            sessions=options["sessions"],
+            users=options["users"],
+            start=options["start"],
+            mean_occupancy=options["mean_occupancy"],
+            chunk_size=options["chunk_size"],
+            batch_size=options["batch_size"],
+            random_seed=options["seed"],
+            progress=progress,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {totals['sessions']} movie sessions, "
+                f"{totals['orders']} orders and {totals['tickets']} tickets."
+            )
+        )
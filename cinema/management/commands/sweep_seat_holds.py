@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from cinema.reservations import SWEEP_BATCH_SIZE, sweep_expired_holds
+
+
+class Command(BaseCommand):
+    help = "Delete expired seat holds in batches."  # noqa: VNE003
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=SWEEP_BATCH_SIZE,
+            help="Number of holds deleted per statement.",
+        )
+
+    def handle(self, *args, **options):
+        swept = sweep_expired_holds(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Swept {swept} expired seat hold(s).")
+        )
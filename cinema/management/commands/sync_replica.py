@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cinema.replicas import copy_to_replica, replica_configured
+
+
+class Command(BaseCommand):
+    help = (  # noqa: VNE003
+        "Copy the default SQLite database to the replica database file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Keep copying every INTERVAL seconds until interrupted.",
+        )
+
+    def handle(self, *args, **options):
+        if not replica_configured():
+            raise CommandError(
+                "No replica database; set CINEMA_REPLICA_DB to its path."
+            )
+
+        while True:
+            try:
+                copy_to_replica()
+            except ValueError as error:
+                raise CommandError(error)
+            self.stdout.write(self.style.SUCCESS("Replica is up to date."))
+
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
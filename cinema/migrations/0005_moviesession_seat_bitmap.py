@@ -0,0 +1,40 @@
+# Generated by Django 4.1 on 2026-10-17 04:13
+
+from django.db import migrations, models
+
+
+def fill_seat_bitmaps(apps, schema_editor):
+    MovieSession = apps.get_model("cinema", "MovieSession")
+    Ticket = apps.get_model("cinema", "Ticket")
+
+    for movie_session in MovieSession.objects.select_related("cinema_hall"):
+        rows = movie_session.cinema_hall.rows
+        seats_in_row = movie_session.cinema_hall.seats_in_row
+        # Row-major, least significant bit first, as in SeatBitmap.
+        bits = bytearray((rows * seats_in_row + 7) // 8)
+        places = Ticket.objects.filter(
+            movie_session_id=movie_session.id
+        ).values_list("row", "seat")
+        for row, seat in places:
+            if not (1 <= row <= rows and 1 <= seat <= seats_in_row):
+                continue
+            index = (row - 1) * seats_in_row + seat - 1
+            bits[index >> 3] |= 1 << (index & 7)
+        movie_session.seat_bitmap = bytes(bits)
+        movie_session.save(update_fields=["seat_bitmap"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0004_alter_genre_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="moviesession",
+            name="seat_bitmap",
+            field=models.BinaryField(default=bytes),
+        ),
+        migrations.RunPython(fill_seat_bitmaps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1 on 2026-10-17 04:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_movie_documents(apps, schema_editor):
+    Movie = apps.get_model("cinema", "Movie")
+    MovieDocument = apps.get_model("cinema", "MovieDocument")
+
+    documents = {
+        movie_id: MovieDocument(movie_id=movie_id, genres=[], actors=[])
+        for movie_id in Movie.objects.values_list("id", flat=True)
+    }
+    genre_names = Movie.genres.through.objects.order_by("id").values_list(
+        "movie_id", "genre__name"
+    )
+    for movie_id, name in genre_names:
+        documents[movie_id].genres.append(name)
+
+    actor_names = Movie.actors.through.objects.order_by("id").values_list(
+        "movie_id", "actor__first_name", "actor__last_name"
+    )
+    for movie_id, first_name, last_name in actor_names:
+        documents[movie_id].actors.append(f"{first_name} {last_name}")
+
+    MovieDocument.objects.bulk_create(documents.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0006_order_user_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieDocument",
+            fields=[
+                (
+                    "movie",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="document",
+                        serialize=False,
+                        to="cinema.movie",
+                    ),
+                ),
+                ("genres", models.JSONField(default=list)),
+                ("actors", models.JSONField(default=list)),
+            ],
+        ),
+        migrations.RunPython(fill_movie_documents, migrations.RunPython.noop),
+    ]
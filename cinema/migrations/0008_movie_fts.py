@@ -0,0 +1,75 @@
+from django.db import migrations
+
+FTS_TABLE = "cinema_movie_fts"
+
+CREATE_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title,
+        description,
+        content='cinema_movie',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON cinema_movie BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON cinema_movie BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au
+    AFTER UPDATE OF title, description ON cinema_movie BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def supports_trigram_fts(schema_editor) -> bool:
+    connection = schema_editor.connection
+    return (
+        connection.vendor == "sqlite"
+        and connection.Database.sqlite_version_info >= (3, 34, 0)
+    )
+
+
+def create_movie_fts(apps, schema_editor):
+    if supports_trigram_fts(schema_editor):
+        for sql in CREATE_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_movie_fts(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        for sql in DROP_SQL:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0007_moviedocument"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_movie_fts, drop_movie_fts),
+    ]
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_end_times(apps, schema_editor):
+    Movie = apps.get_model("cinema", "Movie")
+    MovieSession = apps.get_model("cinema", "MovieSession")
+    for movie_id, duration in Movie.objects.values_list("id", "duration"):
+        MovieSession.objects.filter(movie_id=movie_id).update(
+            end_time=F("show_time") + timedelta(minutes=duration)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0009_seathold"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="moviesession",
+            name="end_time",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(fill_end_times, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="moviesession",
+            name="end_time",
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="moviesession",
+            index=models.Index(
+                fields=["cinema_hall", "show_time"],
+                name="moviesession_hall_show_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="moviesession",
+            index=models.Index(
+                fields=["show_time", "end_time"],
+                name="moviesession_show_end_idx",
+            ),
+        ),
+    ]
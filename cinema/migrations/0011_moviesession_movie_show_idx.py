@@ -0,0 +1,19 @@
+# Generated by Django 4.1 on 2026-10-17 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0010_moviesession_end_time"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="moviesession",
+            index=models.Index(
+                fields=["movie", "show_time"], name="moviesession_movie_show_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 4.1 on 2026-10-17 04:40
+
+from django.db import migrations, models
+from django.db.models import Count, F
+import django.db.models.deletion
+
+
+def fill_occupancy(apps, schema_editor):
+    MovieSession = apps.get_model("cinema", "MovieSession")
+    OccupancySummary = apps.get_model("cinema", "OccupancySummary")
+    summaries = {}
+    movie_sessions = (
+        MovieSession.objects.order_by()
+        .annotate(
+            capacity=F("cinema_hall__rows") * F("cinema_hall__seats_in_row"),
+            tickets_sold=Count("tickets"),
+        )
+        .values_list(
+            "show_time",
+            "movie_id",
+            "cinema_hall_id",
+            "capacity",
+            "tickets_sold",
+        )
+    )
+    for show_time, movie_id, cinema_hall_id, capacity, tickets_sold in (
+        movie_sessions.iterator()
+    ):
+        summary = summaries.setdefault(
+            (show_time.date(), movie_id, cinema_hall_id),
+            OccupancySummary(
+                date=show_time.date(),
+                movie_id=movie_id,
+                cinema_hall_id=cinema_hall_id,
+            ),
+        )
+        summary.sessions += 1
+        summary.capacity += capacity
+        summary.tickets_sold += tickets_sold
+    OccupancySummary.objects.bulk_create(summaries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cinema", "0011_moviesession_movie_show_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OccupancySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("sessions", models.IntegerField(default=0)),
+                ("capacity", models.IntegerField(default=0)),
+                ("tickets_sold", models.IntegerField(default=0)),
+                (
+                    "cinema_hall",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="cinema.cinemahall",
+                    ),
+                ),
+                (
+                    "movie",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="cinema.movie",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "occupancy summaries",
+                "ordering": ["date", "movie_id", "cinema_hall_id"],
+                "unique_together": {("date", "movie", "cinema_hall")},
+            },
+        ),
+        migrations.RunPython(fill_occupancy, migrations.RunPython.noop),
+    ]
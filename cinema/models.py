@@ -1,6 +1,12 @@
+from datetime import timedelta
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from cinema.seat_maps import SeatBitmap
 
 
 class CinemaHall(models.Model):
@@ -45,17 +51,124 @@ class Movie(models.Model):
     class Meta:
         ordering = ["title"]
 
+    @property
+    def genre_names(self) -> list:
+        document = getattr(self, "document", None)
+        if document is not None:
+            return document.genres
+        return [genre.name for genre in self.genres.all()]
+
+    @property
+    def actor_names(self) -> list:
+        document = getattr(self, "document", None)
+        if document is not None:
+            return document.actors
+        return [actor.full_name for actor in self.actors.all()]
+
     def __str__(self):
         return self.title
 
 
+class MovieDocument(models.Model):
+    """Denormalized genre and actor names of a movie for list reads."""
+
+    movie = models.OneToOneField(
+        Movie,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="document",
+    )
+    genres = models.JSONField(default=list)
+    actors = models.JSONField(default=list)
+
+    def __str__(self):
+        return str(self.movie_id)
+
+
 class MovieSession(models.Model):
     show_time = models.DateTimeField()
     movie = models.ForeignKey(Movie, on_delete=models.CASCADE)
     cinema_hall = models.ForeignKey(CinemaHall, on_delete=models.CASCADE)
+    seat_bitmap = models.BinaryField(default=bytes, editable=False)
+    # show_time + movie.duration, kept in step by save() and the
+    # Movie post_save signal so time ranges can use an index.
+    end_time = models.DateTimeField(editable=False)
 
     class Meta:
         ordering = ["-show_time"]
+        indexes = [
+            models.Index(
+                fields=["cinema_hall", "show_time"],
+                name="moviesession_hall_show_idx",
+            ),
+            models.Index(
+                fields=["show_time", "end_time"],
+                name="moviesession_show_end_idx",
+            ),
+            models.Index(
+                fields=["movie", "show_time"],
+                name="moviesession_movie_show_idx",
+            ),
+        ]
+
+    @property
+    def seat_map(self) -> SeatBitmap:
+        return SeatBitmap(
+            self.cinema_hall.rows,
+            self.cinema_hall.seats_in_row,
+            self.seat_bitmap,
+        )
+
+    @cached_property
+    def active_holds(self) -> list:
+        return list(self.holds.filter(expires_at__gt=timezone.now()))
+
+    @property
+    def occupied_seat_map(self) -> SeatBitmap:
+        seat_map = self.seat_map
+        for hold in self.active_holds:
+            try:
+                seat_map.add(hold.row, hold.seat)
+            except IndexError:
+                continue
+        return seat_map
+
+    @property
+    def taken_places(self) -> list:
+        return [
+            {"row": row, "seat": seat}
+            for row, seat in self.occupied_seat_map
+        ]
+
+    @cached_property
+    def capacity(self) -> int:
+        return self.cinema_hall.capacity
+
+    @cached_property
+    def tickets_available(self) -> int:
+        return self.capacity - len(self.occupied_seat_map)
+
+    def save(
+        self,
+        force_insert=False,
+        force_update=False,
+        using=None,
+        update_fields=None,
+    ):
+        self.show_time = self._meta.get_field("show_time").to_python(
+            self.show_time
+        )
+        self.end_time = self.show_time + timedelta(
+            minutes=self.movie.duration
+        )
+        if update_fields is not None and {
+            "show_time",
+            "movie",
+        } & set(update_fields):
+            update_fields = {*update_fields, "end_time"}
+        super(MovieSession, self).save(
+            force_insert, force_update, using, update_fields
+        )
 
     def __str__(self):
         return self.movie.title + " " + str(self.show_time)
@@ -71,7 +184,13 @@ class Order(models.Model):
         return str(self.created_at)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="order_user_created_at_id_idx",
+            ),
+        ]
 
 
 class Ticket(models.Model):
@@ -84,16 +203,15 @@ class Ticket(models.Model):
     row = models.IntegerField()
     seat = models.IntegerField()
 
-    def clean(self):
+    @staticmethod
+    def validate_ticket(row, seat, cinema_hall, error_to_raise):
         for ticket_attr_value, ticket_attr_name, cinema_hall_attr_name in [
-            (self.row, "row", "rows"),
-            (self.seat, "seat", "seats_in_row"),
+            (row, "row", "rows"),
+            (seat, "seat", "seats_in_row"),
         ]:
-            count_attrs = getattr(
-                self.movie_session.cinema_hall, cinema_hall_attr_name
-            )
+            count_attrs = getattr(cinema_hall, cinema_hall_attr_name)
             if not (1 <= ticket_attr_value <= count_attrs):
-                raise ValidationError(
+                raise error_to_raise(
                     {
                         ticket_attr_name: f"{ticket_attr_name} "
                         f"number must be in available range: "
@@ -102,6 +220,14 @@ class Ticket(models.Model):
                     }
                 )
 
+    def clean(self):
+        Ticket.validate_ticket(
+            self.row,
+            self.seat,
+            self.movie_session.cinema_hall,
+            ValidationError,
+        )
+
     def save(
         self,
         force_insert=False,
@@ -121,3 +247,59 @@ class Ticket(models.Model):
 
     class Meta:
         unique_together = ("movie_session", "row", "seat")
+
+
+class SeatHold(models.Model):
+    movie_session = models.ForeignKey(
+        MovieSession, on_delete=models.CASCADE, related_name="holds"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="seat_holds",
+    )
+    row = models.IntegerField()
+    seat = models.IntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return (
+            f"{str(self.movie_session)} (row: {self.row}, seat: {self.seat}) "
+            f"until {self.expires_at}"
+        )
+
+    class Meta:
+        unique_together = ("movie_session", "row", "seat")
+
+
+class OccupancySummary(models.Model):
+    """Sessions, seats and tickets sold per day, movie and cinema hall.
+
+    Kept current with ``F()`` increments by the ticket and movie session
+    signals; ``rebuild_occupancy`` recomputes it from scratch.
+    """
+
+    date = models.DateField()
+    movie = models.ForeignKey(
+        Movie, on_delete=models.CASCADE, related_name="+"
+    )
+    cinema_hall = models.ForeignKey(
+        CinemaHall, on_delete=models.CASCADE, related_name="+"
+    )
+    sessions = models.IntegerField(default=0)
+    capacity = models.IntegerField(default=0)
+    tickets_sold = models.IntegerField(default=0)
+
+    @property
+    def occupancy(self) -> float:
+        if not self.capacity:
+            return 0.0
+        return round(self.tickets_sold / self.capacity * 100, 2)
+
+    def __str__(self):
+        return f"{self.date} {self.movie_id} {self.cinema_hall_id}"
+
+    class Meta:
+        ordering = ["date", "movie_id", "cinema_hall_id"]
+        unique_together = ("date", "movie", "cinema_hall")
+        verbose_name_plural = "occupancy summaries"
@@ -0,0 +1,200 @@
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import TruncDate
+
+from cinema.models import MovieSession, OccupancySummary, Ticket
+
+COUNTERS = ("sessions", "capacity", "tickets_sold")
+# Keeps the CASE parameters of one UPDATE under SQLite's 999 limit.
+APPLY_BATCH_SIZE = 50
+REBUILD_BATCH_SIZE = 500
+
+
+def _add_change(changes: dict, key: tuple, *deltas) -> None:
+    current = changes.get(key, (0,) * len(COUNTERS))
+    changes[key] = tuple(map(sum, zip(current, deltas)))
+
+
+def apply_occupancy_changes(changes: dict) -> None:
+    """Add ``changes`` to the summary rows with ``F()`` increments.
+
+    ``changes`` maps ``(date, movie_id, cinema_hall_id)`` to deltas of
+    ``(sessions, capacity, tickets_sold)``. Missing rows are inserted
+    empty first, then every row of a batch is incremented by a single
+    ``UPDATE`` choosing its deltas with ``CASE``. A decrement without a
+    row means the row went away together with its movie or cinema hall.
+    """
+    changes = {key: deltas for key, deltas in changes.items() if any(deltas)}
+    OccupancySummary.objects.bulk_create(
+        (
+            OccupancySummary(
+                date=day, movie_id=movie_id, cinema_hall_id=cinema_hall_id
+            )
+            for (day, movie_id, cinema_hall_id), deltas in changes.items()
+            if min(deltas) >= 0
+        ),
+        batch_size=APPLY_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    keys = list(changes)
+    for offset in range(0, len(keys), APPLY_BATCH_SIZE):
+        conditions = {
+            key: Q(date=key[0], movie_id=key[1], cinema_hall_id=key[2])
+            for key in keys[offset:offset + APPLY_BATCH_SIZE]
+        }
+        increments = {}
+        for position, name in enumerate(COUNTERS):
+            whens = [
+                When(condition, then=Value(changes[key][position]))
+                for key, condition in conditions.items()
+                if changes[key][position]
+            ]
+            if whens:
+                increments[name] = F(name) + Case(*whens, default=Value(0))
+        OccupancySummary.objects.filter(
+            reduce(or_, conditions.values())
+        ).update(**increments)
+
+
+def record_ticket_sales(tickets_by_session: dict) -> None:
+    """Count signed ticket numbers keyed by movie session id.
+
+    A session's summary row is created when the session is counted, so
+    each session costs one ``UPDATE`` that finds its row through the
+    session's own date, movie and cinema hall.
+    """
+    for movie_session_id, tickets in tickets_by_session.items():
+        if not tickets:
+            continue
+        movie_session = MovieSession.objects.filter(pk=movie_session_id)
+        OccupancySummary.objects.filter(
+            date=Subquery(
+                movie_session.annotate(
+                    date=TruncDate("show_time")
+                ).values("date")
+            ),
+            movie_id=Subquery(movie_session.values("movie_id")),
+            cinema_hall_id=Subquery(movie_session.values("cinema_hall_id")),
+        ).update(tickets_sold=F("tickets_sold") + tickets)
+
+
+def record_movie_sessions(movie_sessions, sign: int = 1) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) the seats of sessions."""
+    changes = {}
+    for movie_session in movie_sessions:
+        _add_change(
+            changes,
+            (
+                movie_session.show_time.date(),
+                movie_session.movie_id,
+                movie_session.cinema_hall_id,
+            ),
+            sign,
+            sign * movie_session.cinema_hall.capacity,
+            0,
+        )
+    apply_occupancy_changes(changes)
+
+
+def session_occupancy_key(movie_session_id: int):
+    """``(date, movie_id, cinema_hall_id, capacity)`` stored for a session."""
+    row = (
+        MovieSession.objects.filter(pk=movie_session_id)
+        .annotate(
+            capacity=F("cinema_hall__rows") * F("cinema_hall__seats_in_row")
+        )
+        .values_list("show_time", "movie_id", "cinema_hall_id", "capacity")
+        .first()
+    )
+    if row is None:
+        return None
+    show_time, *rest = row
+    return (show_time.date(), *rest)
+
+
+def move_movie_session(key_before_save: tuple, movie_session) -> None:
+    """Move a rescheduled session's counts from its old summary row."""
+    key = (
+        movie_session.show_time.date(),
+        movie_session.movie_id,
+        movie_session.cinema_hall_id,
+        movie_session.cinema_hall.capacity,
+    )
+    if key == key_before_save:
+        return
+
+    tickets_sold = Ticket.objects.filter(
+        movie_session_id=movie_session.id
+    ).count()
+    changes = {}
+    _add_change(
+        changes, key_before_save[:3], -1, -key_before_save[3], -tickets_sold
+    )
+    _add_change(changes, key[:3], 1, key[3], tickets_sold)
+    apply_occupancy_changes(changes)
+
+
+def resize_cinema_hall(cinema_hall) -> None:
+    OccupancySummary.objects.filter(cinema_hall=cinema_hall).update(
+        capacity=F("sessions") * cinema_hall.capacity
+    )
+
+
+def rebuild_occupancy() -> int:
+    """Recompute the whole summary from movie sessions and tickets.
+
+    Returns the number of summary rows written.
+    """
+    summaries = {}
+    movie_sessions = (
+        MovieSession.objects.order_by()
+        .annotate(date=TruncDate("show_time"))
+        .values_list("date", "movie_id", "cinema_hall_id")
+        .annotate(
+            sessions=Count("id"),
+            capacity=Sum(
+                F("cinema_hall__rows") * F("cinema_hall__seats_in_row")
+            ),
+        )
+    )
+    for day, movie_id, cinema_hall_id, sessions, capacity in movie_sessions:
+        summaries[day, movie_id, cinema_hall_id] = OccupancySummary(
+            date=day,
+            movie_id=movie_id,
+            cinema_hall_id=cinema_hall_id,
+            sessions=sessions,
+            capacity=capacity,
+        )
+
+    tickets = (
+        Ticket.objects.order_by()
+        .annotate(date=TruncDate("movie_session__show_time"))
+        .values_list(
+            "date",
+            "movie_session__movie_id",
+            "movie_session__cinema_hall_id",
+        )
+        .annotate(tickets_sold=Count("id"))
+    )
+    for day, movie_id, cinema_hall_id, tickets_sold in tickets:
+        summaries[day, movie_id, cinema_hall_id].tickets_sold = tickets_sold
+
+    with transaction.atomic():
+        OccupancySummary.objects.all().delete()
+        OccupancySummary.objects.bulk_create(
+            summaries.values(), batch_size=REBUILD_BATCH_SIZE
+        )
+    return len(summaries)
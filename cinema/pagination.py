@@ -0,0 +1,166 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class OrderPageNumberPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class OccupancyReportPagination(PageNumberPagination):
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class OrderKeysetPagination(BasePagination):
+    """Cursor pagination keyed on ``(created_at, id)``, newest first.
+
+    Pages are fetched with a range condition on the keyset instead of
+    an offset, and no ``COUNT(*)`` is issued, so every page costs the
+    same regardless of how deep it is.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = remove_query_param(
+            request.build_absolute_uri(), "page"
+        )
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            is_reversed = False
+        else:
+            is_reversed, created_at, pk = cursor
+            if is_reversed:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at)
+                    | Q(created_at=created_at, id__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, id__lt=pk)
+                )
+
+        if is_reversed:
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if is_reversed:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            return (
+                bool(cursor["r"]),
+                datetime.fromisoformat(cursor["c"]),
+                int(cursor["i"]),
+            )
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, order, is_reversed: bool) -> str:
+        cursor = {
+            "r": int(is_reversed),
+            "c": order.created_at.isoformat(),
+            "i": order.id,
+        }
+        encoded = urlsafe_b64encode(json.dumps(cursor).encode("ascii"))
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded.decode("ascii")
+        )
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(self.page[-1], is_reversed=False)
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor(self.page[0], is_reversed=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+class OrderPagination(BasePagination):
+    """Page-number pagination unless the request asks for cursors.
+
+    ``?pagination=cursor`` (or any ``?cursor=``) switches a request to
+    ``OrderKeysetPagination``.
+    """
+
+    mode_query_param = "pagination"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or OrderKeysetPagination.cursor_query_param
+            in request.query_params
+        ):
+            self.paginator = OrderKeysetPagination()
+        else:
+            self.paginator = OrderPageNumberPagination()
+
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
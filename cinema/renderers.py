@@ -0,0 +1,72 @@
+import msgpack
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Dates, times, decimals and other non-JSON values go through DRF's own
+# encoder, so every renderer formats them exactly like JSONRenderer.
+_encode_default = JSONEncoder().default
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+MESSAGEPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class ORJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` output produced by orjson.
+
+    Indented output, requested through the ``indent`` media type
+    parameter, is left to the stdlib encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        content = orjson.dumps(
+            data, default=_encode_default, option=ORJSON_OPTIONS
+        )
+        # JSONRenderer escapes these so the output is valid JavaScript.
+        return content.replace(
+            "\u2028".encode(), b"\\u2028"
+        ).replace("\u2029".encode(), b"\\u2029")
+
+
+class ORJSONParser(JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            content = stream.read()
+            if encoding.lower().replace("-", "") != "utf8":
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except (UnicodeDecodeError, orjson.JSONDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = MESSAGEPACK_MEDIA_TYPE
+    format = "msgpack"  # noqa: VNE003
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = MESSAGEPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (msgpack.UnpackException, ValueError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
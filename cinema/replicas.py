@@ -0,0 +1,145 @@
+import asyncio
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.urls import reverse
+from django.utils.deprecation import MiddlewareMixin
+
+REPLICA_DB_ALIAS = "replica"
+PIN_COOKIE = "cinema_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Alias reads go to during the current request; None means default.
+_read_alias = ContextVar("cinema_read_alias", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def reading_from_default():
+    """Send the block's reads to ``default`` whatever the request allows."""
+    token = _read_alias.set(None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def copy_to_replica(
+    source: str = DEFAULT_DB_ALIAS, replica: str = REPLICA_DB_ALIAS
+) -> None:
+    """Copy the ``source`` SQLite database over the ``replica`` file.
+
+    Uses SQLite's online backup, so the source stays writable and the
+    replica is replaced in one step.
+    """
+    source_connection = connections[source]
+    replica_settings = settings.DATABASES[replica]
+    if (
+        source_connection.vendor != "sqlite"
+        or replica_settings["ENGINE"] != "django.db.backends.sqlite3"
+    ):
+        raise ValueError("Only SQLite databases can be copied to a replica.")
+
+    source_connection.ensure_connection()
+    target = sqlite3.connect(replica_settings["NAME"])
+    try:
+        source_connection.connection.backup(target)
+    finally:
+        target.close()
+
+
+class ReplicaRouter:
+    """Send reads of cinema models to the replica while the request allows.
+
+    Other apps, such as the users and sessions ``request.user`` is
+    loaded from, always read ``default``. Every write goes to
+    ``default`` and pins the rest of the request to it, so reads that
+    follow a write see it.
+    """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != "cinema":
+            return None
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        _read_alias.set(None)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is a copy of default made by ``sync_replica``.
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """Route safe-method requests to the cinema API to the replica.
+
+    A successful unsafe request sets a short-lived cookie that keeps the
+    client's following requests on ``default``, so an order shows up in
+    the list right after it was posted.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.api_prefix = None
+
+    def _read_alias_for(self, request):
+        if not replica_configured() or request.method not in SAFE_METHODS:
+            return None
+        if PIN_COOKIE in request.COOKIES:
+            return None
+        if self.api_prefix is None:
+            self.api_prefix = reverse("cinema:api-root")
+        if not request.path_info.startswith(self.api_prefix):
+            return None
+        return REPLICA_DB_ALIAS
+
+    @staticmethod
+    def _pin(request, response) -> None:
+        if (
+            replica_configured()
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        token = _read_alias.set(self._read_alias_for(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        self._pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        token = _read_alias.set(self._read_alias_for(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+        self._pin(request, response)
+        return response
@@ -0,0 +1,210 @@
+import random
+import time
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.db import IntegrityError, OperationalError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from cinema.models import Order, SeatHold, Ticket
+from cinema.occupancy import record_ticket_sales
+from cinema.seat_maps import take_seats
+
+LOCK_RETRY_DELAYS = (0.02, 0.05, 0.1, 0.2, 0.4, 0.8)
+LOCK_ERROR_MESSAGES = ("database is locked", "database table is locked")
+SEAT_HOLD_TTL = timedelta(minutes=5)
+SWEEP_BATCH_SIZE = 1000
+
+
+class SeatConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Some of the requested seats are already taken."
+    default_code = "seat_conflict"
+
+    def __init__(self, taken_places):
+        super().__init__()
+        self.taken_places = sorted(taken_places)
+        # Kept as plain values so seat numbers render as integers.
+        self.detail = {
+            "detail": self.detail,
+            "taken_places": [
+                {"movie_session": movie_session_id, "row": row, "seat": seat}
+                for movie_session_id, row, seat in self.taken_places
+            ],
+        }
+
+
+def _is_lock_error(error: OperationalError) -> bool:
+    return any(message in str(error) for message in LOCK_ERROR_MESSAGES)
+
+
+def _places(tickets_data) -> set:
+    return {
+        (
+            ticket_data["movie_session"].id,
+            ticket_data["row"],
+            ticket_data["seat"],
+        )
+        for ticket_data in tickets_data
+    }
+
+
+def _places_query(places) -> Q:
+    return reduce(
+        or_,
+        (
+            Q(movie_session_id=movie_session_id, row=row, seat=seat)
+            for movie_session_id, row, seat in places
+        ),
+    )
+
+
+def _taken_places(places) -> set:
+    return set(
+        Ticket.objects.filter(_places_query(places)).values_list(
+            "movie_session_id", "row", "seat"
+        )
+    )
+
+
+def _held_places(places, user, now) -> set:
+    return set(
+        SeatHold.objects.filter(_places_query(places), expires_at__gt=now)
+        .exclude(user=user)
+        .values_list("movie_session_id", "row", "seat")
+    )
+
+
+def _places_by_session(places) -> dict:
+    places_by_session = {}
+    for movie_session_id, row, seat in places:
+        places_by_session.setdefault(movie_session_id, []).append(
+            (row, seat)
+        )
+    return places_by_session
+
+
+def _retry_on_lock(function, *args):
+    for delay in (*LOCK_RETRY_DELAYS, None):
+        try:
+            return function(*args)
+        except OperationalError as error:
+            if delay is None or not _is_lock_error(error):
+                raise
+            time.sleep(delay * random.uniform(0.5, 1.5))
+
+
+def _reserve(user, tickets_data) -> Order:
+    places = _places(tickets_data)
+    now = timezone.now()
+    with transaction.atomic():
+        # Writing first takes SQLite's write lock up front, so the
+        # conflict check below cannot be raced by another order.
+        order = Order.objects.create(user=user)
+
+        taken_places = _taken_places(places) | _held_places(places, user, now)
+        if taken_places:
+            raise SeatConflict(taken_places)
+
+        # The user's own holds on these seats turn into the tickets.
+        SeatHold.objects.filter(_places_query(places)).delete()
+        try:
+            with transaction.atomic():
+                Ticket.objects.bulk_create(
+                    Ticket(order=order, **ticket_data)
+                    for ticket_data in tickets_data
+                )
+        except IntegrityError:
+            raise SeatConflict(_taken_places(places) or places)
+
+        places_by_session = _places_by_session(places)
+        for movie_session_id, session_places in places_by_session.items():
+            take_seats(movie_session_id, session_places)
+        record_ticket_sales(
+            {
+                movie_session_id: len(session_places)
+                for movie_session_id, session_places in (
+                    places_by_session.items()
+                )
+            }
+        )
+
+    return order
+
+
+def reserve_tickets(user, tickets_data) -> Order:
+    """Create an order with ``tickets_data`` for ``user`` atomically.
+
+    Raises ``SeatConflict`` listing every requested seat that is already
+    taken or held by another user. Transient SQLite lock errors are
+    retried with jittered exponential backoff before giving up.
+    """
+    return _retry_on_lock(_reserve, user, tickets_data)
+
+
+def _hold(user, movie_session, seats) -> list:
+    places = {(movie_session.id, row, seat) for row, seat in seats}
+    now = timezone.now()
+    with transaction.atomic():
+        SeatHold.objects.filter(_places_query(places)).filter(
+            Q(expires_at__lte=now) | Q(user=user)
+        ).delete()
+
+        taken_places = _taken_places(places) | _held_places(places, user, now)
+        if taken_places:
+            raise SeatConflict(taken_places)
+
+        try:
+            with transaction.atomic():
+                return SeatHold.objects.bulk_create(
+                    SeatHold(
+                        movie_session=movie_session,
+                        user=user,
+                        row=row,
+                        seat=seat,
+                        expires_at=now + SEAT_HOLD_TTL,
+                    )
+                    for row, seat in sorted(seats)
+                )
+        except IntegrityError:
+            raise SeatConflict(
+                _taken_places(places) | _held_places(places, user, now)
+                or places
+            )
+
+
+def hold_seats(user, movie_session, seats) -> list:
+    """Hold ``seats`` of ``movie_session`` for ``user`` for a few minutes.
+
+    Seats the user already holds get a fresh expiry. Seats with tickets
+    or with another user's active hold raise ``SeatConflict``.
+    """
+    return _retry_on_lock(_hold, user, movie_session, seats)
+
+
+def release_holds(user, movie_session) -> int:
+    deleted, _ = SeatHold.objects.filter(
+        user=user, movie_session=movie_session
+    ).delete()
+    return deleted
+
+
+def sweep_expired_holds(batch_size: int = SWEEP_BATCH_SIZE) -> int:
+    """Delete expired holds ``batch_size`` rows per statement."""
+    now = timezone.now()
+    swept = 0
+    while True:
+        expired_ids = list(
+            SeatHold.objects.filter(expires_at__lte=now)
+            .order_by("expires_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not expired_ids:
+            return swept
+
+        deleted, _ = SeatHold.objects.filter(id__in=expired_ids).delete()
+        swept += deleted
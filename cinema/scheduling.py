@@ -0,0 +1,141 @@
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import transaction
+from django.db.models import F, Max
+
+from cinema.models import Movie, MovieSession
+from cinema.occupancy import record_movie_sessions
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def find_overlaps(intervals) -> list:
+    """Pairs of keys whose intervals overlap in the same cinema hall.
+
+    ``intervals`` are ``(cinema_hall_id, start, end, key)`` tuples. Each
+    hall is sorted by start and swept once, comparing every interval
+    with the one reaching furthest so far, instead of pairwise.
+    """
+    overlaps = []
+    for _, hall_intervals in groupby(
+        sorted(intervals, key=itemgetter(0, 1)), key=itemgetter(0)
+    ):
+        furthest_end, furthest_key = None, None
+        for _, start, end, key in hall_intervals:
+            if furthest_end is not None and start < furthest_end:
+                overlaps.append((furthest_key, key))
+            if furthest_end is None or end > furthest_end:
+                furthest_end, furthest_key = end, key
+    return overlaps
+
+
+def longest_movie_duration() -> timedelta:
+    longest = Movie.objects.aggregate(longest=Max("duration"))["longest"]
+    return timedelta(minutes=longest or 0)
+
+
+def playing_between(queryset, start=None, end=None):
+    """Sessions of ``queryset`` running at some point in ``[start, end)``.
+
+    The lower bound on ``show_time`` derived from the longest movie
+    keeps the ``(show_time, end_time)`` index scan to a narrow range.
+    """
+    if end is not None:
+        queryset = queryset.filter(show_time__lt=end)
+    if start is not None:
+        queryset = queryset.filter(
+            show_time__gt=start - longest_movie_duration(),
+            end_time__gt=start,
+        )
+    return queryset
+
+
+def playing_at(queryset, moment):
+    """Sessions of ``queryset`` on screen at ``moment``."""
+    return queryset.filter(
+        show_time__lte=moment,
+        show_time__gt=moment - longest_movie_duration(),
+        end_time__gt=moment,
+    )
+
+
+def refresh_end_times(movie_ids) -> None:
+    """Recompute ``end_time`` of the sessions of ``movie_ids``."""
+    for movie_id, duration in Movie.objects.filter(
+        id__in=movie_ids
+    ).values_list("id", "duration"):
+        MovieSession.objects.filter(movie_id=movie_id).update(
+            end_time=F("show_time") + timedelta(minutes=duration)
+        )
+
+
+def _existing_intervals(cinema_hall_ids, start, end) -> list:
+    existing = playing_between(
+        MovieSession.objects.filter(cinema_hall_id__in=cinema_hall_ids),
+        start,
+        end,
+    ).values_list("id", "cinema_hall_id", "show_time", "end_time")
+    return [
+        (cinema_hall_id, show_time, end_time, ("existing", movie_session_id))
+        for movie_session_id, cinema_hall_id, show_time, end_time in existing
+    ]
+
+
+def schedule_conflicts(sessions_data) -> dict:
+    """Map positions in ``sessions_data`` to their overlap messages.
+
+    New sessions are checked against each other and against sessions
+    already scheduled in the same halls.
+    """
+    if not sessions_data:
+        return {}
+
+    intervals = [
+        (
+            session_data["cinema_hall"].id,
+            session_data["show_time"],
+            session_data["show_time"]
+            + timedelta(minutes=session_data["movie"].duration),
+            ("new", position),
+        )
+        for position, session_data in enumerate(sessions_data)
+    ]
+    intervals += _existing_intervals(
+        {interval[0] for interval in intervals},
+        min(interval[1] for interval in intervals),
+        max(interval[2] for interval in intervals),
+    )
+
+    def describe(key) -> str:
+        kind, value = key
+        if kind == "existing":
+            return f"movie session {value}"
+        return f"item {value} of this import"
+
+    conflicts = {}
+    for first, second in find_overlaps(intervals):
+        for key, other in ((first, second), (second, first)):
+            if key[0] == "new":
+                conflicts.setdefault(key[1], []).append(
+                    f"Overlaps {describe(other)} in the same cinema hall."
+                )
+    return conflicts
+
+
+def import_movie_sessions(sessions_data) -> list:
+    with transaction.atomic():
+        movie_sessions = MovieSession.objects.bulk_create(
+            (
+                MovieSession(
+                    **session_data,
+                    end_time=session_data["show_time"]
+                    + timedelta(minutes=session_data["movie"].duration),
+                )
+                for session_data in sessions_data
+            ),
+            batch_size=IMPORT_BATCH_SIZE,
+        )
+        record_movie_sessions(movie_sessions)
+    return movie_sessions
@@ -0,0 +1,92 @@
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+MOVIE_FTS_TABLE = "cinema_movie_fts"
+TRIGRAM_LENGTH = 3
+
+
+def movie_fts_available(using: str) -> bool:
+    """Whether the SQLite FTS5 index over movies exists in this database.
+
+    The index is created by a migration on SQLite builds that ship the
+    trigram tokenizer; every other database falls back to ``icontains``.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [MOVIE_FTS_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def filter_movies_by_title(queryset, title: str):
+    """Movies whose title contains ``title``, case-insensitively.
+
+    Trigram phrases shorter than three characters match nothing, so
+    those fall back to ``icontains`` as well.
+    """
+    if len(title) < TRIGRAM_LENGTH or not movie_fts_available(queryset.db):
+        return queryset.filter(title__icontains=title)
+
+    return queryset.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {MOVIE_FTS_TABLE} WHERE title MATCH %s",
+            (_fts_phrase(title),),
+        )
+    )
+
+
+def _filter_words(queryset, words):
+    for word in words:
+        queryset = queryset.filter(
+            Q(title__icontains=word) | Q(description__icontains=word)
+        )
+    return queryset
+
+
+def search_movies(queryset, text: str):
+    """Movies matching every word of ``text``, best matches first.
+
+    Words too short for a trigram are still required, through
+    ``icontains``; the rank comes from the longer ones.
+    """
+    words = text.split()
+    phrases = [
+        _fts_phrase(word) for word in words if len(word) >= TRIGRAM_LENGTH
+    ]
+    if not phrases or not movie_fts_available(queryset.db):
+        return _filter_words(queryset, words)
+
+    queryset = _filter_words(
+        queryset, [word for word in words if len(word) < TRIGRAM_LENGTH]
+    )
+    match = " ".join(phrases)
+    movie_id = f'"{queryset.model._meta.db_table}"."id"'
+    # Both the filter and the rank stay in SQL, so the query does not
+    # grow with the number of matches.
+    return (
+        queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {MOVIE_FTS_TABLE} "
+                f"WHERE {MOVIE_FTS_TABLE} MATCH %s",
+                (match,),
+            )
+        )
+        .annotate(
+            search_rank=RawSQL(
+                f"SELECT rank FROM {MOVIE_FTS_TABLE} "
+                f"WHERE {MOVIE_FTS_TABLE} MATCH %s AND rowid = {movie_id}",
+                (match,),
+            )
+        )
+        .order_by("search_rank", "id")
+    )
@@ -0,0 +1,166 @@
+import base64
+from typing import Iterable, Iterator
+
+from django.db import transaction
+
+
+class SeatBitmap:
+    """Bitset of the occupied seats of a movie session.
+
+    Seats are numbered row-major starting from bit 0 for ``(1, 1)``,
+    least significant bit of each byte first.
+    """
+
+    def __init__(self, rows: int, seats_in_row: int, data=b"") -> None:
+        self.rows = rows
+        self.seats_in_row = seats_in_row
+        size = (rows * seats_in_row + 7) // 8
+        self._bits = bytearray(bytes(data or b"")[:size].ljust(size, b"\0"))
+
+    def _index(self, row: int, seat: int) -> int:
+        if not (
+            1 <= row <= self.rows and 1 <= seat <= self.seats_in_row
+        ):
+            raise IndexError(f"Seat ({row}, {seat}) is out of the hall")
+        return (row - 1) * self.seats_in_row + seat - 1
+
+    def add(self, row: int, seat: int) -> None:
+        index = self._index(row, seat)
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def discard(self, row: int, seat: int) -> None:
+        index = self._index(row, seat)
+        self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __contains__(self, place) -> bool:
+        index = self._index(*place)
+        return bool(self._bits[index >> 3] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def __iter__(self) -> Iterator[tuple]:
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low_bit = byte & -byte
+                index = (byte_index << 3) + low_bit.bit_length() - 1
+                row, seat = divmod(index, self.seats_in_row)
+                yield row + 1, seat + 1
+                byte ^= low_bit
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+    def runs(self) -> list:
+        """Occupied seats as ``[first, last]`` ranges, one list per row."""
+        bits = int.from_bytes(self._bits, "little")
+        row_mask = (1 << self.seats_in_row) - 1
+        runs = []
+        for row in range(self.rows):
+            row_bits = bits >> row * self.seats_in_row & row_mask
+            row_runs = []
+            while row_bits:
+                first = (row_bits & -row_bits).bit_length() - 1
+                shifted = row_bits >> first
+                length = (shifted ^ shifted + 1).bit_length() - 1
+                row_runs.append([first + 1, first + length])
+                row_bits &= ~(((1 << length) - 1) << first)
+            runs.append(row_runs)
+        return runs
+
+    @classmethod
+    def from_runs(cls, rows: int, seats_in_row: int, runs) -> "SeatBitmap":
+        seat_map = cls(rows, seats_in_row)
+        for row, row_runs in enumerate(runs, start=1):
+            for first, last in row_runs:
+                for seat in range(first, last + 1):
+                    seat_map.add(row, seat)
+        return seat_map
+
+
+def seat_map_bitmap(seat_map: SeatBitmap) -> str:
+    return base64.b64encode(seat_map.to_bytes()).decode()
+
+
+# ``?seat_format=`` value to the encoder of a session's occupied seats.
+SEAT_FORMATS = {
+    "rle": SeatBitmap.runs,
+    "bitmap": seat_map_bitmap,
+}
+
+
+def _update_seat_bitmap(
+    movie_session_id: int, places: Iterable[tuple], taken: bool
+) -> None:
+    from cinema.models import MovieSession
+
+    with transaction.atomic():
+        movie_session = (
+            MovieSession.objects.select_for_update()
+            .select_related("cinema_hall")
+            .only(
+                "seat_bitmap",
+                "cinema_hall__rows",
+                "cinema_hall__seats_in_row",
+            )
+            .filter(pk=movie_session_id)
+            .first()
+        )
+        if movie_session is None:
+            return
+
+        seat_map = movie_session.seat_map
+        for row, seat in places:
+            try:
+                if taken:
+                    seat_map.add(row, seat)
+                else:
+                    seat_map.discard(row, seat)
+            except IndexError:
+                continue
+
+        MovieSession.objects.filter(pk=movie_session_id).update(
+            seat_bitmap=seat_map.to_bytes()
+        )
+
+
+def take_seats(movie_session_id: int, places: Iterable[tuple]) -> None:
+    _update_seat_bitmap(movie_session_id, places, taken=True)
+
+
+def release_seats(movie_session_id: int, places: Iterable[tuple]) -> None:
+    _update_seat_bitmap(movie_session_id, places, taken=False)
+
+
+def rebuild_seat_maps(movie_sessions) -> int:
+    """Recompute bitmaps of ``movie_sessions`` from the ``Ticket`` table.
+
+    Returns the number of sessions whose stored bitmap had drifted.
+    """
+    from cinema.models import MovieSession, Ticket
+
+    rebuilt = 0
+    movie_sessions = movie_sessions.select_related("cinema_hall").only(
+        "seat_bitmap", "cinema_hall__rows", "cinema_hall__seats_in_row"
+    )
+    for movie_session in movie_sessions.iterator(chunk_size=500):
+        seat_map = SeatBitmap(
+            movie_session.cinema_hall.rows,
+            movie_session.cinema_hall.seats_in_row,
+        )
+        places = Ticket.objects.filter(
+            movie_session_id=movie_session.id
+        ).values_list("row", "seat")
+        for row, seat in places.iterator():
+            try:
+                seat_map.add(row, seat)
+            except IndexError:
+                continue
+
+        if seat_map.to_bytes() != movie_session.seat_map.to_bytes():
+            MovieSession.objects.filter(pk=movie_session.id).update(
+                seat_bitmap=seat_map.to_bytes()
+            )
+            rebuilt += 1
+
+    return rebuilt
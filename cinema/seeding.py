@@ -0,0 +1,372 @@
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate, islice
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from cinema.caching import bump_cache_version
+from cinema.documents import refresh_movie_documents
+from cinema.models import (
+    Actor,
+    CinemaHall,
+    Genre,
+    Movie,
+    MovieSession,
+    Order,
+    Ticket,
+)
+from cinema.occupancy import rebuild_occupancy
+from cinema.seat_maps import SeatBitmap
+
+SEED_START = datetime(2022, 12, 1, 10)
+FIRST_SHOW = time(10)
+LAST_SHOW = time(23)
+CLEANING_MINUTES = 20
+
+
+def _bulk_create(model, objects, batch_size: int = 1000) -> list:
+    return model.objects.bulk_create(objects, batch_size=batch_size)
+
+
+def seed_catalog(
+    rng: random.Random,
+    halls: int,
+    movies: int,
+    genres: int = 20,
+    actors: int = 100,
+) -> tuple:
+    """Create genres, actors, halls and movies with their M2M rows.
+
+    Returns the created cinema halls and movies.
+    """
+    genre_objects = _bulk_create(
+        Genre, (Genre(name=f"Genre {number}") for number in range(genres))
+    )
+    actor_objects = _bulk_create(
+        Actor,
+        (
+            Actor(first_name=f"First{number}", last_name=f"Last{number}")
+            for number in range(actors)
+        ),
+    )
+    cinema_halls = _bulk_create(
+        CinemaHall,
+        (
+            CinemaHall(
+                name=f"Hall {number}",
+                rows=rng.randint(8, 30),
+                seats_in_row=rng.randint(10, 25),
+            )
+            for number in range(halls)
+        ),
+    )
+    movie_objects = _bulk_create(
+        Movie,
+        (
+            Movie(
+                title=f"Movie {number}",
+                description=f"Synthetic description of movie {number}.",
+                duration=rng.randint(80, 180),
+            )
+            for number in range(movies)
+        ),
+    )
+
+    genre_rows, actor_rows = [], []
+    for movie in movie_objects:
+        for genre in rng.sample(genre_objects, min(3, len(genre_objects))):
+            genre_rows.append(
+                Movie.genres.through(movie_id=movie.id, genre_id=genre.id)
+            )
+        for actor in rng.sample(actor_objects, min(4, len(actor_objects))):
+            actor_rows.append(
+                Movie.actors.through(movie_id=movie.id, actor_id=actor.id)
+            )
+    _bulk_create(Movie.genres.through, genre_rows)
+    _bulk_create(Movie.actors.through, actor_rows)
+    refresh_movie_documents(movie.id for movie in movie_objects)
+
+    return cinema_halls, movie_objects
+
+
+def seed_users(count: int, prefix: str = "seed") -> list:
+    user_model = get_user_model()
+    return _bulk_create(
+        user_model,
+        (
+            user_model(username=f"{prefix}{number}", password="!")
+            for number in range(count)
+        ),
+    )
+
+
+def seed_dataset(
+    halls: int,
+    movies: int,
+    sessions: int,
+    tickets: int,
+    random_seed: int = 0,
+) -> dict:
+    """Seed a small, fully consistent synthetic cinema in one transaction.
+
+    Tickets are bulk-inserted, so seat bitmaps and the occupancy summary
+    are written directly instead of through the ticket signals.
+    """
+    rng = random.Random(random_seed)
+    with transaction.atomic():
+        cinema_halls, movie_objects = seed_catalog(rng, halls, movies)
+        movie_sessions = []
+        for _ in range(sessions):
+            show_time = SEED_START + timedelta(
+                minutes=30 * rng.randrange(48 * 30)
+            )
+            movie = rng.choice(movie_objects)
+            movie_sessions.append(
+                MovieSession(
+                    show_time=show_time,
+                    end_time=show_time + timedelta(minutes=movie.duration),
+                    movie=movie,
+                    cinema_hall=rng.choice(cinema_halls),
+                )
+            )
+        _bulk_create(MovieSession, movie_sessions)
+        users = seed_users(10)
+
+        seat_maps = {
+            movie_session.id: SeatBitmap(
+                movie_session.cinema_hall.rows,
+                movie_session.cinema_hall.seats_in_row,
+            )
+            for movie_session in movie_sessions
+        }
+        ticket_objects = []
+        order = None
+        for _ in range(tickets):
+            movie_session = rng.choice(movie_sessions)
+            seat_map = seat_maps[movie_session.id]
+            if len(seat_map) == movie_session.cinema_hall.capacity:
+                continue
+            while True:
+                place = (
+                    rng.randint(1, seat_map.rows),
+                    rng.randint(1, seat_map.seats_in_row),
+                )
+                if place not in seat_map:
+                    break
+            seat_map.add(*place)
+            if order is None or rng.random() < 0.3:
+                order = Order.objects.create(user=rng.choice(users))
+            ticket_objects.append(
+                Ticket(
+                    movie_session=movie_session,
+                    order=order,
+                    row=place[0],
+                    seat=place[1],
+                )
+            )
+        _bulk_create(Ticket, ticket_objects)
+
+        for movie_session in movie_sessions:
+            movie_session.seat_bitmap = seat_maps[movie_session.id].to_bytes()
+        MovieSession.objects.bulk_update(
+            movie_sessions, ["seat_bitmap"], batch_size=500
+        )
+        rebuild_occupancy()
+
+    for model in (Genre, Actor, CinemaHall, Movie):
+        bump_cache_version(model)
+
+    return {
+        "halls": halls,
+        "movies": movies,
+        "sessions": sessions,
+        "tickets": len(ticket_objects),
+    }
+
+
+def _popularity_weights(rng: random.Random, count: int) -> list:
+    """Zipf-like popularity: a few blockbusters and a long tail."""
+    weights = [1 / (rank + 1) ** 0.8 for rank in range(count)]
+    rng.shuffle(weights)
+    return weights
+
+
+def _occupancy(
+    rng: random.Random,
+    show_time: datetime,
+    popularity: float,
+    mean_occupancy: float,
+) -> float:
+    """Share of sold seats for one show.
+
+    A beta distribution around ``mean_occupancy`` is scaled up for
+    evening and weekend shows and for popular movies.
+    """
+    concentration = 4
+    occupancy = rng.betavariate(
+        mean_occupancy * concentration, (1 - mean_occupancy) * concentration
+    )
+    if 18 <= show_time.hour < 22:
+        occupancy *= 1.4
+    elif show_time.hour < 14:
+        occupancy *= 0.6
+    if show_time.weekday() >= 5:
+        occupancy *= 1.25
+    occupancy *= 0.6 + popularity
+    return min(occupancy, 1.0)
+
+
+def _pick_seats(
+    rng: random.Random, rows: int, seats_in_row: int, count: int
+) -> list:
+    """Seats taken first are the central ones, with some noise."""
+    middle_row, middle_seat = rows * 0.6, (seats_in_row + 1) / 2
+    places = sorted(
+        (
+            abs(row - middle_row) / rows
+            + abs(seat - middle_seat) / seats_in_row
+            + rng.random() * 0.5,
+            row,
+            seat,
+        )
+        for row in range(1, rows + 1)
+        for seat in range(1, seats_in_row + 1)
+    )
+    return sorted((row, seat) for _, row, seat in places[:count])
+
+
+def _schedule(
+    rng: random.Random,
+    cinema_halls: list,
+    movies: list,
+    weights: list,
+    start: date,
+    sessions: int,
+):
+    """Yield non-overlapping ``(show_time, movie, cinema_hall)`` triples.
+
+    Every hall plays back-to-back shows from 10:00 to 23:00, day by day,
+    until ``sessions`` shows are scheduled.
+    """
+    cum_weights = list(accumulate(weights))
+    scheduled = 0
+    day = start
+    while True:
+        for cinema_hall in cinema_halls:
+            show_time = datetime.combine(day, FIRST_SHOW)
+            while show_time.time() <= LAST_SHOW:
+                if scheduled == sessions:
+                    return
+                movie = rng.choices(movies, cum_weights=cum_weights)[0]
+                yield show_time, movie, cinema_hall
+                scheduled += 1
+                minutes = movie.duration + CLEANING_MINUTES
+                show_time += timedelta(minutes=minutes + (-minutes) % 5)
+        day += timedelta(days=1)
+
+
+def seed_scale(
+    halls: int,
+    movies: int,
+    sessions: int,
+    users: int,
+    start: date,
+    mean_occupancy: float = 0.45,
+    chunk_size: int = 200,
+    batch_size: int = 2000,
+    random_seed: int = 0,
+    progress=None,
+) -> dict:
+    """Seed a production-sized dataset with realistic occupancy.
+
+    Sessions are generated lazily and written ``chunk_size`` at a time,
+    each chunk in its own transaction with batched ``bulk_create``, so
+    memory stays bounded by the chunk rather than the ticket count.
+    """
+    rng = random.Random(random_seed)
+    with transaction.atomic():
+        cinema_halls, movie_objects = seed_catalog(rng, halls, movies)
+        user_ids = [user.id for user in seed_users(users)]
+    weights = _popularity_weights(rng, len(movie_objects))
+    popularity = {
+        movie.id: weight / max(weights)
+        for movie, weight in zip(movie_objects, weights)
+    }
+
+    schedule = _schedule(
+        rng, cinema_halls, movie_objects, weights, start, sessions
+    )
+    totals = {"sessions": 0, "orders": 0, "tickets": 0}
+    while True:
+        chunk = list(islice(schedule, chunk_size))
+        if not chunk:
+            break
+
+        with transaction.atomic():
+            movie_sessions, chunk_places = [], []
+            for show_time, movie, cinema_hall in chunk:
+                occupancy = _occupancy(
+                    rng, show_time, popularity[movie.id], mean_occupancy
+                )
+                places = _pick_seats(
+                    rng,
+                    cinema_hall.rows,
+                    cinema_hall.seats_in_row,
+                    round(occupancy * cinema_hall.capacity),
+                )
+                seat_map = SeatBitmap(
+                    cinema_hall.rows, cinema_hall.seats_in_row
+                )
+                for place in places:
+                    seat_map.add(*place)
+                movie_sessions.append(
+                    MovieSession(
+                        show_time=show_time,
+                        end_time=show_time
+                        + timedelta(minutes=movie.duration),
+                        movie=movie,
+                        cinema_hall=cinema_hall,
+                        seat_bitmap=seat_map.to_bytes(),
+                    )
+                )
+                chunk_places.append(places)
+            _bulk_create(MovieSession, movie_sessions, batch_size)
+
+            groups = []
+            for movie_session, places in zip(movie_sessions, chunk_places):
+                while places:
+                    size = rng.choices((1, 2, 3, 4, 5), (3, 6, 2, 3, 1))[0]
+                    groups.append((movie_session, places[:size]))
+                    places = places[size:]
+            orders = _bulk_create(
+                Order,
+                (Order(user_id=rng.choice(user_ids)) for _ in groups),
+                batch_size,
+            )
+            tickets = _bulk_create(
+                Ticket,
+                (
+                    Ticket(
+                        movie_session=movie_session,
+                        order=order,
+                        row=row,
+                        seat=seat,
+                    )
+                    for order, (movie_session, places) in zip(orders, groups)
+                    for row, seat in places
+                ),
+                batch_size,
+            )
+
+        totals["sessions"] += len(movie_sessions)
+        totals["orders"] += len(orders)
+        totals["tickets"] += len(tickets)
+        if progress is not None:
+            progress(totals)
+
+    rebuild_occupancy()
+    for model in (Genre, Actor, CinemaHall, Movie):
+        bump_cache_version(model)
+
+    return totals
@@ -1,40 +1,70 @@
 from rest_framework import serializers
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from cinema.fieldsets import SparseFieldsetMixin
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    OccupancySummary,
+    Order,
+    SeatHold,
+    Ticket,
+)
+from cinema.reservations import reserve_tickets
+from cinema.scheduling import import_movie_sessions, schedule_conflicts
+from cinema.seat_maps import SEAT_FORMATS
 
+SEAT_COUNT_LOOKUPS = ("cinema_hall__rows", "cinema_hall__seats_in_row")
+# Seat bitmap and active holds behind a session's occupied seats.
+TAKEN_PLACES_LOOKUPS = (*SEAT_COUNT_LOOKUPS, "seat_bitmap", "holds")
 
-class GenreSerializer(serializers.ModelSerializer):
+
+class GenreSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Genre
         fields = ("id", "name")
 
 
-class ActorSerializer(serializers.ModelSerializer):
+class ActorSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Actor
         fields = ("id", "first_name", "last_name", "full_name")
+        fieldset_lookups = {"full_name": ("first_name", "last_name")}
 
 
-class CinemaHallSerializer(serializers.ModelSerializer):
+class CinemaHallSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = CinemaHall
         fields = ("id", "name", "rows", "seats_in_row", "capacity")
+        fieldset_lookups = {"capacity": ("rows", "seats_in_row")}
 
 
-class MovieSerializer(serializers.ModelSerializer):
+class MovieSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Movie
         fields = ("id", "title", "description", "duration", "genres", "actors")
 
 
 class MovieListSerializer(MovieSerializer):
-    genres = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field="name"
+    genres = serializers.ListField(
+        source="genre_names", child=serializers.CharField(), read_only=True
     )
-    actors = serializers.SlugRelatedField(
-        many=True, read_only=True, slug_field="full_name"
+    actors = serializers.ListField(
+        source="actor_names", child=serializers.CharField(), read_only=True
     )
 
+    class Meta(MovieSerializer.Meta):
+        fieldset_lookups = {
+            "genres": ("document__genres",),
+            "actors": ("document__actors",),
+        }
+        expandable_fields = {
+            "genres": (GenreSerializer, {"many": True, "read_only": True}),
+            "actors": (ActorSerializer, {"many": True, "read_only": True}),
+        }
+
 
 class MovieDetailSerializer(MovieSerializer):
     genres = GenreSerializer(many=True, read_only=True)
@@ -45,7 +75,7 @@ class MovieDetailSerializer(MovieSerializer):
         fields = ("id", "title", "description", "duration", "genres", "actors")
 
 
-class MovieSessionSerializer(serializers.ModelSerializer):
+class MovieSessionSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = MovieSession
         fields = ("id", "show_time", "movie", "cinema_hall")
@@ -57,8 +87,9 @@ class MovieSessionListSerializer(MovieSessionSerializer):
         source="cinema_hall.name", read_only=True
     )
     cinema_hall_capacity = serializers.IntegerField(
-        source="cinema_hall.capacity", read_only=True
+        source="capacity", read_only=True
     )
+    tickets_available = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MovieSession
@@ -68,13 +99,260 @@ class MovieSessionListSerializer(MovieSessionSerializer):
             "movie_title",
             "cinema_hall_name",
             "cinema_hall_capacity",
+            "tickets_available",
         )
+        fieldset_lookups = {
+            "cinema_hall_capacity": SEAT_COUNT_LOOKUPS,
+            "tickets_available": TAKEN_PLACES_LOOKUPS,
+        }
+        expandable_fields = {
+            "movie": (MovieListSerializer, {"read_only": True}),
+            "cinema_hall": (CinemaHallSerializer, {"read_only": True}),
+        }
+
+
+class TakenPlaceSerializer(SparseFieldsetMixin, serializers.Serializer):
+    row = serializers.IntegerField()
+    seat = serializers.IntegerField()
+
+
+class SeatMapField(serializers.ReadOnlyField):
+    """Occupied seats of a session in one of the ``SEAT_FORMATS``."""
+
+    def __init__(self, seat_format, **kwargs):
+        kwargs.setdefault("source", "occupied_seat_map")
+        super().__init__(**kwargs)
+        self.encode = SEAT_FORMATS[seat_format]
+
+    def to_representation(self, value):
+        return self.encode(value)
 
 
 class MovieSessionDetailSerializer(MovieSessionSerializer):
     movie = MovieListSerializer(many=False, read_only=True)
     cinema_hall = CinemaHallSerializer(many=False, read_only=True)
+    taken_places = TakenPlaceSerializer(many=True, read_only=True)
 
     class Meta:
         model = MovieSession
-        fields = ("id", "show_time", "movie", "cinema_hall")
+        fields = ("id", "show_time", "movie", "cinema_hall", "taken_places")
+        fieldset_lookups = {"taken_places": TAKEN_PLACES_LOOKUPS}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        seat_format = self.context.get("seat_format")
+        if seat_format and "taken_places" in fields:
+            fields["taken_places"] = SeatMapField(seat_format)
+        return fields
+
+
+class PrefetchedPrimaryKeyField(serializers.PrimaryKeyRelatedField):
+    """Resolves objects prefetched by the parent serializer.
+
+    The parent puts ``{pk: instance}`` into ``context[context_key]``, so
+    validating many rows does not query once per row.
+    """
+
+    def __init__(self, context_key: str, **kwargs):
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get(self.context_key)
+        if prefetched is None:
+            return super().to_internal_value(data)
+
+        try:
+            return prefetched[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+def _related_ids(items, field: str) -> set:
+    ids = set()
+    for item in items:
+        try:
+            ids.add(int(item[field]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return ids
+
+
+class MovieSessionImportItemSerializer(MovieSessionSerializer):
+    movie = PrefetchedPrimaryKeyField(
+        "movies", queryset=Movie.objects.only("id", "duration")
+    )
+    cinema_hall = PrefetchedPrimaryKeyField(
+        "cinema_halls", queryset=CinemaHall.objects.all()
+    )
+
+
+class MovieSessionImportSerializer(serializers.Serializer):
+    movie_sessions = MovieSessionImportItemSerializer(
+        many=True, allow_empty=False
+    )
+
+    def to_internal_value(self, data):
+        items = data.get("movie_sessions") if hasattr(data, "get") else None
+        if not isinstance(items, list):
+            items = []
+
+        self.context["movies"] = Movie.objects.only(
+            "id", "duration"
+        ).in_bulk(_related_ids(items, "movie"))
+        self.context["cinema_halls"] = CinemaHall.objects.in_bulk(
+            _related_ids(items, "cinema_hall")
+        )
+        return super().to_internal_value(data)
+
+    def validate_movie_sessions(self, sessions_data):
+        conflicts = schedule_conflicts(sessions_data)
+        if conflicts:
+            raise serializers.ValidationError(
+                [
+                    {"non_field_errors": conflicts[position]}
+                    if position in conflicts
+                    else {}
+                    for position in range(len(sessions_data))
+                ]
+            )
+
+        return sessions_data
+
+    def create(self, validated_data):
+        return import_movie_sessions(validated_data["movie_sessions"])
+
+
+class TicketSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    movie_session = PrefetchedPrimaryKeyField(
+        "movie_sessions",
+        queryset=MovieSession.objects.select_related("cinema_hall"),
+    )
+
+    class Meta:
+        model = Ticket
+        fields = ("id", "row", "seat", "movie_session")
+        validators = []
+
+    def validate(self, attrs):
+        data = super(TicketSerializer, self).validate(attrs)
+        Ticket.validate_ticket(
+            attrs["row"],
+            attrs["seat"],
+            attrs["movie_session"].cinema_hall,
+            serializers.ValidationError,
+        )
+        return data
+
+
+class TicketListSerializer(TicketSerializer):
+    movie_session = MovieSessionListSerializer(many=False, read_only=True)
+
+
+class OrderSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
+
+    class Meta:
+        model = Order
+        fields = ("id", "tickets", "created_at")
+
+    def to_internal_value(self, data):
+        items = data.get("tickets") if hasattr(data, "get") else None
+        if not isinstance(items, list):
+            items = []
+
+        self.context["movie_sessions"] = (
+            MovieSession.objects.select_related("cinema_hall")
+            .in_bulk(_related_ids(items, "movie_session"))
+        )
+        return super().to_internal_value(data)
+
+    def validate_tickets(self, tickets_data):
+        errors = []
+        places = set()
+        for ticket_data in tickets_data:
+            place = (
+                ticket_data["movie_session"].id,
+                ticket_data["row"],
+                ticket_data["seat"],
+            )
+            if place in places:
+                errors.append(
+                    {
+                        "non_field_errors": [
+                            "The same seat is requested more than once."
+                        ]
+                    }
+                )
+            else:
+                errors.append({})
+            places.add(place)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return tickets_data
+
+    def create(self, validated_data):
+        return reserve_tickets(
+            validated_data["user"], validated_data["tickets"]
+        )
+
+
+class OrderListSerializer(OrderSerializer):
+    tickets = TicketListSerializer(many=True, read_only=True)
+
+
+class SeatHoldSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = SeatHold
+        fields = ("id", "row", "seat", "expires_at")
+
+
+class SeatHoldCreateSerializer(serializers.Serializer):
+    seats = TakenPlaceSerializer(many=True, allow_empty=False)
+
+    def validate_seats(self, seats):
+        cinema_hall = self.context["movie_session"].cinema_hall
+        places = set()
+        for seat_data in seats:
+            Ticket.validate_ticket(
+                seat_data["row"],
+                seat_data["seat"],
+                cinema_hall,
+                serializers.ValidationError,
+            )
+            places.add((seat_data["row"], seat_data["seat"]))
+
+        if len(places) != len(seats):
+            raise serializers.ValidationError(
+                "The same seat is requested more than once."
+            )
+
+        return places
+
+
+class OccupancySummarySerializer(
+    SparseFieldsetMixin, serializers.ModelSerializer
+):
+    movie_title = serializers.CharField(source="movie.title", read_only=True)
+    cinema_hall_name = serializers.CharField(
+        source="cinema_hall.name", read_only=True
+    )
+    occupancy = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = OccupancySummary
+        fields = (
+            "date",
+            "movie",
+            "movie_title",
+            "cinema_hall",
+            "cinema_hall_name",
+            "sessions",
+            "capacity",
+            "tickets_sold",
+            "occupancy",
+        )
@@ -0,0 +1,214 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from cinema.caching import bump_cache_version
+from cinema.documents import refresh_movie_documents_on_commit
+from cinema.models import (
+    Actor,
+    CinemaHall,
+    Genre,
+    Movie,
+    MovieSession,
+    Ticket,
+)
+from cinema.occupancy import (
+    move_movie_session,
+    record_movie_sessions,
+    record_ticket_sales,
+    resize_cinema_hall,
+    session_occupancy_key,
+)
+from cinema.scheduling import refresh_end_times
+from cinema.seat_maps import rebuild_seat_maps, release_seats, take_seats
+from cinema.sqlite import configure_connection
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    configure_connection(connection)
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_ticket_place(sender, instance, raw, **kwargs):
+    instance._place_before_save = None
+    if instance.pk and not raw:
+        instance._place_before_save = (
+            Ticket.objects.filter(pk=instance.pk)
+            .values_list("movie_session_id", "row", "seat")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Ticket)
+def take_ticket_seat(sender, instance, **kwargs):
+    place_before_save = getattr(instance, "_place_before_save", None)
+    if place_before_save:
+        movie_session_id, row, seat = place_before_save
+        release_seats(movie_session_id, [(row, seat)])
+
+    take_seats(instance.movie_session_id, [(instance.row, instance.seat)])
+
+
+@receiver(post_delete, sender=Ticket)
+def release_ticket_seat(sender, instance, **kwargs):
+    release_seats(instance.movie_session_id, [(instance.row, instance.seat)])
+
+
+@receiver(post_save, sender=Ticket)
+def count_ticket_sale(sender, instance, created, **kwargs):
+    place_before_save = getattr(instance, "_place_before_save", None)
+    if created:
+        record_ticket_sales({instance.movie_session_id: 1})
+    elif place_before_save and (
+        place_before_save[0] != instance.movie_session_id
+    ):
+        record_ticket_sales(
+            {place_before_save[0]: -1, instance.movie_session_id: 1}
+        )
+
+
+@receiver(post_delete, sender=Ticket)
+def uncount_ticket_sale(sender, instance, **kwargs):
+    record_ticket_sales({instance.movie_session_id: -1})
+
+
+@receiver(pre_save, sender=MovieSession)
+def remember_session_occupancy_key(sender, instance, raw, **kwargs):
+    instance._occupancy_key_before_save = None
+    if instance.pk and not raw:
+        instance._occupancy_key_before_save = session_occupancy_key(
+            instance.pk
+        )
+
+
+@receiver(post_save, sender=MovieSession)
+def count_movie_session(sender, instance, created, **kwargs):
+    key_before_save = getattr(instance, "_occupancy_key_before_save", None)
+    if key_before_save:
+        move_movie_session(key_before_save, instance)
+    elif created:
+        record_movie_sessions([instance])
+
+
+@receiver(post_save, sender=MovieSession)
+def move_seat_map(sender, instance, **kwargs):
+    key_before_save = getattr(instance, "_occupancy_key_before_save", None)
+    if key_before_save and key_before_save[2] != instance.cinema_hall_id:
+        rebuild_seat_maps(MovieSession.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=MovieSession)
+def uncount_movie_session(sender, instance, **kwargs):
+    record_movie_sessions([instance], sign=-1)
+
+
+@receiver(post_save, sender=CinemaHall)
+def resize_hall_occupancy(sender, instance, created, raw, **kwargs):
+    if not created and not raw:
+        resize_cinema_hall(instance)
+
+
+@receiver(post_save, sender=CinemaHall)
+def resize_seat_maps(sender, instance, created, raw, **kwargs):
+    if not created and not raw:
+        rebuild_seat_maps(MovieSession.objects.filter(cinema_hall=instance))
+
+
+@receiver(post_save, sender=Movie)
+def create_movie_document(sender, instance, created, **kwargs):
+    if created:
+        refresh_movie_documents_on_commit([instance.id])
+
+
+@receiver(pre_save, sender=Movie)
+def remember_movie_duration(sender, instance, raw, **kwargs):
+    instance._duration_before_save = None
+    if instance.pk and not raw:
+        instance._duration_before_save = (
+            Movie.objects.filter(pk=instance.pk)
+            .values_list("duration", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Movie)
+def refresh_session_end_times(sender, instance, created, **kwargs):
+    duration_before_save = getattr(instance, "_duration_before_save", None)
+    if not created and duration_before_save not in (
+        None,
+        instance.duration,
+    ):
+        refresh_end_times([instance.id])
+
+
+@receiver(m2m_changed, sender=Movie.genres.through)
+@receiver(m2m_changed, sender=Movie.actors.through)
+def refresh_changed_movie_documents(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_movie_documents_on_commit([instance.id])
+        return
+
+    if action == "pre_clear":
+        instance._cleared_movie_ids = list(
+            instance.movie_set.values_list("id", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        refresh_movie_documents_on_commit(pk_set)
+    elif action == "post_clear":
+        refresh_movie_documents_on_commit(
+            instance.__dict__.pop("_cleared_movie_ids")
+        )
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_save, sender=Actor)
+def refresh_related_movie_documents(sender, instance, created, **kwargs):
+    if not created:
+        refresh_movie_documents_on_commit(
+            instance.movie_set.values_list("id", flat=True)
+        )
+
+
+@receiver(pre_delete, sender=Genre)
+@receiver(pre_delete, sender=Actor)
+def remember_related_movies(sender, instance, **kwargs):
+    instance._related_movie_ids = list(
+        instance.movie_set.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Genre)
+@receiver(post_delete, sender=Actor)
+def refresh_movie_documents_after_delete(sender, instance, **kwargs):
+    refresh_movie_documents_on_commit(
+        getattr(instance, "_related_movie_ids", [])
+    )
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_save, sender=Actor)
+@receiver(post_save, sender=CinemaHall)
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Genre)
+@receiver(post_delete, sender=Actor)
+@receiver(post_delete, sender=CinemaHall)
+@receiver(post_delete, sender=Movie)
+def invalidate_catalog_cache(sender, **kwargs):
+    bump_cache_version(sender)
+
+
+@receiver(m2m_changed, sender=Movie.genres.through)
+@receiver(m2m_changed, sender=Movie.actors.through)
+def invalidate_movie_cache(sender, action, **kwargs):
+    if action.startswith("post_"):
+        bump_cache_version(Movie)
@@ -0,0 +1,20 @@
+from django.conf import settings
+
+
+def apply_pragmas(cursor, pragmas: dict) -> None:
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def configure_connection(connection) -> None:
+    """Apply ``settings.SQLITE_PRAGMAS`` to a new SQLite connection.
+
+    Pragmas are per connection, so this runs on ``connection_created``.
+    In-memory databases ignore the WAL journal mode.
+    """
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", {})
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, pragmas)
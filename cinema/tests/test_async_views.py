@@ -0,0 +1,121 @@
+import json
+from unittest import mock
+
+from django.test import AsyncClient, TestCase
+
+from cinema.async_views import AsyncReadView
+
+from cinema.models import (
+    Actor,
+    CinemaHall,
+    Genre,
+    Movie,
+    MovieDocument,
+    MovieSession,
+    Order,
+    Ticket,
+)
+from user.models import User
+
+
+class AsyncReadViewTests(TestCase):
+    def setUp(self):
+        self.async_client = AsyncClient()
+        drama = Genre.objects.create(name="Drama")
+        actor = Actor.objects.create(first_name="Kate", last_name="Winslet")
+        # The async detail views read names from the movie's document.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie = Movie.objects.create(
+                title="Titanic",
+                description="Titanic description",
+                duration=123,
+            )
+            self.movie.genres.add(drama)
+            self.movie.actors.add(actor)
+        cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.movie_session = MovieSession.objects.create(
+            show_time="2022-09-02 18:00:00",
+            movie=self.movie,
+            cinema_hall=cinema_hall,
+        )
+        user = User.objects.create_user(username="user", password="pass")
+        Ticket.objects.create(
+            movie_session=self.movie_session,
+            order=Order.objects.create(user=user),
+            row=2,
+            seat=3,
+        )
+
+    async def test_responses_match_sync_viewsets(self):
+        paths = [
+            "genres/",
+            "actors/",
+            "movies/",
+            "movies/?title=itan",
+            f"movies/{self.movie.id}/",
+            "movie_sessions/",
+            f"movie_sessions/{self.movie_session.id}/",
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                sync_response = await self.async_client.get(
+                    f"/api/cinema/{path}", HTTP_ACCEPT="application/json"
+                )
+                async_response = await self.async_client.get(
+                    f"/api/cinema/async/{path}"
+                )
+                self.assertEqual(async_response.status_code, 200)
+                self.assertEqual(
+                    json.loads(async_response.content),
+                    json.loads(sync_response.content),
+                )
+
+    async def test_movie_list_reads_through_async_orm(self):
+        await MovieDocument.objects.filter(movie=self.movie).adelete()
+
+        with mock.patch(
+            "cinema.async_views.sync_to_async",
+            side_effect=AssertionError("sync_to_async was used"),
+        ):
+            response = await self.async_client.get("/api/cinema/async/movies/")
+
+        self.assertEqual(
+            json.loads(response.content)[0]["actors"], ["Kate Winslet"]
+        )
+        self.assertEqual(json.loads(response.content)[0]["genres"], ["Drama"])
+
+    async def test_missing_object_returns_404(self):
+        response = await self.async_client.get(
+            "/api/cinema/async/movie_sessions/0/"
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.content), {"detail": "Not found."})
+
+    async def test_only_plain_json_reads_are_served(self):
+        # AsyncClient in Django 4.1 takes raw ASGI header names.
+        not_acceptable = await self.async_client.get(
+            "/api/cinema/async/genres/",
+            ACCEPT="application/msgpack",
+        )
+        sparse = await self.async_client.get(
+            "/api/cinema/async/movies/", {"fields": "title"}
+        )
+        any_type = await self.async_client.get(
+            "/api/cinema/async/genres/", ACCEPT="*/*"
+        )
+
+        self.assertEqual(not_acceptable.status_code, 406)
+        self.assertEqual(sparse.status_code, 400)
+        self.assertIn("fields", json.loads(sparse.content))
+        self.assertEqual(any_type.status_code, 200)
+
+    def test_read_views_must_define_their_querysets(self):
+        class IncompleteView(AsyncReadView):
+            async def get_list_queryset(self, query_params):
+                return Genre.objects.all()
+
+        with self.assertRaises(TypeError):
+            IncompleteView()
@@ -0,0 +1,105 @@
+import json
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from cinema.fast_lists import movie_list_data, movie_session_list_data
+from cinema.models import (
+    Actor,
+    Genre,
+    Movie,
+    MovieDocument,
+    MovieSession,
+    SeatHold,
+)
+from cinema.seeding import SEED_START, seed_dataset
+from cinema.serializers import (
+    MovieListSerializer,
+    MovieSessionListSerializer,
+)
+from cinema.views import movie_list_queryset, movie_session_list_queryset
+from user.models import User
+
+
+def _json(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+class FastListParityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed_dataset(halls=3, movies=12, sessions=40, tickets=600)
+        # A movie whose document is missing falls back to its relations.
+        movie = Movie.objects.create(
+            title="Undocumented", description="No document", duration=90
+        )
+        MovieDocument.objects.filter(movie=movie).delete()
+        movie.genres.add(*Genre.objects.all()[:2])
+        movie.actors.add(*Actor.objects.all()[:3])
+        movie_session = MovieSession.objects.first()
+        SeatHold.objects.create(
+            movie_session=movie_session,
+            user=User.objects.first(),
+            row=movie_session.cinema_hall.rows,
+            seat=movie_session.cinema_hall.seats_in_row,
+            expires_at=datetime.now() + timedelta(minutes=5),
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_movie_list_matches_serializer(self):
+        genre_ids = ",".join(
+            str(genre_id)
+            for genre_id in Genre.objects.values_list("id", flat=True)[:2]
+        )
+        for query_string in ("", f"genres={genre_ids}", "title=movie 1"):
+            with self.subTest(query_string=query_string):
+                queryset = movie_list_queryset(QueryDict(query_string))
+
+                self.assertEqual(
+                    _json(movie_list_data(queryset)),
+                    _json(MovieListSerializer(queryset, many=True).data),
+                )
+
+    def test_movie_session_list_matches_serializer(self):
+        for query_string in (
+            "",
+            f"date={SEED_START.date() + timedelta(days=1)}",
+            f"movie={Movie.objects.first().id}",
+        ):
+            with self.subTest(query_string=query_string):
+                queryset = movie_session_list_queryset(QueryDict(query_string))
+
+                self.assertEqual(
+                    _json(movie_session_list_data(queryset)),
+                    _json(
+                        MovieSessionListSerializer(queryset, many=True).data
+                    ),
+                )
+
+    def test_list_endpoints_use_one_query(self):
+        for url in ("/api/cinema/movies/", "/api/cinema/movie_sessions/"):
+            with self.subTest(url=url):
+                with self.assertNumQueries(1):
+                    self.client.get(url, {"title": "mo"})
+
+    def test_sparse_fieldsets_keep_serializer_path(self):
+        response = self.client.get(
+            "/api/cinema/movies/", {"fields": "title,genres", "title": "Un"}
+        )
+
+        self.assertEqual(
+            response.json(),
+            [
+                {
+                    "title": "Undocumented",
+                    "genres": list(
+                        Genre.objects.values_list("name", flat=True)[:2]
+                    ),
+                }
+            ],
+        )
@@ -0,0 +1,71 @@
+import io
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from cinema.fixture_loader import FixtureError, iter_json_array, load_fixture
+from cinema.models import (
+    CinemaHall,
+    Movie,
+    MovieDocument,
+    MovieSession,
+    Order,
+    Ticket,
+)
+from cinema.seat_maps import rebuild_seat_maps
+
+FIXTURE_PATH = settings.BASE_DIR / "cinema_service_db_data.json"
+
+
+class IterJsonArrayTests(TestCase):
+    def test_items_split_across_reads(self):
+        items = [{"model": "cinema.genre", "pk": pk} for pk in range(20)]
+        stream = io.StringIO(json.dumps(items, indent=2))
+
+        self.assertEqual(list(iter_json_array(stream, read_size=7)), items)
+
+    def test_truncated_array_is_rejected(self):
+        with self.assertRaises(FixtureError):
+            list(iter_json_array(io.StringIO('[{"pk": 1}, {"pk"'), 4))
+
+
+class LoadFixtureTests(TestCase):
+    def test_shipped_fixture_is_loaded_consistently(self):
+        with open(FIXTURE_PATH) as stream:
+            counts = load_fixture(stream, batch_size=3, read_size=512)
+
+        self.assertEqual(counts["cinema.ticket"], 16)
+        self.assertEqual(CinemaHall.objects.count(), 4)
+        self.assertEqual(MovieSession.objects.count(), 8)
+        self.assertEqual(Ticket.objects.count(), 16)
+        self.assertEqual(get_user_model().objects.count(), 3)
+        self.assertEqual(
+            MovieDocument.objects.count(), Movie.objects.count()
+        )
+        self.assertEqual(
+            Movie.objects.get(pk=1).genre_names,
+            list(
+                Movie.objects.get(pk=1).genres.values_list("name", flat=True)
+            ),
+        )
+        self.assertEqual(rebuild_seat_maps(MovieSession.objects.all()), 0)
+        self.assertEqual(
+            Order.objects.get(pk=1).created_at,
+            datetime(2022, 8, 9, 9, 6, 18, 876000),
+        )
+
+    def test_validation_rolls_back_tickets_outside_of_hall(self):
+        with open(FIXTURE_PATH) as stream:
+            records = json.load(stream)
+        for record in records:
+            if record["model"] == "cinema.ticket":
+                record["fields"]["row"] = 1000
+                break
+
+        with self.assertRaises(FixtureError):
+            load_fixture(io.StringIO(json.dumps(records)), validate=True)
+        self.assertFalse(Ticket.objects.exists())
+        self.assertFalse(CinemaHall.objects.exists())
@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from cinema.models import CinemaHall, Genre, Movie, MovieSession
+from cinema_service.metrics import collect
+
+LIST_KEY = ("moviesession-list", "GET")
+
+
+class MetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=123
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        MovieSession.objects.create(
+            show_time="2022-09-02 18:00:00",
+            movie=movie,
+            cinema_hall=cinema_hall,
+        )
+
+    def _stats(self, key):
+        stats = collect().get(key)
+        if stats is None:
+            return 0, 0
+        return sum(stats.statuses.values()), stats.queries
+
+    def test_requests_and_queries_are_counted_per_route(self):
+        requests_before, queries_before = self._stats(LIST_KEY)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/cinema/movie_sessions/")
+        self.assertEqual(response.status_code, 200)
+
+        requests_after, queries_after = self._stats(LIST_KEY)
+        self.assertEqual(requests_after - requests_before, 1)
+        self.assertEqual(queries_after - queries_before, len(queries))
+
+    def test_create_is_labelled_separately_from_list(self):
+        requests_before, _ = self._stats(("genre-create", "POST"))
+
+        self.client.post("/api/cinema/genres/", {"name": "Drama"})
+
+        requests_after, _ = self._stats(("genre-create", "POST"))
+        self.assertEqual(requests_after - requests_before, 1)
+        self.assertTrue(Genre.objects.filter(name="Drama").exists())
+
+    def test_metrics_endpoint_renders_prometheus_text(self):
+        self.client.get("/api/cinema/movie_sessions/")
+
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn(
+            "cinema_http_requests_total"
+            '{route="moviesession-list",method="GET",status="200"}',
+            body,
+        )
+        self.assertIn(
+            "cinema_http_request_duration_seconds_bucket"
+            '{route="moviesession-list",method="GET",le="+Inf"}',
+            body,
+        )
+        self.assertIn(
+            'cinema_db_queries_total{route="moviesession-list",method="GET"}',
+            body,
+        )
@@ -101,6 +101,19 @@ class MovieApiTests(TestCase):
         self.assertEqual(movies.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(superman_movies.count(), 0)
 
+    def test_get_movies_with_invalid_id_filters(self):
+        for query_string in ("genres=abc", "actors=1,,2", "genres=1&actors=x"):
+            with self.subTest(query_string=query_string):
+                response = self.client.get(
+                    f"/api/cinema/movies/?{query_string}"
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+
+        response = self.client.get("/api/cinema/movies/?actors=1,,2")
+        self.assertIn("actors", response.data)
+
     def test_get_movie(self):
         response = self.client.get("/api/cinema/movies/1/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,116 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from cinema.models import Movie, Genre, Actor, MovieDocument
+
+
+class MovieDocumentTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.drama = Genre.objects.create(name="Drama")
+        self.comedy = Genre.objects.create(name="Comedy")
+        self.actress = Actor.objects.create(
+            first_name="Kate", last_name="Winslet"
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie = Movie.objects.create(
+                title="Titanic",
+                description="Titanic description",
+                duration=123,
+            )
+            self.movie.genres.add(self.drama, self.comedy)
+            self.movie.actors.add(self.actress)
+
+    def document(self) -> MovieDocument:
+        return MovieDocument.objects.get(movie=self.movie)
+
+    def test_document_follows_movie_m2m(self):
+        self.assertEqual(self.document().genres, ["Drama", "Comedy"])
+        self.assertEqual(self.document().actors, ["Kate Winslet"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie.genres.remove(self.drama)
+        self.assertEqual(self.document().genres, ["Comedy"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie.actors.clear()
+        self.assertEqual(self.document().actors, [])
+
+    def test_document_follows_reverse_m2m(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.drama.movie_set.clear()
+        self.assertEqual(self.document().genres, ["Comedy"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            actor = Actor.objects.create(
+                first_name="Leonardo", last_name="D"
+            )
+            actor.movie_set.add(self.movie)
+        self.assertEqual(
+            self.document().actors, ["Kate Winslet", "Leonardo D"]
+        )
+
+    def test_document_follows_genre_and_actor_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.comedy.name = "Romance"
+            self.comedy.save()
+            self.actress.last_name = "Winslett"
+            self.actress.save()
+        self.assertEqual(self.document().genres, ["Drama", "Romance"])
+        self.assertEqual(self.document().actors, ["Kate Winslett"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.drama.delete()
+            self.actress.delete()
+        self.assertEqual(self.document().genres, ["Romance"])
+        self.assertEqual(self.document().actors, [])
+
+    def test_movie_list_is_a_single_query(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for number in range(5):
+                movie = Movie.objects.create(
+                    title=f"Movie {number}", description="", duration=90
+                )
+                movie.genres.add(self.drama)
+                movie.actors.add(self.actress)
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/cinema/movies/")
+
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(response.data[0]["genres"], ["Drama"])
+        self.assertEqual(response.data[0]["actors"], ["Kate Winslet"])
+
+    def test_new_movie_document_is_built_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    "/api/cinema/movies/",
+                    {
+                        "title": "Avatar",
+                        "description": "Avatar description",
+                        "duration": 162,
+                        "genres": [self.drama.id, self.comedy.id],
+                        "actors": [self.actress.id],
+                    },
+                )
+
+        document_writes = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("DELETE")
+            and "cinema_moviedocument" in query["sql"]
+        ]
+        self.assertEqual(len(document_writes), 1)
+        self.assertEqual(
+            MovieDocument.objects.get(movie_id=response.data["id"]).genres,
+            ["Drama", "Comedy"],
+        )
+
+    def test_movie_without_document_falls_back_to_m2m(self):
+        MovieDocument.objects.all().delete()
+        response = self.client.get("/api/cinema/movies/")
+        self.assertEqual(response.data[0]["genres"], ["Drama", "Comedy"])
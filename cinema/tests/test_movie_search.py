@@ -0,0 +1,116 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIClient
+
+from cinema.models import Movie
+from cinema.search import MOVIE_FTS_TABLE, movie_fts_available
+
+
+class MovieSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Movie.objects.create(
+            title="Titanic",
+            description=(
+                "A luxury ship sinks on its maiden voyage across the "
+                "Atlantic after hitting an iceberg."
+            ),
+            duration=194,
+        )
+        Movie.objects.create(
+            title="Iceberg Diaries",
+            description="Iceberg after iceberg: a ship among icebergs.",
+            duration=90,
+        )
+        Movie.objects.create(
+            title="Inception",
+            description="A thief plants an idea into a dream.",
+            duration=148,
+        )
+
+    def titles(self, url) -> list:
+        return [movie["title"] for movie in self.client.get(url).data]
+
+    def test_fts_index_exists_on_sqlite(self):
+        self.assertTrue(movie_fts_available(connection.alias))
+
+    def test_title_substring(self):
+        self.assertEqual(self.titles("/api/cinema/movies/?title=CEP"), [
+            "Inception"
+        ])
+        self.assertEqual(self.titles("/api/cinema/movies/?title=ic"), [
+            "Iceberg Diaries",
+            "Titanic",
+        ])
+
+    def test_title_follows_updates(self):
+        movie = Movie.objects.get(title="Titanic")
+        movie.title = "Avatar"
+        movie.save()
+        self.assertEqual(self.titles("/api/cinema/movies/?title=tan"), [])
+        self.assertEqual(self.titles("/api/cinema/movies/?title=vat"), [
+            "Avatar"
+        ])
+
+        movie.delete()
+        self.assertEqual(self.titles("/api/cinema/movies/?title=vat"), [])
+
+    def test_search_is_ranked(self):
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=iceberg ship"),
+            ["Iceberg Diaries", "Titanic"],
+        )
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=dream"), ["Inception"]
+        )
+        self.assertEqual(self.titles("/api/cinema/movies/?search=zzz"), [])
+
+    def test_search_requires_short_words(self):
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=ab iceberg"), []
+        )
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=ma iceberg"), ["Titanic"]
+        )
+
+    def test_search_query_does_not_grow_with_matches(self):
+        Movie.objects.bulk_create(
+            Movie(
+                title=f"Iceberg {number}",
+                description="Another iceberg.",
+                duration=90,
+            )
+            for number in range(1200)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            titles = self.titles("/api/cinema/movies/?search=iceberg")
+
+        self.assertEqual(len(titles), 1202)
+        [movie_query] = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "cinema_movie"."id"')
+        ]
+        self.assertIn("MATCH", movie_query)
+        self.assertLess(len(movie_query), 2000)
+
+    def test_search_combines_with_filters(self):
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=iceberg&title=tan"),
+            ["Titanic"],
+        )
+
+    def test_title_falls_back_without_fts(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {MOVIE_FTS_TABLE}")
+
+        self.assertEqual(self.titles("/api/cinema/movies/?title=CEP"), [
+            "Inception"
+        ])
+        self.assertEqual(
+            self.titles("/api/cinema/movies/?search=iceberg"),
+            ["Iceberg Diaries", "Titanic"],
+        )
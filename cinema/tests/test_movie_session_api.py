@@ -5,7 +5,16 @@ from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from cinema.models import Movie, Genre, Actor, MovieSession, CinemaHall, Ticket
+from cinema.models import (
+    Movie,
+    Genre,
+    Actor,
+    MovieSession,
+    CinemaHall,
+    Ticket,
+    Order,
+)
+from user.models import User
 
 
 class MovieSessionApiTests(TestCase):
@@ -127,3 +136,31 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(response.data["cinema_hall"]["rows"], 10)
         self.assertEqual(response.data["cinema_hall"]["seats_in_row"], 14)
         self.assertEqual(response.data["cinema_hall"]["name"], "White")
+
+    def test_movie_sessions_list_query_count_is_constant(self):
+        order = Order.objects.create(
+            user=User.objects.create(username="admin")
+        )
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=order, row=1, seat=1
+        )
+        for hour in range(10, 15):
+            MovieSession.objects.create(
+                movie=self.movie,
+                cinema_hall=self.cinema_hall,
+                show_time=datetime.datetime(2022, 9, 2, hour),
+            )
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/cinema/movie_sessions/")
+
+        self.assertEqual(len(response.data), 6)
+        show_times = [
+            movie_session["show_time"] for movie_session in response.data
+        ]
+        self.assertEqual(show_times, sorted(show_times, reverse=True))
+        tickets_available = {
+            movie_session["id"]: movie_session["tickets_available"]
+            for movie_session in response.data
+        }
+        self.assertEqual(tickets_available[self.movie_session.id], 139)
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.models import CinemaHall, Movie, MovieSession
+from cinema.scheduling import find_overlaps
+
+IMPORT_URL = "/api/cinema/movie_sessions/bulk/"
+START = datetime(2022, 10, 3, 10)
+
+
+class FindOverlapsTests(TestCase):
+    def test_sweep_reports_overlaps_within_hall_only(self):
+        hour = timedelta(hours=1)
+        intervals = [
+            (1, START, START + 2 * hour, "a"),
+            (1, START + 2 * hour, START + 3 * hour, "b"),
+            (1, START + hour, START + hour + hour / 2, "c"),
+            (2, START, START + 3 * hour, "d"),
+        ]
+
+        self.assertEqual(find_overlaps(intervals), [("a", "c")])
+
+
+class MovieSessionImportApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        self.blue = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.red = CinemaHall.objects.create(
+            name="Red", rows=10, seats_in_row=12
+        )
+
+    def _session(self, show_time, cinema_hall=None):
+        return {
+            "show_time": show_time.isoformat(),
+            "movie": self.movie.id,
+            "cinema_hall": (cinema_hall or self.blue).id,
+        }
+
+    def _week(self, count):
+        return [
+            self._session(START + timedelta(hours=3 * number))
+            for number in range(count)
+        ]
+
+    def test_sessions_are_bulk_created(self):
+        payload = self._week(5) + [self._session(START, self.red)]
+
+        response = self.client.post(
+            IMPORT_URL, {"movie_sessions": payload}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 6)
+        self.assertEqual(MovieSession.objects.count(), 6)
+        self.assertEqual(
+            MovieSession.objects.filter(cinema_hall=self.red).count(), 1
+        )
+
+    def test_query_count_does_not_grow_with_sessions(self):
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(
+                IMPORT_URL, {"movie_sessions": self._week(2)}, format="json"
+            )
+        MovieSession.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as many:
+            self.client.post(
+                IMPORT_URL, {"movie_sessions": self._week(150)}, format="json"
+            )
+
+        self.assertEqual(MovieSession.objects.count(), 150)
+        self.assertEqual(len(many), len(few))
+
+    def test_overlapping_sessions_in_import_are_rejected(self):
+        payload = [
+            self._session(START),
+            self._session(START + timedelta(hours=1)),
+            self._session(START + timedelta(hours=1), self.red),
+        ]
+
+        response = self.client.post(
+            IMPORT_URL, {"movie_sessions": payload}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["movie_sessions"]
+        self.assertEqual(
+            errors[0]["non_field_errors"],
+            ["Overlaps item 1 of this import in the same cinema hall."],
+        )
+        self.assertEqual(
+            errors[1]["non_field_errors"],
+            ["Overlaps item 0 of this import in the same cinema hall."],
+        )
+        self.assertEqual(errors[2], {})
+        self.assertFalse(MovieSession.objects.exists())
+
+    def test_overlap_with_scheduled_session_is_rejected(self):
+        scheduled = MovieSession.objects.create(
+            show_time=START, movie=self.movie, cinema_hall=self.blue
+        )
+
+        response = self.client.post(
+            IMPORT_URL,
+            {
+                "movie_sessions": [
+                    self._session(START + timedelta(minutes=119))
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["movie_sessions"][0]["non_field_errors"],
+            [
+                f"Overlaps movie session {scheduled.id} "
+                "in the same cinema hall."
+            ],
+        )
+
+    def test_unknown_movie_is_rejected(self):
+        payload = [{**self._session(START), "movie": 0}]
+
+        response = self.client.post(
+            IMPORT_URL, {"movie_sessions": payload}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("movie", response.data["movie_sessions"][0])
@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.models import CinemaHall, Movie, MovieSession
+from cinema.views import movie_session_list_queryset
+
+MOVIE_SESSION_URL = "/api/cinema/movie_sessions/"
+
+
+class MovieSessionEndTimeTests(TestCase):
+    def setUp(self):
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.movie_session = MovieSession.objects.create(
+            show_time="2022-10-03 18:00:00",
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+        )
+
+    def test_end_time_is_set_on_save(self):
+        self.assertEqual(
+            self.movie_session.end_time, datetime(2022, 10, 3, 20)
+        )
+
+        self.movie_session.show_time = datetime(2022, 10, 4, 10)
+        self.movie_session.save(update_fields=["show_time"])
+
+        self.assertEqual(
+            MovieSession.objects.get(pk=self.movie_session.pk).end_time,
+            datetime(2022, 10, 4, 12),
+        )
+
+    def test_end_time_follows_movie_duration(self):
+        self.movie.duration = 90
+        self.movie.save()
+
+        self.assertEqual(
+            MovieSession.objects.get(pk=self.movie_session.pk).end_time,
+            datetime(2022, 10, 3, 19, 30),
+        )
+
+
+class MovieSessionTimeFilterApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.now = timezone.now().replace(microsecond=0)
+        self.sessions = {
+            name: MovieSession.objects.create(
+                show_time=self.now + offset,
+                movie=movie,
+                cinema_hall=cinema_hall,
+            )
+            for name, offset in (
+                ("past", -timedelta(hours=3)),
+                ("current", -timedelta(hours=1)),
+                ("upcoming", timedelta(hours=2)),
+            )
+        }
+
+    def _ids(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {movie_session["id"] for movie_session in response.json()}
+
+    def test_now_showing(self):
+        for path in ("", "async/"):
+            with self.subTest(path=path):
+                response = self.client.get(
+                    f"/api/cinema/{path}movie_sessions/?now_showing"
+                )
+
+                self.assertEqual(
+                    self._ids(response), {self.sessions["current"].id}
+                )
+
+    def test_sessions_playing_between(self):
+        response = self.client.get(
+            MOVIE_SESSION_URL,
+            {
+                "from": (self.now - timedelta(minutes=50)).isoformat(),
+                "to": (self.now + timedelta(hours=2)).isoformat(),
+            },
+        )
+
+        self.assertEqual(self._ids(response), {self.sessions["current"].id})
+
+    def test_open_ended_range(self):
+        response = self.client.get(
+            MOVIE_SESSION_URL, {"from": self.now.isoformat()}
+        )
+
+        self.assertEqual(
+            self._ids(response),
+            {self.sessions["current"].id, self.sessions["upcoming"].id},
+        )
+
+    def test_invalid_datetime_is_rejected(self):
+        response = self.client.get(MOVIE_SESSION_URL, {"to": "tomorrow"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("to", response.data)
+
+    def test_range_uses_show_time_end_time_index(self):
+        plan = movie_session_list_queryset(
+            {"from": self.now.isoformat(), "to": self.now.isoformat()}
+        ).explain()
+
+        self.assertIn("moviesession_show_end_idx", plan)
+
+
+class MovieSessionDateFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.sessions = [
+            MovieSession.objects.create(
+                show_time=show_time, movie=self.movie, cinema_hall=cinema_hall
+            )
+            for show_time in (
+                "2022-09-01 23:59:59",
+                "2022-09-02 00:00:00",
+                "2022-09-02 23:59:59",
+                "2022-09-03 00:00:00",
+            )
+        ]
+
+    def test_date_is_a_half_open_day_range(self):
+        response = self.client.get(MOVIE_SESSION_URL, {"date": "2022-09-2"})
+
+        self.assertEqual(
+            [movie_session["id"] for movie_session in response.data],
+            [self.sessions[2].id, self.sessions[1].id],
+        )
+
+    def test_invalid_date_and_movie_are_rejected(self):
+        for params in ({"date": "02.09.2022"}, {"movie": "titanic"}):
+            with self.subTest(params=params):
+                response = self.client.get(MOVIE_SESSION_URL, params)
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertEqual(set(response.data), set(params))
+
+    def test_movie_and_date_use_movie_show_time_index(self):
+        plan = movie_session_list_queryset(
+            {"movie": str(self.movie.id), "date": "2022-09-02"}
+        ).explain()
+
+        self.assertIn(
+            "moviesession_movie_show_idx (movie_id=? AND show_time>? "
+            "AND show_time<?)",
+            plan,
+        )
+
+    def test_date_alone_uses_show_time_range(self):
+        plan = movie_session_list_queryset({"date": "2022-09-02"}).explain()
+
+        self.assertIn("(show_time>? AND show_time<?)", plan)
@@ -0,0 +1,321 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.models import (
+    CinemaHall,
+    Movie,
+    MovieSession,
+    OccupancySummary,
+    Order,
+    Ticket,
+)
+from cinema.occupancy import rebuild_occupancy
+from cinema.reservations import reserve_tickets
+from cinema.scheduling import import_movie_sessions
+from cinema.seeding import seed_dataset
+from user.models import User
+
+REPORT_URL = "/api/cinema/reports/occupancy/"
+SHOW_TIME = datetime(2022, 10, 3, 18)
+
+
+def _summaries() -> list:
+    return list(
+        OccupancySummary.objects.values_list(
+            "date",
+            "movie_id",
+            "cinema_hall_id",
+            "sessions",
+            "capacity",
+            "tickets_sold",
+        )
+    )
+
+
+class OccupancySummaryTests(TestCase):
+    def setUp(self):
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=SHOW_TIME,
+        )
+        self.user = User.objects.create(username="buyer")
+
+    def reserve(self, movie_session, *places) -> Order:
+        return reserve_tickets(
+            self.user,
+            [
+                {"movie_session": movie_session, "row": row, "seat": seat}
+                for row, seat in places
+            ],
+        )
+
+    def test_sessions_add_their_seats(self):
+        MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=SHOW_TIME + timedelta(hours=3),
+        )
+
+        self.assertEqual(
+            _summaries(),
+            [
+                (
+                    SHOW_TIME.date(),
+                    self.movie.id,
+                    self.cinema_hall.id,
+                    2,
+                    240,
+                    0,
+                )
+            ],
+        )
+
+    def test_tickets_are_counted_on_create_and_delete(self):
+        order = self.reserve(self.movie_session, (1, 1), (1, 2), (2, 1))
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=order, row=3, seat=3
+        )
+        self.assertEqual(_summaries()[0][5], 4)
+
+        Ticket.objects.filter(row=1).delete()
+        self.assertEqual(_summaries()[0][5], 2)
+
+        order.delete()
+        self.assertEqual(_summaries()[0][5], 0)
+
+    def test_ticket_changes_update_the_summary_once(self):
+        order = Order.objects.create(user=self.user)
+
+        def summary_queries(change) -> list:
+            with CaptureQueriesContext(connection) as queries:
+                change()
+            return [
+                query["sql"]
+                for query in queries
+                if "cinema_occupancysummary" in query["sql"]
+            ]
+
+        created = summary_queries(
+            lambda: Ticket.objects.create(
+                movie_session=self.movie_session, order=order, row=1, seat=1
+            )
+        )
+        deleted = summary_queries(lambda: Ticket.objects.all().delete())
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(deleted), 1)
+        self.assertTrue(created[0].startswith("UPDATE"))
+        self.assertEqual(_summaries()[0][5], 0)
+
+    def test_rescheduled_session_moves_its_counts(self):
+        self.reserve(self.movie_session, (1, 1), (1, 2))
+        other_hall = CinemaHall.objects.create(
+            name="Red", rows=5, seats_in_row=5
+        )
+
+        self.movie_session.show_time = SHOW_TIME + timedelta(days=1)
+        self.movie_session.cinema_hall = other_hall
+        self.movie_session.save()
+
+        self.assertEqual(
+            _summaries(),
+            [
+                (
+                    SHOW_TIME.date(),
+                    self.movie.id,
+                    self.cinema_hall.id,
+                    0,
+                    0,
+                    0,
+                ),
+                (
+                    SHOW_TIME.date() + timedelta(days=1),
+                    self.movie.id,
+                    other_hall.id,
+                    1,
+                    25,
+                    2,
+                ),
+            ],
+        )
+
+    def test_deleted_session_takes_its_counts(self):
+        self.reserve(self.movie_session, (1, 1))
+
+        self.movie_session.delete()
+
+        self.assertEqual(
+            _summaries(),
+            [(SHOW_TIME.date(), self.movie.id, self.cinema_hall.id, 0, 0, 0)],
+        )
+
+    def test_deleting_movie_removes_its_rows(self):
+        self.reserve(self.movie_session, (1, 1))
+
+        self.movie.delete()
+
+        self.assertEqual(_summaries(), [])
+
+    def test_resized_hall_updates_capacity(self):
+        self.cinema_hall.rows = 5
+        self.cinema_hall.save()
+
+        self.assertEqual(_summaries()[0][4], 60)
+
+    def test_imported_sessions_are_counted(self):
+        import_movie_sessions(
+            [
+                {
+                    "show_time": SHOW_TIME + timedelta(hours=3 * number),
+                    "movie": self.movie,
+                    "cinema_hall": self.cinema_hall,
+                }
+                for number in range(1, 5)
+            ]
+        )
+
+        self.assertEqual(
+            _summaries(),
+            [
+                (
+                    SHOW_TIME.date(),
+                    self.movie.id,
+                    self.cinema_hall.id,
+                    2,
+                    240,
+                    0,
+                ),
+                (
+                    SHOW_TIME.date() + timedelta(days=1),
+                    self.movie.id,
+                    self.cinema_hall.id,
+                    3,
+                    360,
+                    0,
+                ),
+            ],
+        )
+
+    def test_rebuild_matches_incremental_counts(self):
+        seed_dataset(halls=2, movies=4, sessions=12, tickets=150)
+        self.reserve(self.movie_session, (4, 4), (4, 5))
+        Ticket.objects.filter(id__in=Ticket.objects.values("id")[:20]).delete()
+        incremental = _summaries()
+
+        OccupancySummary.objects.update(tickets_sold=0)
+        self.assertEqual(rebuild_occupancy(), len(incremental))
+
+        self.assertEqual(_summaries(), incremental)
+
+    def test_rebuild_command(self):
+        OccupancySummary.objects.all().delete()
+
+        call_command("rebuild_occupancy", stdout=StringIO())
+
+        self.assertEqual(
+            _summaries(),
+            [
+                (
+                    SHOW_TIME.date(),
+                    self.movie.id,
+                    self.cinema_hall.id,
+                    1,
+                    120,
+                    0,
+                )
+            ],
+        )
+
+
+class OccupancyReportApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=120
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=10, seats_in_row=12
+        )
+        self.user = User.objects.create(username="buyer")
+        for days in range(3):
+            movie_session = MovieSession.objects.create(
+                movie=self.movie,
+                cinema_hall=self.cinema_hall,
+                show_time=SHOW_TIME + timedelta(days=days),
+            )
+            reserve_tickets(
+                self.user,
+                [
+                    {"movie_session": movie_session, "row": 1, "seat": seat}
+                    for seat in range(1, days + 2)
+                ],
+            )
+        self.client.force_authenticate(
+            User.objects.create(username="manager", is_staff=True)
+        )
+
+    def test_report_requires_staff(self):
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get(REPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_report_lists_occupancy_per_day(self):
+        response = self.client.get(REPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (row["date"], row["tickets_sold"], row["occupancy"])
+                for row in response.data["results"]
+            ],
+            [
+                ("2022-10-03", 1, 0.83),
+                ("2022-10-04", 2, 1.67),
+                ("2022-10-05", 3, 2.5),
+            ],
+        )
+        self.assertEqual(
+            response.data["results"][0]["movie_title"], "Titanic"
+        )
+        self.assertEqual(
+            response.data["results"][0]["cinema_hall_name"], "Blue"
+        )
+
+    def test_report_is_paginated(self):
+        response = self.client.get(REPORT_URL, {"page_size": 2})
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_report_filters_by_date_range(self):
+        response = self.client.get(
+            REPORT_URL, {"date_from": "2022-10-04", "date_to": "2022-10-04"}
+        )
+
+        self.assertEqual(
+            [row["date"] for row in response.data["results"]],
+            [str(date(2022, 10, 4))],
+        )
+
+    def test_invalid_date_is_rejected(self):
+        response = self.client.get(REPORT_URL, {"date_from": "yesterday"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.data)
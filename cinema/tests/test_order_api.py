@@ -1,6 +1,8 @@
 from datetime import datetime
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -87,3 +89,191 @@ class OrderApiTests(TestCase):
             response.data[0]["tickets_available"],
             self.cinema_hall.capacity - 1,
         )
+
+
+class OrderCreateApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Titanic",
+            description="Titanic description",
+            duration=123,
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="White",
+            rows=10,
+            seats_in_row=14,
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.now(),
+        )
+        self.user = User.objects.create(username="admin")
+        self.client.force_authenticate(user=self.user)
+
+    def order_payload(self, *places):
+        return {
+            "tickets": [
+                {
+                    "row": row,
+                    "seat": seat,
+                    "movie_session": self.movie_session.id,
+                }
+                for row, seat in places
+            ]
+        }
+
+    def test_create_order(self):
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((2, 1), (2, 2)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(user=self.user)
+        self.assertEqual(order.tickets.count(), 2)
+        self.movie_session.refresh_from_db()
+        self.assertEqual(
+            self.movie_session.taken_places,
+            [{"row": 2, "seat": 1}, {"row": 2, "seat": 2}],
+        )
+
+    def test_create_order_query_count_does_not_grow_with_tickets(self):
+        with CaptureQueriesContext(connection) as single_ticket:
+            self.client.post(
+                "/api/cinema/orders/",
+                self.order_payload((1, 1)),
+                format="json",
+            )
+        with CaptureQueriesContext(connection) as ten_tickets:
+            self.client.post(
+                "/api/cinema/orders/",
+                self.order_payload(*((3, seat) for seat in range(1, 11))),
+                format="json",
+            )
+        self.assertEqual(Ticket.objects.count(), 11)
+        self.assertEqual(len(ten_tickets), len(single_ticket))
+
+    def test_create_order_out_of_hall(self):
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((1, 1), (11, 1)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["tickets"][1]["row"],
+            ["row number must be in available range: (1, rows): (1, 10)"],
+        )
+        self.assertFalse(Order.objects.exists())
+
+    def test_create_order_with_taken_seat(self):
+        self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((1, 1)),
+            format="json",
+        )
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((1, 2), (1, 1)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            response.data["taken_places"],
+            [{"movie_session": self.movie_session.id, "row": 1, "seat": 1}],
+        )
+        self.assertEqual(Ticket.objects.count(), 1)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order_with_repeated_seat(self):
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((1, 2), (1, 2)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["tickets"][1]["non_field_errors"],
+            ["The same seat is requested more than once."],
+        )
+
+    def test_create_order_with_malformed_body(self):
+        for payload in ([{"tickets": []}], 5, {"tickets": 5}):
+            with self.subTest(payload=payload):
+                response = self.client.post(
+                    "/api/cinema/orders/", payload, format="json"
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+        self.assertFalse(Order.objects.exists())
+
+    def test_create_order_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self.order_payload((1, 1)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class OrderPaginationApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create(username="admin")
+        self.client.force_authenticate(user=self.user)
+        self.orders = [Order.objects.create(user=self.user) for _ in range(7)]
+        same_time = datetime(2022, 5, 16, 13, 45, 30)
+        Order.objects.filter(
+            id__in=[order.id for order in self.orders[2:5]]
+        ).update(created_at=same_time)
+        Order.objects.create(user=User.objects.create(username="other"))
+
+    def expected_ids(self):
+        return list(
+            Order.objects.filter(user=self.user)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+    def test_page_number_mode_stays_default(self):
+        response = self.client.get("/api/cinema/orders/?page_size=3")
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_cursor_mode_walks_all_orders_without_count(self):
+        url = "/api/cinema/orders/?pagination=cursor&page_size=3"
+        seen_ids = []
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            self.assertFalse(
+                any("COUNT(" in query["sql"] for query in queries)
+            )
+            seen_ids += [order["id"] for order in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(seen_ids, self.expected_ids())
+
+    def test_cursor_mode_previous_link(self):
+        first_page = self.client.get(
+            "/api/cinema/orders/?pagination=cursor&page_size=3"
+        )
+        self.assertIsNone(first_page.data["previous"])
+        second_page = self.client.get(first_page.data["next"])
+        previous_page = self.client.get(second_page.data["previous"])
+
+        self.assertEqual(
+            [order["id"] for order in previous_page.data["results"]],
+            self.expected_ids()[:3],
+        )
+        self.assertIsNone(previous_page.data["previous"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/cinema/orders/?cursor=garbage")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
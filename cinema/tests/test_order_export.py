@@ -0,0 +1,111 @@
+import csv
+import json
+from datetime import datetime
+from io import StringIO
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema import exports
+from cinema.models import CinemaHall, Movie, MovieSession, Order, Ticket
+from user.models import User
+
+EXPORT_URL = "/api/cinema/orders/export/"
+EXPORT_ALL_URL = "/api/cinema/orders/export/all/"
+
+
+class OrderExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=123
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="White", rows=10, seats_in_row=14
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=movie,
+            cinema_hall=cinema_hall,
+            show_time=datetime(2022, 10, 3, 18, 30),
+        )
+        self.user = User.objects.create(username="buyer")
+        self.other_user = User.objects.create(username="other")
+        for user, seats in ((self.user, (1, 2, 3)), (self.other_user, (4,))):
+            order = Order.objects.create(user=user)
+            for seat in seats:
+                Ticket.objects.create(
+                    movie_session=self.movie_session,
+                    order=order,
+                    row=1,
+                    seat=seat,
+                )
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def content(response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_streams_own_tickets(self):
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("orders.csv", response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self.content(response))))
+        self.assertEqual([row["seat"] for row in rows], ["1", "2", "3"])
+        self.assertEqual(rows[0]["movie_title"], "Titanic")
+        self.assertEqual(rows[0]["cinema_hall_name"], "White")
+        self.assertEqual(rows[0]["show_time"], "2022-10-03T18:30:00")
+
+    def test_ndjson_export_matches_order_list_values(self):
+        order = self.client.get("/api/cinema/orders/").data["results"][0]
+
+        response = self.client.get(EXPORT_URL, {"file_format": "ndjson"})
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [
+            json.loads(line) for line in self.content(response).splitlines()
+        ]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]["order_id"], order["id"])
+        self.assertEqual(rows[0]["order_created_at"], order["created_at"])
+        self.assertEqual(
+            rows[0]["show_time"],
+            order["tickets"][0]["movie_session"]["show_time"],
+        )
+
+    def test_unknown_file_format_is_rejected(self):
+        response = self.client.get(EXPORT_URL, {"file_format": "xlsx"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file_format", response.data)
+
+    def test_full_export_is_staff_only(self):
+        self.assertEqual(
+            self.client.get(EXPORT_ALL_URL).status_code,
+            status.HTTP_403_FORBIDDEN,
+        )
+
+        self.client.force_authenticate(
+            User.objects.create(username="finance", is_staff=True)
+        )
+        response = self.client.get(EXPORT_ALL_URL, {"file_format": "ndjson"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = [
+            json.loads(line) for line in self.content(response).splitlines()
+        ]
+        self.assertEqual(
+            {row["user_id"] for row in rows},
+            {self.user.id, self.other_user.id},
+        )
+
+    def test_rows_span_iterator_chunks(self):
+        with mock.patch.object(exports, "EXPORT_CHUNK_SIZE", 2):
+            response = self.client.get(EXPORT_URL, {"file_format": "csv"})
+            lines = self.content(response).splitlines()
+
+        self.assertEqual(len(lines), 4)
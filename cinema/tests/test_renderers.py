@@ -0,0 +1,138 @@
+import json
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import msgpack
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from cinema.models import CinemaHall, Movie, MovieSession, Order, Ticket
+from cinema.renderers import MessagePackRenderer, ORJSONRenderer
+from user.models import User
+
+MSGPACK = "application/msgpack"
+
+SAMPLE = OrderedDict(
+    [
+        ("show_time", datetime(2022, 10, 3, 18, 30, 15, 123456)),
+        ("day", date(2022, 10, 3)),
+        ("at", time(18, 30, 15, 500000)),
+        ("price", Decimal("12.50")),
+        ("uuid", uuid.UUID(int=7)),
+        ("title", "Amélie \u2028 \u2029"),
+        ("rows", {1: [1, 2], 2: ()}),
+        ("empty", None),
+    ]
+)
+
+
+class RendererTests(TestCase):
+    def test_orjson_output_matches_json_renderer(self):
+        self.assertEqual(
+            ORJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE)
+        )
+
+    def test_indent_falls_back_to_json_renderer(self):
+        media_type = "application/json; indent=2"
+
+        self.assertEqual(
+            ORJSONRenderer().render(SAMPLE, media_type),
+            JSONRenderer().render(SAMPLE, media_type),
+        )
+
+    def test_msgpack_values_match_json(self):
+        data = dict(SAMPLE, rows={"1": [1, 2]})
+
+        self.assertEqual(
+            msgpack.unpackb(MessagePackRenderer().render(data)),
+            json.loads(JSONRenderer().render(data)),
+        )
+
+
+class ContentNegotiationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=123
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="White", rows=10, seats_in_row=14
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=movie,
+            cinema_hall=cinema_hall,
+            show_time=datetime(2022, 10, 3, 18, 30),
+        )
+        self.user = User.objects.create(username="buyer")
+        Ticket.objects.create(
+            movie_session=self.movie_session,
+            order=Order.objects.create(user=self.user),
+            row=2,
+            seat=3,
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_accept_selects_msgpack(self):
+        for url in (
+            "/api/cinema/orders/",
+            "/api/cinema/movie_sessions/",
+            f"/api/cinema/movie_sessions/{self.movie_session.id}/",
+        ):
+            with self.subTest(url=url):
+                json_response = self.client.get(url)
+                msgpack_response = self.client.get(url, HTTP_ACCEPT=MSGPACK)
+
+                self.assertEqual(
+                    json_response["Content-Type"], "application/json"
+                )
+                self.assertEqual(msgpack_response["Content-Type"], MSGPACK)
+                self.assertEqual(
+                    msgpack.unpackb(msgpack_response.content),
+                    json.loads(json_response.content),
+                )
+
+    def test_order_is_created_from_msgpack_body(self):
+        body = msgpack.packb(
+            {
+                "tickets": [
+                    {
+                        "movie_session": self.movie_session.id,
+                        "row": 4,
+                        "seat": 5,
+                    }
+                ]
+            }
+        )
+
+        response = self.client.post(
+            "/api/cinema/orders/",
+            body,
+            content_type=MSGPACK,
+            HTTP_ACCEPT=MSGPACK,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = msgpack.unpackb(response.content)
+        self.assertEqual(order["tickets"][0]["seat"], 5)
+        self.assertEqual(
+            order["created_at"],
+            Order.objects.get(id=order["id"]).created_at.isoformat(),
+        )
+
+    def test_malformed_bodies_are_rejected(self):
+        for body, content_type in (
+            (b'{"tickets": [', "application/json"),
+            (b"\xc1", MSGPACK),
+        ):
+            with self.subTest(content_type=content_type):
+                response = self.client.post(
+                    "/api/cinema/orders/", body, content_type=content_type
+                )
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
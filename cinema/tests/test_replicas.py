@@ -0,0 +1,174 @@
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from rest_framework.test import APIClient
+
+from cinema.models import Genre
+from cinema.replicas import (
+    PIN_COOKIE,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    copy_to_replica,
+)
+from user.models import User
+
+REPLICA_DATABASES = {
+    **settings.DATABASES,
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": "unused.sqlite3",
+    },
+}
+
+
+def _reload_connection_settings():
+    # The handler keeps the DATABASES it first read; make it read again.
+    connections._settings = None
+    connections.__dict__.pop("settings", None)
+
+
+@contextmanager
+def replica_database():
+    """Configure a ``replica`` file database and a connection to it."""
+    with tempfile.TemporaryDirectory() as directory:
+        databases = {
+            **REPLICA_DATABASES,
+            "replica": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": os.path.join(directory, "replica.sqlite3"),
+            },
+        }
+        with override_settings(DATABASES=databases):
+            _reload_connection_settings()
+            try:
+                yield databases["replica"]["NAME"]
+            finally:
+                connections["replica"].close()
+                del connections["replica"]
+        _reload_connection_settings()
+
+
+@override_settings(DATABASES=REPLICA_DATABASES)
+class ReplicaRoutingMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.read_aliases = []
+
+    def _view(self, request):
+        self.read_aliases.append(self.router.db_for_read(Genre))
+        if request.method == "POST":
+            self.router.db_for_write(Genre)
+            self.read_aliases.append(self.router.db_for_read(Genre))
+        return HttpResponse(status=201 if request.method == "POST" else 200)
+
+    def _send(self, request):
+        return ReplicaRoutingMiddleware(self._view)(request)
+
+    def test_safe_api_reads_go_to_replica(self):
+        self._send(self.factory.get("/api/cinema/movies/"))
+
+        self.assertEqual(self.read_aliases, ["replica"])
+        self.assertIsNone(self.router.db_for_read(Genre))
+
+    def test_other_paths_and_pinned_clients_read_default(self):
+        self._send(self.factory.get("/admin/"))
+        pinned = self.factory.get("/api/cinema/orders/")
+        pinned.COOKIES[PIN_COOKIE] = "1"
+        self._send(pinned)
+
+        self.assertEqual(self.read_aliases, [None, None])
+
+    def test_write_pins_request_and_following_requests(self):
+        response = self._send(self.factory.post("/api/cinema/orders/"))
+
+        self.assertEqual(self.read_aliases, [None, None])
+        self.assertIn(PIN_COOKIE, response.cookies)
+        self.assertEqual(
+            response.cookies[PIN_COOKIE]["max-age"],
+            settings.REPLICA_PIN_SECONDS,
+        )
+
+    def test_writes_inside_a_read_request_pin_it_to_default(self):
+        def view(request):
+            self.read_aliases.append(self.router.db_for_read(Genre))
+            self.router.db_for_write(Genre)
+            self.read_aliases.append(self.router.db_for_read(Genre))
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(
+            self.factory.get("/api/cinema/genres/")
+        )
+
+        self.assertEqual(self.read_aliases, ["replica", None])
+
+    def test_auth_and_session_reads_stay_on_default(self):
+        def view(request):
+            self.read_aliases.extend(
+                self.router.db_for_read(model)
+                for model in (Genre, User, Session)
+            )
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(view)(
+            self.factory.get("/api/cinema/orders/")
+        )
+
+        self.assertEqual(self.read_aliases, ["replica", None, None])
+
+    @override_settings(DATABASES=settings.DATABASES)
+    def test_nothing_is_routed_without_replica(self):
+        response = self._send(self.factory.post("/api/cinema/orders/"))
+        self._send(self.factory.get("/api/cinema/movies/"))
+
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+        self.assertEqual(self.read_aliases, [None, None, None])
+
+
+class CopyToReplicaTests(TransactionTestCase):
+    def test_replica_file_receives_default_rows(self):
+        Genre.objects.create(name="Drama")
+
+        with replica_database() as replica_path:
+            copy_to_replica()
+
+            replica = sqlite3.connect(replica_path)
+            names = replica.execute("SELECT name FROM cinema_genre").fetchall()
+            replica.close()
+
+        self.assertEqual(names, [("Drama",)])
+
+    def test_cached_responses_are_not_filled_from_lagging_replica(self):
+        cache.clear()
+        client = APIClient()
+
+        def genre_names():
+            response = client.get("/api/cinema/genres/")
+            return [genre["name"] for genre in response.json()]
+
+        with replica_database():
+            Genre.objects.create(name="Drama")
+            copy_to_replica()
+            self.assertEqual(genre_names(), ["Drama"])
+
+            Genre.objects.create(name="Comedy")
+            self.assertFalse(
+                Genre.objects.using("replica").filter(name="Comedy").exists()
+            )
+            self.assertEqual(genre_names(), ["Drama", "Comedy"])
+
+            copy_to_replica()
+            self.assertEqual(genre_names(), ["Drama", "Comedy"])
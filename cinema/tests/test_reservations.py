@@ -0,0 +1,117 @@
+import threading
+from datetime import datetime
+
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+from unittest import mock
+
+from cinema.models import (
+    Movie,
+    CinemaHall,
+    MovieSession,
+    Ticket,
+    Order,
+)
+from cinema.reservations import SeatConflict, reserve_tickets
+from user.models import User
+
+
+class ReservationEngineTests(TransactionTestCase):
+    def setUp(self):
+        movie = Movie.objects.create(
+            title="Titanic",
+            description="Titanic description",
+            duration=123,
+        )
+        cinema_hall = CinemaHall.objects.create(
+            name="White",
+            rows=10,
+            seats_in_row=14,
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=movie,
+            cinema_hall=cinema_hall,
+            show_time=datetime.now(),
+        )
+        self.users = [
+            User.objects.create(username=f"user{number}")
+            for number in range(8)
+        ]
+
+    def tickets_data(self, *places):
+        return [
+            {"movie_session": self.movie_session, "row": row, "seat": seat}
+            for row, seat in places
+        ]
+
+    def test_conflict_lists_taken_seats(self):
+        reserve_tickets(self.users[0], self.tickets_data((1, 1), (1, 2)))
+
+        with self.assertRaises(SeatConflict) as conflict:
+            reserve_tickets(
+                self.users[1], self.tickets_data((1, 2), (1, 3), (1, 1))
+            )
+
+        self.assertEqual(
+            conflict.exception.taken_places,
+            [(self.movie_session.id, 1, 1), (self.movie_session.id, 1, 2)],
+        )
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_lock_errors_are_retried(self):
+        calls = []
+        original_create = Order.objects.create
+
+        def flaky_create(**kwargs):
+            calls.append(kwargs)
+            if len(calls) < 3:
+                raise OperationalError("database is locked")
+            return original_create(**kwargs)
+
+        with mock.patch("cinema.reservations.time.sleep"), mock.patch.object(
+            Order.objects, "create", side_effect=flaky_create
+        ):
+            order = reserve_tickets(self.users[0], self.tickets_data((2, 2)))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(order.tickets.count(), 1)
+
+    def test_concurrent_orders_for_the_same_seats(self):
+        barrier = threading.Barrier(len(self.users))
+        outcomes = []
+
+        def book(user, own_seat):
+            try:
+                barrier.wait()
+                reserve_tickets(
+                    user, self.tickets_data((5, 5), (5, 6), (6, own_seat))
+                )
+                outcomes.append("booked")
+            except SeatConflict as conflict:
+                outcomes.append(conflict.taken_places)
+            except Exception as error:
+                outcomes.append(error)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=book, args=(user, number + 1))
+            for number, user in enumerate(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(outcomes.count("booked"), 1, outcomes)
+        contested = [
+            (self.movie_session.id, 5, 5),
+            (self.movie_session.id, 5, 6),
+        ]
+        for outcome in outcomes:
+            if outcome != "booked":
+                self.assertEqual(outcome, contested)
+
+        self.assertEqual(Ticket.objects.count(), 3)
+        movie_session = MovieSession.objects.get(pk=self.movie_session.pk)
+        self.assertEqual(len(movie_session.seat_map), 3)
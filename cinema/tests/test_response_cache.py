@@ -0,0 +1,103 @@
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.models import Movie, Genre, Actor
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.drama = Genre.objects.create(name="Drama")
+        self.actor = Actor.objects.create(
+            first_name="Kate", last_name="Winslet"
+        )
+        self.movie = Movie.objects.create(
+            title="Titanic",
+            description="Titanic description",
+            duration=123,
+        )
+        self.movie.genres.add(self.drama)
+        self.movie.actors.add(self.actor)
+
+    def test_repeated_list_is_served_from_cache(self):
+        first = self.client.get("/api/cinema/genres/")
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/cinema/genres/")
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_if_none_match_returns_304_without_queries(self):
+        etag = self.client.get("/api/cinema/movies/")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                "/api/cinema/movies/", HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_depends_on_query_and_media_type(self):
+        plain = self.client.get("/api/cinema/movies/")["ETag"]
+        filtered = self.client.get("/api/cinema/movies/?title=Tit")["ETag"]
+        browsable = self.client.get(
+            "/api/cinema/movies/", HTTP_ACCEPT="text/html"
+        )["ETag"]
+        self.assertEqual(len({plain, filtered, browsable}), 3)
+
+    def test_related_changes_invalidate_movie_responses(self):
+        etag = self.client.get("/api/cinema/movies/")["ETag"]
+
+        self.drama.name = "Romance"
+        self.drama.save()
+        response = self.client.get(
+            "/api/cinema/movies/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["genres"], ["Romance"])
+
+        etag = response["ETag"]
+        self.movie.actors.clear()
+        response = self.client.get(
+            f"/api/cinema/movies/{self.movie.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["actors"], [])
+
+    def test_unrelated_changes_keep_etag(self):
+        etag = self.client.get("/api/cinema/genres/")["ETag"]
+        Actor.objects.create(first_name="Leonardo", last_name="DiCaprio")
+        response = self.client.get(
+            "/api/cinema/genres/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_file_based_backend(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with override_settings(
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.filebased."
+                        "FileBasedCache",
+                        "LOCATION": cache_dir,
+                    }
+                }
+            ):
+                first = self.client.get("/api/cinema/actors/")
+                with self.assertNumQueries(0):
+                    second = self.client.get("/api/cinema/actors/")
+                self.assertEqual(second.data, first.data)
+
+                self.actor.first_name = "Kathryn"
+                self.actor.save()
+                third = self.client.get("/api/cinema/actors/")
+                self.assertEqual(third.data[0]["first_name"], "Kathryn")
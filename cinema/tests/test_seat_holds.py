@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.models import (
+    Movie,
+    CinemaHall,
+    MovieSession,
+    SeatHold,
+    Ticket,
+)
+from user.models import User
+
+
+class SeatHoldApiTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        movie = Movie.objects.create(
+            title="Titanic",
+            description="Titanic description",
+            duration=123,
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="White",
+            rows=10,
+            seats_in_row=14,
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.now(),
+        )
+        self.url = f"/api/cinema/movie_sessions/{self.movie_session.id}/holds/"
+        self.user = User.objects.create(username="admin")
+        self.other_user = User.objects.create(username="other")
+        self.client.force_authenticate(user=self.user)
+
+    def hold(self, *places, user=None):
+        if user is not None:
+            self.client.force_authenticate(user=user)
+        response = self.client.post(
+            self.url,
+            {"seats": [{"row": row, "seat": seat} for row, seat in places]},
+            format="json",
+        )
+        self.client.force_authenticate(user=self.user)
+        return response
+
+    def test_hold_seats(self):
+        response = self.hold((3, 4), (3, 5))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [(hold["row"], hold["seat"]) for hold in response.data],
+            [(3, 4), (3, 5)],
+        )
+        self.assertEqual(len(self.client.get(self.url).data), 2)
+
+    def test_held_seats_are_taken(self):
+        self.hold((3, 4), (3, 5))
+
+        detail = self.client.get(
+            f"/api/cinema/movie_sessions/{self.movie_session.id}/"
+        )
+        self.assertEqual(
+            detail.data["taken_places"],
+            [{"row": 3, "seat": 4}, {"row": 3, "seat": 5}],
+        )
+        sessions = self.client.get("/api/cinema/movie_sessions/")
+        self.assertEqual(sessions.data[0]["tickets_available"], 138)
+
+    def test_seat_held_by_another_user_conflicts(self):
+        self.hold((3, 4), user=self.other_user)
+
+        response = self.hold((3, 4), (3, 5))
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            response.data["taken_places"],
+            [{"movie_session": self.movie_session.id, "row": 3, "seat": 4}],
+        )
+
+        order = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 3,
+                        "seat": 4,
+                        "movie_session": self.movie_session.id,
+                    }
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(order.status_code, status.HTTP_409_CONFLICT)
+
+    def test_expired_hold_does_not_block(self):
+        self.hold((3, 4), user=self.other_user)
+        SeatHold.objects.update(expires_at=datetime.now() - timedelta(1))
+
+        response = self.hold((3, 4))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SeatHold.objects.get().user, self.user)
+
+    def test_order_converts_own_holds(self):
+        self.hold((3, 4), (3, 5))
+
+        response = self.client.post(
+            "/api/cinema/orders/",
+            {
+                "tickets": [
+                    {
+                        "row": 3,
+                        "seat": seat,
+                        "movie_session": self.movie_session.id,
+                    }
+                    for seat in (4, 5)
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(SeatHold.objects.exists())
+        self.assertEqual(Ticket.objects.count(), 2)
+
+    def test_hold_out_of_hall(self):
+        response = self.hold((1, 15))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_release_holds(self):
+        self.hold((3, 4))
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_sweep_expired_holds_in_batches(self):
+        self.hold(*((1, seat) for seat in range(1, 8)))
+        self.hold((2, 1), user=self.other_user)
+        SeatHold.objects.filter(row=1).update(
+            expires_at=datetime.now() - timedelta(minutes=1)
+        )
+        out = StringIO()
+
+        with self.assertNumQueries(7):
+            call_command("sweep_seat_holds", batch_size=3, stdout=out)
+
+        self.assertIn("Swept 7", out.getvalue())
+        self.assertEqual(SeatHold.objects.count(), 1)
@@ -0,0 +1,215 @@
+import base64
+from datetime import datetime, timedelta
+from importlib import import_module
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import TestCase
+
+from cinema.models import (
+    Movie,
+    CinemaHall,
+    MovieSession,
+    Ticket,
+    Order,
+    SeatHold,
+)
+from cinema.seat_maps import SeatBitmap
+from user.models import User
+
+
+class SeatBitmapTests(TestCase):
+    def test_add_discard_and_iterate(self):
+        seat_map = SeatBitmap(rows=3, seats_in_row=5)
+        seat_map.add(1, 1)
+        seat_map.add(3, 5)
+        seat_map.add(2, 4)
+        self.assertEqual(list(seat_map), [(1, 1), (2, 4), (3, 5)])
+        self.assertEqual(len(seat_map), 3)
+        self.assertIn((2, 4), seat_map)
+
+        seat_map.discard(2, 4)
+        self.assertNotIn((2, 4), seat_map)
+        self.assertEqual(len(seat_map), 2)
+
+    def test_size_follows_hall_dimensions(self):
+        self.assertEqual(len(SeatBitmap(10, 14).to_bytes()), 18)
+        restored = SeatBitmap(2, 2, b"\x09")
+        self.assertEqual(list(restored), [(1, 1), (2, 2)])
+
+    def test_out_of_hall_seat(self):
+        with self.assertRaises(IndexError):
+            SeatBitmap(2, 2).add(3, 1)
+
+    def test_runs_round_trip(self):
+        seat_map = SeatBitmap(rows=3, seats_in_row=8)
+        for row, seat in ((1, 1), (1, 2), (1, 3), (1, 8), (3, 5), (3, 6)):
+            seat_map.add(row, seat)
+
+        runs = seat_map.runs()
+
+        self.assertEqual(runs, [[[1, 3], [8, 8]], [], [[5, 6]]])
+        self.assertEqual(
+            SeatBitmap.from_runs(3, 8, runs).to_bytes(), seat_map.to_bytes()
+        )
+
+
+class MovieSessionSeatMapTests(TestCase):
+    def setUp(self):
+        # The async detail view reads genres from the movie's document.
+        with self.captureOnCommitCallbacks(execute=True):
+            movie = Movie.objects.create(
+                title="Titanic",
+                description="Titanic description",
+                duration=123,
+            )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="White",
+            rows=10,
+            seats_in_row=14,
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.now(),
+        )
+        self.order = Order.objects.create(
+            user=User.objects.create(username="admin")
+        )
+
+    def refreshed_session(self) -> MovieSession:
+        return MovieSession.objects.get(pk=self.movie_session.pk)
+
+    def test_ticket_save_and_delete_update_bitmap(self):
+        ticket = Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=2, seat=3
+        )
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=1, seat=7
+        )
+        movie_session = self.refreshed_session()
+        self.assertEqual(
+            movie_session.taken_places,
+            [{"row": 1, "seat": 7}, {"row": 2, "seat": 3}],
+        )
+        self.assertEqual(movie_session.tickets_available, 138)
+
+        ticket.seat = 4
+        ticket.save()
+        self.assertEqual(
+            self.refreshed_session().taken_places,
+            [{"row": 1, "seat": 7}, {"row": 2, "seat": 4}],
+        )
+
+        self.order.delete()
+        movie_session = self.refreshed_session()
+        self.assertEqual(movie_session.taken_places, [])
+        self.assertEqual(movie_session.tickets_available, 140)
+
+    def test_reconcile_command_rebuilds_drifted_bitmap(self):
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=5, seat=5
+        )
+        MovieSession.objects.filter(pk=self.movie_session.pk).update(
+            seat_bitmap=b""
+        )
+        out = StringIO()
+
+        call_command("reconcile_seat_maps", stdout=out)
+
+        self.assertIn("Rebuilt 1", out.getvalue())
+        self.assertEqual(
+            self.refreshed_session().taken_places, [{"row": 5, "seat": 5}]
+        )
+
+    def test_migration_skips_out_of_hall_tickets(self):
+        fill_seat_bitmaps = import_module(
+            "cinema.migrations.0005_moviesession_seat_bitmap"
+        ).fill_seat_bitmaps
+        Ticket.objects.bulk_create(
+            [
+                Ticket(
+                    movie_session=self.movie_session,
+                    order=self.order,
+                    row=row,
+                    seat=seat,
+                )
+                for row, seat in ((3, 4), (11, 1), (1, 15))
+            ]
+        )
+
+        fill_seat_bitmaps(apps, None)
+
+        self.assertEqual(
+            self.refreshed_session().taken_places, [{"row": 3, "seat": 4}]
+        )
+
+    def test_hall_resize_rebuilds_bitmap(self):
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=2, seat=1
+        )
+        self.cinema_hall.seats_in_row = 20
+        self.cinema_hall.save()
+
+        self.assertEqual(
+            self.refreshed_session().taken_places, [{"row": 2, "seat": 1}]
+        )
+
+    def test_hall_change_rebuilds_bitmap(self):
+        for row, seat in ((3, 3), (4, 3), (5, 3)):
+            Ticket.objects.create(
+                movie_session=self.movie_session,
+                order=self.order,
+                row=row,
+                seat=seat,
+            )
+        self.movie_session.cinema_hall = CinemaHall.objects.create(
+            name="Blue", rows=25, seats_in_row=30
+        )
+        self.movie_session.save()
+
+        self.assertEqual(
+            self.refreshed_session().taken_places,
+            [
+                {"row": 3, "seat": 3},
+                {"row": 4, "seat": 3},
+                {"row": 5, "seat": 3},
+            ],
+        )
+
+    def test_detail_seat_formats(self):
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=1, seat=2
+        )
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=self.order, row=1, seat=3
+        )
+        SeatHold.objects.create(
+            movie_session=self.movie_session,
+            user=self.order.user,
+            row=10,
+            seat=14,
+            expires_at=datetime.now() + timedelta(minutes=5),
+        )
+        expected = SeatBitmap(10, 14)
+        for row, seat in ((1, 2), (1, 3), (10, 14)):
+            expected.add(row, seat)
+
+        for prefix in ("/api/cinema", "/api/cinema/async"):
+            url = f"{prefix}/movie_sessions/{self.movie_session.id}/"
+            with self.subTest(url=url):
+                rle = self.client.get(url, {"seat_format": "rle"}).json()
+                bitmap = self.client.get(url, {"seat_format": "bitmap"}).json()
+                invalid = self.client.get(url, {"seat_format": "png"})
+
+                self.assertEqual(
+                    rle["taken_places"],
+                    [[[2, 3]], *[[]] * 8, [[14, 14]]],
+                )
+                self.assertEqual(
+                    base64.b64decode(bitmap["taken_places"]),
+                    expected.to_bytes(),
+                )
+                self.assertEqual(invalid.status_code, 400)
+                self.assertIn("seat_format", invalid.json())
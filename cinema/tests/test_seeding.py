@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from cinema.models import Movie, MovieDocument, MovieSession, Ticket
+from cinema.seat_maps import rebuild_seat_maps
+from cinema.seeding import seed_dataset, seed_scale
+
+
+class SeedDatasetTests(TestCase):
+    def test_seeded_dataset_is_consistent(self):
+        dataset = seed_dataset(halls=2, movies=5, sessions=6, tickets=120)
+
+        self.assertEqual(MovieSession.objects.count(), 6)
+        self.assertEqual(Ticket.objects.count(), dataset["tickets"])
+        self.assertEqual(
+            MovieDocument.objects.count(), Movie.objects.count()
+        )
+        self.assertEqual(rebuild_seat_maps(MovieSession.objects.all()), 0)
+
+
+class SeedScaleTests(TestCase):
+    def test_chunked_seed_is_consistent(self):
+        totals = seed_scale(
+            halls=2,
+            movies=5,
+            sessions=30,
+            users=10,
+            start=date(2023, 1, 6),
+            chunk_size=7,
+            batch_size=50,
+        )
+
+        self.assertEqual(MovieSession.objects.count(), 30)
+        self.assertEqual(Ticket.objects.count(), totals["tickets"])
+        self.assertGreater(totals["tickets"], 0)
+        self.assertEqual(rebuild_seat_maps(MovieSession.objects.all()), 0)
+
+        previous_end = {}
+        for movie_session in MovieSession.objects.select_related(
+            "movie"
+        ).order_by("show_time"):
+            hall_id = movie_session.cinema_hall_id
+            if hall_id in previous_end:
+                self.assertGreaterEqual(
+                    movie_session.show_time, previous_end[hall_id]
+                )
+            previous_end[hall_id] = movie_session.show_time + timedelta(
+                minutes=movie_session.movie.duration
+            )
+
+    def test_command_refuses_to_seed_twice_without_flush(self):
+        options = {
+            "halls": 1,
+            "movies": 2,
+            "sessions": 3,
+            "users": 2,
+            "stdout": StringIO(),
+        }
+        call_command("seed_scale", **options)
+
+        with self.assertRaisesMessage(CommandError, "--flush"):
+            call_command("seed_scale", **options)
+
+        call_command("seed_scale", flush=True, verbosity=0, **options)
+        self.assertEqual(MovieSession.objects.count(), 3)
+        self.assertEqual(rebuild_seat_maps(MovieSession.objects.all()), 0)
@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cinema.fieldsets import parse_fieldset
+from cinema.models import (
+    Actor,
+    CinemaHall,
+    Genre,
+    Movie,
+    MovieSession,
+    Order,
+    SeatHold,
+    Ticket,
+)
+from user.models import User
+
+MOVIE_SESSION_URL = "/api/cinema/movie_sessions/"
+
+
+class ParseFieldsetTests(TestCase):
+    def test_dotted_paths_become_a_tree(self):
+        self.assertEqual(
+            parse_fieldset("id, movie.title,movie.genres,,"),
+            {"id": {}, "movie": {"title": {}, "genres": {}}},
+        )
+        self.assertIsNone(parse_fieldset(""))
+        self.assertIsNone(parse_fieldset(None))
+
+
+class SparseFieldsetApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.movie = Movie.objects.create(
+            title="Titanic", description="Titanic description", duration=123
+        )
+        self.movie.genres.add(Genre.objects.create(name="Drama"))
+        self.movie.actors.add(
+            Actor.objects.create(first_name="Kate", last_name="Winslet")
+        )
+        self.cinema_hall = CinemaHall.objects.create(
+            name="White", rows=10, seats_in_row=14
+        )
+        self.movie_session = MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime(2022, 10, 3, 18),
+        )
+        self.user = User.objects.create(username="buyer")
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(
+            movie_session=self.movie_session, order=order, row=2, seat=3
+        )
+        SeatHold.objects.create(
+            movie_session=self.movie_session,
+            user=self.user,
+            row=4,
+            seat=5,
+            expires_at=datetime.now() + timedelta(minutes=5),
+        )
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = "\n".join(query["sql"] for query in queries.captured_queries)
+        return response.data, sql
+
+    def test_session_list_fields_skip_joins_and_aggregates(self):
+        data, sql = self.get(MOVIE_SESSION_URL, fields="id,show_time")
+
+        self.assertEqual(
+            data,
+            [
+                {
+                    "id": self.movie_session.id,
+                    "show_time": "2022-10-03T18:00:00",
+                }
+            ],
+        )
+        self.assertNotIn("JOIN", sql)
+        self.assertNotIn("COUNT", sql)
+        self.assertNotIn("seat_bitmap", sql)
+
+    def test_session_list_keeps_annotated_availability(self):
+        data, sql = self.get(MOVIE_SESSION_URL, fields="tickets_available")
+
+        self.assertEqual(data, [{"tickets_available": 138}])
+        self.assertNotIn("seat_bitmap", sql)
+
+    def test_session_list_expands_movie(self):
+        data, _ = self.get(
+            MOVIE_SESSION_URL, fields="show_time,movie.title,movie.genres"
+        )
+        self.assertEqual(
+            data[0]["movie"], {"title": "Titanic", "genres": ["Drama"]}
+        )
+
+        data, _ = self.get(MOVIE_SESSION_URL, expand="cinema_hall")
+        self.assertEqual(data[0]["cinema_hall"]["capacity"], 140)
+        self.assertEqual(data[0]["tickets_available"], 138)
+
+    def test_expanded_fields_count_as_requested(self):
+        data, _ = self.get(
+            MOVIE_SESSION_URL, fields="show_time", expand="movie"
+        )
+
+        self.assertEqual(set(data[0]), {"show_time", "movie"})
+        self.assertEqual(data[0]["movie"]["title"], "Titanic")
+
+    def test_session_detail_fields_cut_nested_serializers(self):
+        url = f"{MOVIE_SESSION_URL}{self.movie_session.id}/"
+
+        data, sql = self.get(url, fields="show_time,taken_places")
+
+        self.assertEqual(
+            data,
+            {
+                "show_time": "2022-10-03T18:00:00",
+                "taken_places": [{"row": 2, "seat": 3}, {"row": 4, "seat": 5}],
+            },
+        )
+        self.assertNotIn('"cinema_movie"', sql)
+        self.assertNotIn("description", sql)
+
+        data, sql = self.get(url, fields="movie.title")
+
+        self.assertEqual(data, {"movie": {"title": "Titanic"}})
+        self.assertIn('"cinema_movie"."title"', sql)
+        self.assertNotIn("description", sql)
+        self.assertNotIn("cinema_seathold", sql)
+
+    def test_movie_list_expands_actors_with_one_prefetch(self):
+        Movie.objects.create(
+            title="Up", description="Up description", duration=96
+        )
+
+        data, sql = self.get("/api/cinema/movies/", fields="title")
+        self.assertEqual(data, [{"title": "Titanic"}, {"title": "Up"}])
+        self.assertNotIn("JOIN", sql)
+
+        with self.assertNumQueries(2):
+            data, _ = self.get(
+                "/api/cinema/movies/", fields="title,actors", expand="actors"
+            )
+        self.assertEqual(
+            data[0]["actors"],
+            [
+                {
+                    "id": self.movie.actors.get().id,
+                    "first_name": "Kate",
+                    "last_name": "Winslet",
+                    "full_name": "Kate Winslet",
+                }
+            ],
+        )
+        self.assertEqual(data[1]["actors"], [])
+
+    def test_order_list_fields_reach_nested_tickets(self):
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get(
+            "/api/cinema/orders/",
+            {"fields": "id,tickets.row,tickets.seat", "pagination": "cursor"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0]["tickets"], [{"row": 2, "seat": 3}]
+        )
+
+    def test_unknown_fields_are_rejected(self):
+        for params, param in (
+            ({"fields": "id,price"}, "fields"),
+            ({"fields": "movie.price"}, "fields"),
+            ({"expand": "show_time"}, "expand"),
+        ):
+            response = self.client.get(
+                f"{MOVIE_SESSION_URL}{self.movie_session.id}/", params
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(param, response.data)
+
+    def test_writes_ignore_fieldset(self):
+        response = self.client.post(
+            "/api/cinema/genres/?fields=id", {"name": "Comedy"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["name"], "Comedy")
@@ -0,0 +1,131 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from cinema.sqlite import configure_connection
+
+SETTINGS_SCRIPT = (
+    "import json\n"
+    "from django.conf import settings\n"
+    "print(json.dumps({\n"
+    "    'pragmas': settings.SQLITE_PRAGMAS,\n"
+    "    'conn_max_age': settings.DATABASES['default'].get('CONN_MAX_AGE'),\n"
+    "}))\n"
+)
+
+
+def _profile_settings(profile: str) -> dict:
+    """Database settings picked by ``cinema_service.settings``."""
+    env = {
+        **os.environ,
+        "CINEMA_DB_PROFILE": profile,
+        "DJANGO_SETTINGS_MODULE": "cinema_service.settings",
+    }
+    env.pop("CINEMA_REPLICA_DB", None)
+    output = subprocess.run(
+        [sys.executable, "-c", SETTINGS_SCRIPT],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _connect(path: str, pragmas: dict, **options) -> DatabaseWrapper:
+    """A Django connection to ``path``, set up like one for ``default``."""
+    with override_settings(SQLITE_PRAGMAS=pragmas):
+        database = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": path, "OPTIONS": options}
+        )
+        database.connect()
+    return database
+
+
+def _pragma(database: DatabaseWrapper, name: str):
+    with database.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+class DatabaseProfileTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "profile.sqlite3")
+
+    def connect(self, pragmas: dict) -> DatabaseWrapper:
+        database = _connect(self.path, pragmas)
+        self.addCleanup(database.close)
+        return database
+
+    def test_development_profile_keeps_sqlite_defaults(self):
+        profile = _profile_settings("development")
+        database = self.connect(profile["pragmas"])
+
+        self.assertEqual(profile["pragmas"], {})
+        self.assertIsNone(profile["conn_max_age"])
+        self.assertEqual(_pragma(database, "journal_mode"), "delete")
+        self.assertEqual(_pragma(database, "synchronous"), 2)
+        # The sqlite3 module's default timeout of 5 seconds.
+        self.assertEqual(_pragma(database, "busy_timeout"), 5000)
+
+    def test_production_profile_enables_wal(self):
+        profile = _profile_settings("production")
+        database = self.connect(profile["pragmas"])
+
+        self.assertEqual(profile["conn_max_age"], 600)
+        self.assertEqual(_pragma(database, "journal_mode"), "wal")
+        self.assertEqual(_pragma(database, "busy_timeout"), 20000)
+        # NORMAL
+        self.assertEqual(_pragma(database, "synchronous"), 1)
+
+    def write_during_read(self, profile: str):
+        """Commit a write while another connection is reading.
+
+        Returns the error the write failed with, if any.
+        """
+        pragmas = _profile_settings(profile)["pragmas"]
+        path = os.path.join(os.path.dirname(self.path), f"{profile}.sqlite3")
+        reader = _connect(path, pragmas)
+        self.addCleanup(reader.close)
+        with reader.cursor() as cursor:
+            cursor.execute("CREATE TABLE ticket (id INTEGER PRIMARY KEY)")
+            cursor.execute("BEGIN")
+            cursor.execute("SELECT COUNT(*) FROM ticket")
+            cursor.fetchone()
+
+        writer = _connect(path, pragmas, timeout=0.1)
+        self.addCleanup(writer.close)
+        try:
+            with writer.cursor() as cursor:
+                cursor.execute("INSERT INTO ticket DEFAULT VALUES")
+        except OperationalError as error:
+            return error
+        return None
+
+    def test_only_production_commits_writes_during_reads(self):
+        # Without WAL the commit waits for the reader to finish and
+        # times out; with WAL readers and the writer do not block.
+        error = self.write_during_read("development")
+
+        self.assertIn("database is locked", str(error))
+        self.assertIsNone(self.write_during_read("production"))
+
+
+class ConfigureConnectionTests(TestCase):
+    @override_settings(SQLITE_PRAGMAS={"cache_size": -1234})
+    def test_pragmas_are_applied_to_connection(self):
+        configure_connection(connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA cache_size")
+            self.assertEqual(cursor.fetchone()[0], -1234)
@@ -1,12 +1,20 @@
 from django.urls import path, include
 from rest_framework import routers
 
+from cinema.async_views import (
+    ActorAsyncView,
+    GenreAsyncView,
+    MovieAsyncView,
+    MovieSessionAsyncView,
+)
 from cinema.views import (
     GenreViewSet,
     ActorViewSet,
     CinemaHallViewSet,
     MovieViewSet,
     MovieSessionViewSet,
+    OccupancyReportViewSet,
+    OrderViewSet,
 )
 
 router = routers.DefaultRouter()
@@ -15,7 +23,34 @@ router.register("actors", ActorViewSet)
 router.register("cinema_halls", CinemaHallViewSet)
 router.register("movies", MovieViewSet)
 router.register("movie_sessions", MovieSessionViewSet)
+router.register("orders", OrderViewSet)
+router.register(
+    "reports/occupancy",
+    OccupancyReportViewSet,
+    basename="occupancy-report",
+)
+
+async_views = (
+    ("genres", "genre", GenreAsyncView),
+    ("actors", "actor", ActorAsyncView),
+    ("movies", "movie", MovieAsyncView),
+    ("movie_sessions", "moviesession", MovieSessionAsyncView),
+)
 
 urlpatterns = [path("", include(router.urls))]
 
+for prefix, basename, view in async_views:
+    urlpatterns += [
+        path(
+            f"async/{prefix}/",
+            view.as_view(),
+            name=f"async-{basename}-list",
+        ),
+        path(
+            f"async/{prefix}/<int:pk>/",
+            view.as_view(),
+            name=f"async-{basename}-detail",
+        ),
+    ]
+
 app_name = "cinema"
@@ -1,6 +1,28 @@
-from rest_framework import viewsets
+from datetime import datetime, time, timedelta
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Prefetch, Subquery
+from django.http import StreamingHttpResponse
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+
+from cinema.caching import CachedResponseMixin
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    OccupancySummary,
+    Order,
+    SeatHold,
+    Ticket,
+)
 
 from cinema.serializers import (
     GenreSerializer,
@@ -11,28 +33,112 @@ from cinema.serializers import (
     MovieSessionListSerializer,
     MovieDetailSerializer,
     MovieSessionDetailSerializer,
+    MovieSessionImportSerializer,
     MovieListSerializer,
+    OccupancySummarySerializer,
+    OrderSerializer,
+    OrderListSerializer,
+    SeatHoldSerializer,
+    SeatHoldCreateSerializer,
+)
+from cinema.exports import EXPORT_FORMATS, export_rows
+from cinema.fast_lists import (
+    FastListMixin,
+    movie_list_data,
+    movie_session_list_data,
 )
+from cinema.fieldsets import SparseFieldsetViewMixin, parse_fieldset
+from cinema.pagination import OccupancyReportPagination, OrderPagination
+from cinema.reservations import hold_seats, release_holds
+from cinema.scheduling import playing_at, playing_between
+from cinema.seat_maps import SEAT_FORMATS
+from cinema.search import filter_movies_by_title, search_movies
 
+FALSE_VALUES = ("0", "false", "no")
 
-class GenreViewSet(viewsets.ModelViewSet):
+
+class GenreViewSet(
+    SparseFieldsetViewMixin, CachedResponseMixin, viewsets.ModelViewSet
+):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    cache_models = (Genre,)
 
 
-class ActorViewSet(viewsets.ModelViewSet):
+class ActorViewSet(
+    SparseFieldsetViewMixin, CachedResponseMixin, viewsets.ModelViewSet
+):
     queryset = Actor.objects.all()
     serializer_class = ActorSerializer
+    cache_models = (Actor,)
 
 
-class CinemaHallViewSet(viewsets.ModelViewSet):
+class CinemaHallViewSet(
+    SparseFieldsetViewMixin, CachedResponseMixin, viewsets.ModelViewSet
+):
     queryset = CinemaHall.objects.all()
     serializer_class = CinemaHallSerializer
+    cache_models = (CinemaHall,)
+
+
+def _params_to_ints(query_params, name: str):
+    value = query_params.get(name)
+    if not value:
+        return None
+    try:
+        return [int(str_id) for str_id in value.split(",")]
+    except ValueError:
+        raise ValidationError(
+            {name: ["Expected a comma-separated list of integer ids."]}
+        )
+
+
+def movie_list_queryset(query_params):
+    queryset = Movie.objects.select_related("document")
+
+    genres = _params_to_ints(query_params, "genres")
+    actors = _params_to_ints(query_params, "actors")
+    title = query_params.get("title")
+    search = query_params.get("search")
+
+    if genres:
+        queryset = queryset.filter(genres__id__in=genres).distinct()
+
+    if actors:
+        queryset = queryset.filter(actors__id__in=actors).distinct()
 
+    if title:
+        queryset = filter_movies_by_title(queryset, title)
 
-class MovieViewSet(viewsets.ModelViewSet):
+    if search:
+        queryset = search_movies(queryset, search)
+
+    return queryset
+
+
+def movie_detail_queryset():
+    return Movie.objects.prefetch_related("genres", "actors")
+
+
+class MovieViewSet(
+    SparseFieldsetViewMixin,
+    CachedResponseMixin,
+    FastListMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Movie.objects.all()
     serializer_class = MovieSerializer
+    cache_models = (Movie, Genre, Actor)
+    fast_list_data = staticmethod(movie_list_data)
+
+    def get_queryset(self):
+        if self.action == "list":
+            return movie_list_queryset(self.request.query_params)
+
+        if self.action == "retrieve":
+            return movie_detail_queryset()
+
+        return self.queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -43,10 +149,125 @@ class MovieViewSet(viewsets.ModelViewSet):
 
         return MovieSerializer
 
+    def perform_create(self, serializer):
+        # The movie and its genres and actors are saved in one
+        # transaction, so its document is built once, on commit.
+        with transaction.atomic():
+            serializer.save()
 
-class MovieSessionViewSet(viewsets.ModelViewSet):
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+
+def active_holds_prefetch(lookup: str = "holds") -> Prefetch:
+    return Prefetch(
+        lookup,
+        queryset=SeatHold.objects.filter(expires_at__gt=timezone.now()),
+        to_attr="active_holds",
+    )
+
+
+def _query_param(query_params, name: str, field: serializers.Field):
+    value = query_params.get(name)
+    if not value:
+        return None
+    try:
+        return field.to_internal_value(value)
+    except ValidationError as error:
+        raise ValidationError({name: error.detail})
+
+
+def movie_session_list_queryset(query_params):
+    active_holds = (
+        SeatHold.objects.filter(
+            movie_session=OuterRef("pk"),
+            expires_at__gt=timezone.now(),
+        )
+        .order_by()
+        .values("movie_session")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    queryset = (
+        MovieSession.objects.select_related("movie", "cinema_hall").defer(
+            "seat_bitmap"
+        )
+        # Meta.ordering is not applied to aggregated querysets.
+        .order_by(*MovieSession._meta.ordering)
+    )
+
+    fields = parse_fieldset(query_params.get("fields"))
+    if not fields or {"cinema_hall_capacity", "tickets_available"} & set(
+        fields
+    ):
+        queryset = queryset.annotate(
+            capacity=F("cinema_hall__rows") * F("cinema_hall__seats_in_row"),
+            tickets_available=F("capacity")
+            - Count("tickets")
+            - Coalesce(Subquery(active_holds), 0),
+        )
+
+    date = _query_param(query_params, "date", serializers.DateField())
+    movie = _query_param(query_params, "movie", serializers.IntegerField())
+    now_showing = query_params.get("now_showing")
+    start = _query_param(query_params, "from", serializers.DateTimeField())
+    end = _query_param(query_params, "to", serializers.DateTimeField())
+
+    if date:
+        # A half-open show_time range keeps the column bare for indexes.
+        day_start = datetime.combine(date, time.min)
+        queryset = queryset.filter(
+            show_time__gte=day_start,
+            show_time__lt=day_start + timedelta(days=1),
+        )
+
+    if movie is not None:
+        queryset = queryset.filter(movie_id=movie)
+
+    if now_showing is not None and now_showing.lower() not in FALSE_VALUES:
+        queryset = playing_at(queryset, timezone.now())
+
+    if start or end:
+        queryset = playing_between(queryset, start, end)
+
+    return queryset
+
+
+def movie_session_detail_queryset():
+    return MovieSession.objects.select_related(
+        "movie__document", "cinema_hall"
+    ).prefetch_related(active_holds_prefetch())
+
+
+def seat_format_param(query_params):
+    return _query_param(
+        query_params,
+        "seat_format",
+        serializers.ChoiceField(choices=list(SEAT_FORMATS)),
+    )
+
+
+class MovieSessionViewSet(
+    SparseFieldsetViewMixin, FastListMixin, viewsets.ModelViewSet
+):
     queryset = MovieSession.objects.all()
     serializer_class = MovieSessionSerializer
+    fast_list_data = staticmethod(movie_session_list_data)
+
+    def get_queryset(self):
+        queryset = self.queryset
+
+        if self.action == "list":
+            queryset = movie_session_list_queryset(self.request.query_params)
+
+        if self.action == "retrieve":
+            queryset = movie_session_detail_queryset()
+
+        if self.action == "holds":
+            queryset = queryset.select_related("cinema_hall")
+
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -55,4 +276,175 @@ class MovieSessionViewSet(viewsets.ModelViewSet):
         if self.action == "retrieve":
             return MovieSessionDetailSerializer
 
+        if self.action == "holds":
+            return SeatHoldCreateSerializer
+
+        if self.action == "bulk":
+            return MovieSessionImportSerializer
+
         return MovieSessionSerializer
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "retrieve":
+            context["seat_format"] = seat_format_param(
+                self.request.query_params
+            )
+        return context
+
+    @action(methods=["POST"], detail=False)
+    def bulk(self, request):
+        """Import many movie sessions at once, rejecting hall overlaps"""
+        serializer = self.get_serializer(data=request.data)
+        with transaction.atomic():
+            serializer.is_valid(raise_exception=True)
+            movie_sessions = serializer.save()
+
+        return Response(
+            MovieSessionSerializer(movie_sessions, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(
+        methods=["GET", "POST", "DELETE"],
+        detail=True,
+        permission_classes=[IsAuthenticated],
+    )
+    def holds(self, request, pk=None):
+        """Hold seats of a movie session for the user before checkout"""
+        movie_session = self.get_object()
+
+        if request.method == "POST":
+            serializer = SeatHoldCreateSerializer(
+                data=request.data, context={"movie_session": movie_session}
+            )
+            serializer.is_valid(raise_exception=True)
+            holds = hold_seats(
+                request.user,
+                movie_session,
+                serializer.validated_data["seats"],
+            )
+            return Response(
+                SeatHoldSerializer(holds, many=True).data,
+                status=status.HTTP_201_CREATED,
+            )
+
+        if request.method == "DELETE":
+            release_holds(request.user, movie_session)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        holds = SeatHold.objects.filter(
+            movie_session=movie_session,
+            user=request.user,
+            expires_at__gt=timezone.now(),
+        ).order_by("row", "seat")
+        return Response(SeatHoldSerializer(holds, many=True).data)
+
+
+class OrderViewSet(
+    SparseFieldsetViewMixin,
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Order.objects.prefetch_related(
+        "tickets__movie_session__movie",
+        "tickets__movie_session__cinema_hall",
+    )
+    serializer_class = OrderSerializer
+    pagination_class = OrderPagination
+    permission_classes = (IsAuthenticated,)
+    # Cursor pages are keyed on created_at.
+    fieldset_base_lookups = ("created_at",)
+
+    def get_queryset(self):
+        queryset = self.queryset.filter(user=self.request.user)
+
+        if self.action == "list":
+            queryset = queryset.prefetch_related(
+                active_holds_prefetch("tickets__movie_session__holds")
+            )
+
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return OrderListSerializer
+
+        return OrderSerializer
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+    def stream_export(self, tickets):
+        file_format = _query_param(
+            self.request.query_params,
+            "file_format",
+            serializers.ChoiceField(choices=list(EXPORT_FORMATS)),
+        )
+        file_format = file_format or "csv"
+        lines, content_type = EXPORT_FORMATS[file_format]
+        response = StreamingHttpResponse(
+            lines(export_rows(tickets)), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="orders.{file_format}"'
+        )
+        return response
+
+    @action(methods=["GET"], detail=False)
+    def export(self, request):
+        """Stream the user's tickets as CSV or NDJSON (?file_format=)"""
+        return self.stream_export(
+            Ticket.objects.filter(order__user=request.user)
+        )
+
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="export/all",
+        permission_classes=[IsAdminUser],
+    )
+    def export_all(self, request):
+        """Stream every ticket of every order for reconciliation"""
+        return self.stream_export(Ticket.objects.all())
+
+
+class OccupancyReportViewSet(
+    SparseFieldsetViewMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    """Tickets sold against seats offered per day, movie and cinema hall"""
+
+    queryset = OccupancySummary.objects.select_related("movie", "cinema_hall")
+    serializer_class = OccupancySummarySerializer
+    pagination_class = OccupancyReportPagination
+    permission_classes = (IsAdminUser,)
+
+    def get_queryset(self):
+        queryset = self.queryset
+        query_params = self.request.query_params
+
+        date_from = _query_param(
+            query_params, "date_from", serializers.DateField()
+        )
+        date_to = _query_param(
+            query_params, "date_to", serializers.DateField()
+        )
+        movie = _query_param(query_params, "movie", serializers.IntegerField())
+        cinema_hall = _query_param(
+            query_params, "cinema_hall", serializers.IntegerField()
+        )
+
+        if date_from:
+            queryset = queryset.filter(date__gte=date_from)
+
+        if date_to:
+            queryset = queryset.filter(date__lte=date_to)
+
+        if movie is not None:
+            queryset = queryset.filter(movie_id=movie)
+
+        if cinema_hall is not None:
+            queryset = queryset.filter(cinema_hall_id=cinema_hall)
+
+        return queryset
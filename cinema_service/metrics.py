@@ -0,0 +1,240 @@
+import asyncio
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteStats:
+    __slots__ = ("statuses", "buckets", "latency_sum", "queries", "db_time")
+
+    def __init__(self):
+        self.statuses = {}
+        # One slot per bucket plus +Inf, cumulated only when rendered.
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+
+    def merge(self, other: "RouteStats") -> None:
+        for status, count in list(other.statuses.items()):
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.latency_sum += other.latency_sum
+        self.queries += other.queries
+        self.db_time += other.db_time
+
+
+class _Counters:
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+class _Shard:
+    """Counters written by a single thread only, so no locking is needed."""
+
+    def __init__(self):
+        self.routes = {}
+        # Reused by every synchronous request served by this thread.
+        self.counters = _Counters()
+
+    def record(self, request, response, latency, counters) -> None:
+        key = (route_label(request), request.method)
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = RouteStats()
+        status = response.status_code
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        stats.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        stats.latency_sum += latency
+        stats.queries += counters.queries
+        stats.db_time += counters.db_time
+
+
+_current = ContextVar("metrics_counters", default=None)
+_local = threading.local()
+_shards = []
+_shards_lock = threading.Lock()
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    counters = _current.get()
+    if counters is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        counters.queries += 1
+        counters.db_time += perf_counter() - started
+
+
+def _install_wrapper(connection, **kwargs) -> None:
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+connection_created.connect(_install_wrapper)
+
+
+def _get_shard() -> _Shard:
+    try:
+        return _local.shard
+    except AttributeError:
+        shard = _local.shard = _Shard()
+        with _shards_lock:
+            _shards.append(shard)
+        return shard
+
+
+def collect() -> dict:
+    """Merge the per-thread shards into ``{(route, method): RouteStats}``."""
+    with _shards_lock:
+        shards = list(_shards)
+    merged = {}
+    for shard in shards:
+        for key, stats in list(shard.routes.items()):
+            merged.setdefault(key, RouteStats()).merge(stats)
+    return merged
+
+
+def route_label(request) -> str:
+    """``<basename>-<action>`` for viewsets, the URL name otherwise."""
+    match = request.resolver_match
+    if match is None:
+        return UNMATCHED_ROUTE
+    actions = getattr(match.func, "actions", None)
+    if actions:
+        basename = match.func.initkwargs.get("basename")
+        action = actions.get(request.method.lower())
+        if basename and action:
+            return f"{basename}-{action}"
+    return match.view_name or match.route
+
+
+class MetricsMiddleware(MiddlewareMixin):
+    """Record request count, latency, query count and DB time per route.
+
+    Counters live in per-thread shards that are only merged when
+    ``/metrics`` is scraped, and queries are counted by an execute
+    wrapper installed once per connection instead of a query log. Each
+    worker process reports its own counters.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        for connection in connections.all(initialized_only=True):
+            _install_wrapper(connection)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        shard = _get_shard()
+        counters = shard.counters
+        counters.queries = 0
+        counters.db_time = 0.0
+        token = _current.set(counters)
+        started = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        shard.record(request, response, perf_counter() - started, counters)
+        return response
+
+    async def __acall__(self, request):
+        # Requests interleave on the event loop, so each gets its own
+        # counters; ORM calls see them through the copied context.
+        counters = _Counters()
+        token = _current.set(counters)
+        started = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        _get_shard().record(
+            request, response, perf_counter() - started, counters
+        )
+        return response
+
+
+def _labels(**labels) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name, str(value).replace("\\", "\\\\").replace('"', '\\"')
+        )
+        for name, value in labels.items()
+    )
+
+
+def render_metrics() -> str:
+    lines = [
+        "# HELP cinema_http_requests_total Requests by route and status.",
+        "# TYPE cinema_http_requests_total counter",
+    ]
+    merged = sorted(collect().items())
+    for (route, method), stats in merged:
+        for status, count in sorted(stats.statuses.items()):
+            labels = _labels(route=route, method=method, status=status)
+            lines.append(f"cinema_http_requests_total{{{labels}}} {count}")
+
+    lines += [
+        "# HELP cinema_http_request_duration_seconds Request latency.",
+        "# TYPE cinema_http_request_duration_seconds histogram",
+    ]
+    for (route, method), stats in merged:
+        labels = _labels(route=route, method=method)
+        cumulative = 0
+        bounds = [*map(str, LATENCY_BUCKETS), "+Inf"]
+        for bound, count in zip(bounds, stats.buckets):
+            cumulative += count
+            lines.append(
+                "cinema_http_request_duration_seconds_bucket"
+                f'{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines += [
+            "cinema_http_request_duration_seconds_sum"
+            f"{{{labels}}} {stats.latency_sum:.6f}",
+            "cinema_http_request_duration_seconds_count"
+            f"{{{labels}}} {cumulative}",
+        ]
+
+    lines += [
+        "# HELP cinema_db_queries_total Database queries by route.",
+        "# TYPE cinema_db_queries_total counter",
+    ]
+    for (route, method), stats in merged:
+        labels = _labels(route=route, method=method)
+        lines.append(f"cinema_db_queries_total{{{labels}}} {stats.queries}")
+
+    lines += [
+        "# HELP cinema_db_query_duration_seconds_total Database time.",
+        "# TYPE cinema_db_query_duration_seconds_total counter",
+    ]
+    for (route, method), stats in merged:
+        labels = _labels(route=route, method=method)
+        lines.append(
+            "cinema_db_query_duration_seconds_total"
+            f"{{{labels}}} {stats.db_time:.6f}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE)
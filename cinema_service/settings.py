@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -49,6 +50,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "cinema_service.metrics.MetricsMiddleware",
+    "cinema.replicas.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -90,6 +93,73 @@ DATABASES = {
     }
 }
 
+# "production" turns on WAL and persistent connections, so concurrent
+# readers no longer block order writes and requests skip reconnecting.
+DATABASE_PROFILE = os.environ.get("CINEMA_DB_PROFILE", "development")
+
+SQLITE_PRODUCTION_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    # Writers queue behind each other longer than sqlite3's 5 s default.
+    "busy_timeout": 20000,
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+}
+
+SQLITE_PRAGMAS = {}
+
+if DATABASE_PROFILE == "production":
+    SQLITE_PRAGMAS = SQLITE_PRODUCTION_PRAGMAS
+    DATABASES["default"]["CONN_MAX_AGE"] = int(
+        os.environ.get("CINEMA_DB_CONN_MAX_AGE", "600")
+    )
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# A read replica of default, refreshed with ``manage.py sync_replica``.
+# Safe-method API reads go there unless the client has written within
+# the last REPLICA_PIN_SECONDS.
+if os.environ.get("CINEMA_REPLICA_DB"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.environ["CINEMA_REPLICA_DB"],
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["cinema.replicas.ReplicaRouter"]
+
+REPLICA_PIN_SECONDS = int(os.environ.get("CINEMA_REPLICA_PIN_SECONDS", "10"))
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "cinema-service",
+    }
+}
+
+if os.environ.get("CINEMA_CACHE_DIR"):
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ["CINEMA_CACHE_DIR"],
+    }
+
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "cinema.renderers.ORJSONRenderer",
+        "cinema.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "cinema.renderers.ORJSONParser",
+        "cinema.renderers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
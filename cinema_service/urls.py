@@ -1,8 +1,11 @@
 from django.contrib import admin
 from django.urls import path, include
 
+from cinema_service.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/cinema/", include("cinema.urls", namespace="cinema")),
+    path("metrics", metrics_view, name="metrics"),
     path("__debug__/", include("debug_toolbar.urls")),
 ]